@@ -0,0 +1,88 @@
+# asset_loader.py
+# Description: Loads game assets (images, music, sounds) on a background thread so the first
+# frame can be drawn straight away. The game shows placeholders and swaps each asset in
+# once it is ready.
+
+# === IMPORTS ===
+import threading
+import time
+
+
+class AssetLoader:
+    """
+    Runs asset loading functions one after another on a daemon thread.
+    The loading functions must not touch the display (no convert() or convert_alpha()); the
+    game finishes each asset on its own thread when it takes it with take_loaded().
+    """
+
+    def __init__(self):
+        """Create a loader with no jobs. Add jobs with add(), then call start()."""
+        self._jobs = []       # (name, function) in the order they are loaded
+        self._loaded = []     # (name, asset) loaded since the last take_loaded()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._done = threading.Event()
+        self.errors = {}      # Name -> exception for assets that failed to load
+        self.timings = {}     # Name -> seconds it took to load
+
+    def add(self, name, function):
+        """
+        Queues an asset to load.
+
+        Parameters:
+            name (str): Name the asset is handed back under.
+            function (function): Loads the asset and returns it.
+        """
+        self._jobs.append((name, function))
+
+    def start(self):
+        """Starts loading the queued assets in the background (only the first call does anything)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="assets", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Loads every queued asset, remembering failures instead of stopping."""
+        for name, function in self._jobs:
+            start = time.perf_counter()
+            try:
+                asset = function()
+            except Exception as error: # A broken asset keeps its placeholder instead of crashing the game
+                self.errors[name] = error
+            else:
+                with self._lock:
+                    self._loaded.append((name, asset))
+            self.timings[name] = time.perf_counter() - start
+        self._done.set()
+
+    def take_loaded(self):
+        """
+        Returns:
+            list: (name, asset) pairs loaded since the last call, in loading order.
+        """
+        with self._lock:
+            loaded, self._loaded = self._loaded, []
+        return loaded
+
+    def wait(self, timeout=None):
+        """
+        Waits for every queued asset to finish loading, starting the loader if needed.
+
+        Parameters:
+            timeout (float): Most seconds to wait, or None to wait as long as it takes.
+
+        Returns:
+            bool: True if loading finished.
+        """
+        self.start()
+        return self._done.wait(timeout)
+
+    @property
+    def started(self):
+        """bool: True once start() has been called."""
+        return self._thread is not None
+
+    @property
+    def finished(self):
+        """bool: True once every queued asset has been tried."""
+        return self._done.is_set()
@@ -0,0 +1,339 @@
+# benchmark.py
+# Description: Measures how fast Blob Life runs. The default mode steps every engine
+# headlessly over a range of board sizes, random soups and templates; --render times the
+# pygame drawing code on an offscreen surface. Results are saved as JSON so runs can be
+# compared and slowdowns caught.
+# Usage: python benchmark.py --output results.json [--compare baseline.json]
+
+# === IMPORTS ===
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import blob_life_core as core
+
+# === DEFAULT SETTINGS ===
+DEFAULT_SIZES = [10, 64, 256, 1024, 4096]
+DEFAULT_DENSITIES = [0.1, 0.35, 0.5]
+DEFAULT_RENDER_SIZES = [10, 50, 100, 200]
+DEFAULT_MENU_BLOBS = [30, 1000, 5000] # Blob counts timed on the main menu with --render
+PYTHON_ENGINE_MAX_SIZE = 256 # The cell-by-cell engine takes minutes per generation past this
+MEMORY_GENERATIONS = 2       # Generations stepped again under tracemalloc to find peak memory
+
+
+def percentile(values, fraction):
+    """
+    Returns a percentile of some measurements (nearest-rank method).
+
+    Parameters:
+        values (list): The measurements.
+        fraction (float): Which percentile to return, from 0 to 1 (e.g. 0.99 for p99).
+
+    Returns:
+        float: The measurement at that percentile.
+    """
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def summarize(times):
+    """
+    Turns a list of timings in seconds into milliseconds statistics.
+
+    Parameters:
+        times (list): How long each generation or frame took, in seconds.
+
+    Returns:
+        dict: Count, mean and p50/p90/p99/max latency in milliseconds.
+    """
+    return {
+        "count": len(times),
+        "mean_ms": sum(times) / len(times) * 1000,
+        "p50_ms": percentile(times, 0.50) * 1000,
+        "p90_ms": percentile(times, 0.90) * 1000,
+        "p99_ms": percentile(times, 0.99) * 1000,
+        "max_ms": max(times) * 1000,
+    }
+
+
+# === ENGINE BENCHMARKS ===
+
+def set_up_board(size, board, seed):
+    """
+    Resizes the core grid and fills it with a random soup or a template.
+
+    Parameters:
+        size (int): Width and height of the square board.
+        board (str): "soup:<density>" or the name of a template.
+        seed (int): Random seed, so every engine gets the same board.
+    """
+    random.seed(seed)
+    core.set_grid_size(size, size)
+    if board.startswith("soup:"):
+        core.randomize_grid(float(board[len("soup:"):]), seed)
+    else:
+        core.apply_template(board)
+
+
+def run_engine_case(engine, size, board, generations, max_seconds, seed):
+    """
+    Times next_generation() with one engine on one board.
+
+    Parameters:
+        engine (str): Name of the core engine to use.
+        size (int): Width and height of the square board.
+        board (str): "soup:<density>" or the name of a template.
+        generations (int): Most generations to time.
+        max_seconds (float): Stop timing after this long (at least one generation always runs).
+        seed (int): Random seed for the board.
+
+    Returns:
+        dict: The case settings, timing statistics and peak memory.
+    """
+    core.set_engine(engine)
+    set_up_board(size, board, seed)
+    core.next_generation() # Warm-up: lets engines allocate buffers and start workers
+
+    times = []
+    start = time.perf_counter()
+    while len(times) < generations and (not times or time.perf_counter() - start < max_seconds):
+        step_start = time.perf_counter()
+        core.next_generation()
+        times.append(time.perf_counter() - step_start)
+    total = sum(times)
+
+    # Peak memory is measured separately because tracemalloc slows everything down
+    set_up_board(size, board, seed)
+    tracemalloc.start()
+    for _ in range(MEMORY_GENERATIONS):
+        core.next_generation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "mode": "engine",
+        "engine": engine,
+        "size": size,
+        "board": board,
+        "generations_per_sec": len(times) / total if total > 0 else float("inf"),
+        "latency": summarize(times),
+        "peak_memory_bytes": peak,
+    }
+
+
+def engine_cases(args):
+    """
+    Lists every (engine, size, board) combination to run.
+
+    Parameters:
+        args (argparse.Namespace): The command line options.
+
+    Returns:
+        list: (engine, size, board) tuples.
+    """
+    boards = [f"soup:{density}" for density in args.densities] + sorted(core.templates)
+    cases = []
+    for engine in args.engines:
+        for size in args.sizes:
+            if engine == "python" and size > PYTHON_ENGINE_MAX_SIZE:
+                continue
+            for board in boards:
+                cases.append((engine, size, board))
+    return cases
+
+
+# === RENDER BENCHMARKS ===
+
+def run_render_cases(args):
+    """
+    Times the game's drawing code on an offscreen surface.
+    Covers draw_cells() on its own and the full simulation-screen redraw, zoomed to fit each board,
+    and one frame of the main menu with different numbers of moving blobs.
+
+    Parameters:
+        args (argparse.Namespace): The command line options.
+
+    Returns:
+        list: One result dict per (size, draw path), where size is the blob count for the menu.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    import blob_life_game as game # Safe to import: the main loop only runs as a script
+
+    game.load_assets(wait=True) # Time the real blob images, not the startup placeholders
+    game.screen = pygame.Surface((game.screen_width, game.screen_height)).convert()
+    game.static_layers.clear()
+    game.screen_state = "simulation"
+    results = []
+    for size in args.render_sizes:
+        core.set_grid_size(size, size)
+        core.randomize_grid(0.5, args.seed)
+        game.fit_camera() # Show the whole board, as the game does after loading a big pattern
+        for name, draw in (("draw_cells", game.draw_cells),
+                           ("simulation_screen", lambda: game.draw_simulation_screen(full=True))):
+            draw() # Warm-up: fills the text cache and static layers
+            times = []
+            start = time.perf_counter()
+            while len(times) < args.frames and (not times or time.perf_counter() - start < args.max_seconds):
+                frame_start = time.perf_counter()
+                draw()
+                times.append(time.perf_counter() - frame_start)
+            result = {"mode": "render", "draw": name, "size": size, "frame_time": summarize(times)}
+            results.append(result)
+            print(f"render {name:<18} {size:>5}x{size:<5} "
+                  f"p50 {result['frame_time']['p50_ms']:9.2f} ms  p99 {result['frame_time']['p99_ms']:9.2f} ms")
+
+    game.screen_state = "start_menu"
+    for count in args.menu_blobs:
+        game.menu_blobs = game.SpriteField(count, game.screen_width, game.screen_height, len(game.blob_images), seed=args.seed)
+        draw = lambda: game.draw_menu_screen("start_menu", game.draw_start_menu_background, game.menu_keep_out, False)
+        draw() # Warm-up
+        times = []
+        start = time.perf_counter()
+        while len(times) < args.frames and (not times or time.perf_counter() - start < args.max_seconds):
+            frame_start = time.perf_counter()
+            draw()
+            times.append(time.perf_counter() - frame_start)
+        result = {"mode": "render", "draw": "menu_blobs", "size": count, "frame_time": summarize(times)}
+        results.append(result)
+        print(f"render {'menu_blobs':<18} {count:>5} blobs "
+              f"p50 {result['frame_time']['p50_ms']:9.2f} ms  p99 {result['frame_time']['p99_ms']:9.2f} ms")
+    return results
+
+
+# === COMPARING RUNS ===
+
+def case_key(result):
+    """
+    Parameters:
+        result (dict): One benchmark result.
+
+    Returns:
+        tuple: What identifies the case, so the same case can be found in another run.
+    """
+    if result["mode"] == "render":
+        return ("render", result["draw"], result["size"])
+    return ("engine", result["engine"], result["size"], result["board"])
+
+
+def case_time(result):
+    """
+    Parameters:
+        result (dict): One benchmark result.
+
+    Returns:
+        float: Its median time per generation or frame, in milliseconds.
+    """
+    return result["frame_time" if result["mode"] == "render" else "latency"]["p50_ms"]
+
+
+def compare(results, baseline_path, threshold):
+    """
+    Prints every case that got slower than in a saved baseline run.
+
+    Parameters:
+        results (list): Results from this run.
+        baseline_path (str): Path to a JSON file written by an earlier run.
+        threshold (float): Slowdown ratio that counts as a regression (e.g. 1.1 for 10% slower).
+
+    Returns:
+        int: Number of regressions found.
+    """
+    with open(baseline_path) as file:
+        baseline = {case_key(result): result for result in json.load(file)["results"]}
+    regressions = 0
+    for result in results:
+        old = baseline.get(case_key(result))
+        if old is None or case_time(old) == 0:
+            continue
+        ratio = case_time(result) / case_time(old)
+        if ratio > threshold:
+            regressions += 1
+            print(f"REGRESSION {case_key(result)}: {case_time(old):.3f} ms -> {case_time(result):.3f} ms ({ratio:.2f}x)")
+    print(f"{regressions} regression(s) against {baseline_path}")
+    return regressions
+
+
+# === COMMAND LINE ===
+
+def parse_args(argv=None):
+    """
+    Reads the command line options.
+
+    Parameters:
+        argv (list): Arguments to parse (default is sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Blob Life engines and drawing.")
+    parser.add_argument("--engines", nargs="+", choices=core.engines, default=core.engines, help="engines to time")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="square board sizes to time")
+    parser.add_argument("--densities", nargs="+", type=float, default=DEFAULT_DENSITIES, help="random soup densities")
+    parser.add_argument("--generations", type=int, default=50, help="most generations timed per case")
+    parser.add_argument("--max-seconds", type=float, default=5.0, help="time limit per case")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for every board")
+    parser.add_argument("--rule", default="B3/S23", help="life-like rule every engine runs (e.g. B36/S23 or HighLife)")
+    parser.add_argument("--render", action="store_true", help="time the pygame drawing code instead of the engines")
+    parser.add_argument("--render-sizes", nargs="+", type=int, default=DEFAULT_RENDER_SIZES, help="board sizes for --render")
+    parser.add_argument("--menu-blobs", nargs="+", type=int, default=DEFAULT_MENU_BLOBS, help="menu blob counts for --render")
+    parser.add_argument("--frames", type=int, default=60, help="most frames timed per render case")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file from an earlier run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.1, help="slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+    try:
+        core.rules.parse_rule(args.rule)
+    except ValueError as error:
+        parser.error(str(error))
+    return args
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks, prints a line per case and saves or compares the results.
+
+    Parameters:
+        argv (list): Arguments to parse (default is sys.argv).
+
+    Returns:
+        int: Exit status, 1 if --compare found regressions.
+    """
+    args = parse_args(argv)
+    core.set_rule(args.rule)
+    if args.render:
+        results = run_render_cases(args)
+    else:
+        results = []
+        for engine, size, board in engine_cases(args):
+            result = run_engine_case(engine, size, board, args.generations, args.max_seconds, args.seed)
+            results.append(result)
+            print(f"{engine:<9} {size:>5}x{size:<5} {board:<10} "
+                  f"{result['generations_per_sec']:10.1f} gen/s  "
+                  f"p50 {result['latency']['p50_ms']:9.2f} ms  p99 {result['latency']['p99_ms']:9.2f} ms  "
+                  f"peak {result['peak_memory_bytes'] / 2**20:8.1f} MiB")
+
+    if args.output:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": core.has_numpy,
+            "rule": core.rule.rulestring,
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+# bitboard_engine.py
+# Description: Pure-Python bitboard backend for Blob Life. Packs the whole board into one
+# big int (one bit per cell) and computes a generation with a handful of shifts and
+# full-adder logic, so it is fast without NumPy or any compiled dependency.
+
+# === IMPORTS ===
+from rules import CONWAY # The default rule, B3/S23
+
+# === CONVERSION TABLES ===
+# Alive planes hold one byte (0 or 1) per cell; these turn them into "0"/"1" text and back,
+# which int(text, 2) and format(board, "b") convert to and from a packed int in C.
+PLANE_TO_TEXT = bytes.maketrans(b"\x00\x01", b"01")
+TEXT_TO_PLANE = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def full_add(a, b, c):
+    """
+    Add three bitboards bit by bit.
+
+    Parameters:
+        a, b, c (int): Bitboards to add.
+
+    Returns:
+        tuple: (sum, carry) bitboards; each cell's total is sum + 2 * carry.
+    """
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+class BitboardEngine:
+    """
+    Steps a Blob Life board packed into a single int.
+    Cell (r, c) is bit number (width * height - 1 - (r * width + c)), so the first cell is
+    the most significant bit. Cells past the edge always count as dead, the same as
+    count_neighbors(). Because the whole state is one int, it can be hashed or copied for free.
+    """
+
+    def __init__(self, width, height, rule=CONWAY):
+        """
+        Create an empty board.
+
+        Parameters:
+            width (int): Number of columns on the board.
+            height (int): Number of rows on the board.
+            rule (rules.Rule): The rule cells follow (default is Conway's B3/S23).
+        """
+        self.width = width
+        self.height = height
+        self.rule = rule
+        self.generation = 0
+        self.board = 0
+        size = width * height
+        self._full = (1 << size) - 1
+        # Masks that stop shifted rows from wrapping into the next or previous row
+        first_col = int(("1" + "0" * (width - 1)) * height, 2)
+        last_col = int(("0" * (width - 1) + "1") * height, 2)
+        self._not_first_col = self._full ^ first_col
+        self._not_last_col = self._full ^ last_col
+
+    def load_plane(self, plane):
+        """
+        Replace the board with a flat alive plane, one byte per cell in row order.
+
+        Parameters:
+            plane (bytearray): height * width bytes of 0 or 1.
+        """
+        self.board = int(bytes(plane).translate(PLANE_TO_TEXT), 2) if plane else 0
+
+    def to_plane(self):
+        """
+        Returns:
+            bytearray: The board as a flat alive plane, one byte per cell in row order.
+        """
+        text = format(self.board, "b").zfill(self.width * self.height)
+        return bytearray(text.encode().translate(TEXT_TO_PLANE))
+
+    def clear(self):
+        """Kill every cell on the board and reset the generation count."""
+        self.board = 0
+        self.generation = 0
+
+    def step(self, generations=1):
+        """
+        Advance the board by the given number of generations using the engine's rule.
+
+        Parameters:
+            generations (int): How many generations to advance (default is 1).
+        """
+        width = self.width
+        full = self._full
+        next_bits = self.rule.next_bits
+        uses_eights = "eights" in self.rule.formula
+        not_first_col = self._not_first_col
+        not_last_col = self._not_last_col
+        board = self.board
+        for _ in range(generations):
+            # Neighbors in the same row: the cell to the east is one bit lower, so shift left
+            east = (board << 1) & not_last_col
+            west = (board >> 1) & not_first_col
+            # Neighbors in the rows above and below, including their diagonals
+            north = board >> width
+            south = (board << width) & full
+            north_east = (north << 1) & not_last_col
+            north_west = (north >> 1) & not_first_col
+            south_east = (south << 1) & not_last_col
+            south_west = (south >> 1) & not_first_col
+
+            # Add the 8 neighbor bitboards into the ones, twos, fours and eights bits of each count
+            sum_a, carry_a = full_add(north_west, north, north_east)
+            sum_b, carry_b = full_add(west, east, south_west)
+            sum_c, carry_c = south ^ south_east, south & south_east
+            ones, carry_d = full_add(sum_a, sum_b, sum_c)
+            twos_partial, fours_a = full_add(carry_a, carry_b, carry_c)
+            twos = twos_partial ^ carry_d
+            fours_b = twos_partial & carry_d
+            fours = fours_a ^ fours_b
+            eights = fours_a & fours_b if uses_eights else 0 # Only 8 friends sets it; most rules never ask
+
+            # The rule's compiled formula, e.g. for B3/S23: twos and not fours, and ones or alive
+            board = next_bits(board, ones, twos, fours, eights, full)
+        self.board = board
+        self.generation += generations
+
+    @property
+    def population(self):
+        """int: Number of alive cells on the board."""
+        return self.board.bit_count()
@@ -0,0 +1,775 @@
+# blob_life_core.py
+# Description: The grid state and rules for Blob Life, with no pygame dependency.
+# The pygame game, scripts, tests and worker processes all share this module.
+
+# === IMPORTS ===
+import random
+import threading
+from collections import namedtuple
+from importlib.util import find_spec
+from cell import Cell # Lightweight view of one cell, used for click toggles
+from sparse_engine import SparseEngine # Live-cell set backend for mostly empty boards
+from hashlife_engine import HashLifeEngine # Memoized quadtree for skipping ahead
+from bitboard_engine import BitboardEngine, TEXT_TO_PLANE # Packed-int backend that needs no NumPy
+from frontier_engine import FrontierEngine # Only recomputes tiles next to last generation's changes
+from cycle_detector import CycleDetector, board_digest # Notices still lifes and repeating loops
+import pattern_loader # Reads RLE, .cells and Life 1.06 pattern files
+import rules # Life-like B/S rules compiled into lookup tables
+# The NumPy and parallel engines pull in numpy and multiprocessing, which take longer to import
+# than everything else here, so they are only imported the first time they step a board.
+has_numpy = find_spec("numpy") is not None # Without NumPy the bitboard engine is used instead
+
+# === GRID SETTINGS ===
+grid_width = 10
+grid_height = 10
+
+# === BLOB IMAGES ===
+# Images given to alive cells. The game replaces these with pygame surfaces;
+# headless runs keep the placeholder because nothing is drawn.
+blob_images = [None]
+
+# === TEMPLATES ===
+# Predefined templates for user convenience
+templates = {
+    "Letter A": [(1,3), (1,4), (1,5), (1,6), (2,3), (2,6), (3,3), (3,4), (3,5), (3,6), (4,3), (4,6), (5,3), (5,6)],
+    "Smiley": [(7,4), (6,3), (7,5), (6,6), (5,2), (5,7), (2,3), (2,6), (3,3), (3,6), (1,3), (1,6)],
+    "Heart": [(6,4), (5,3), (5,5), (4,2), (4,6), (3,2), (3,6), (2,3), (3,4), (2,5)]
+}
+
+# === SIMULATION ENGINES ===
+# "python" counts neighbors cell by cell, "numpy" steps the whole board as an array,
+# "bitboard" packs the board into one int, "sparse" only looks at live cells and their neighbors,
+# "parallel" splits the board into bands stepped by a pool of worker processes, and "frontier"
+# only recomputes the tiles next to cells that changed in the previous generation.
+engines = ["python", "bitboard", "sparse", "parallel", "frontier"] + (["numpy"] if has_numpy else [])
+engine = "numpy" if has_numpy else "bitboard"
+
+# === RULE ===
+# Which neighbor counts bring a blob to life and which keep it alive; every engine follows it
+rule = rules.CONWAY
+
+# === RANDOM SOUPS ===
+DENSITY_BITS = 16 # Soup densities are rounded to a multiple of 1 / 2**16
+
+# === GRID STATE ===
+# The board is two flat byte planes (one byte per cell each), indexed by r * grid_width + c
+alive = bytearray(grid_width * grid_height)    # 1 where a cell has a blob, 0 where it is empty
+variants = bytearray(grid_width * grid_height) # Index into blob_images of each alive cell's blob
+generation = 0                 # Current generation number
+live_count = 0                 # Number of alive cells, kept up to date by every change
+numpy_engine = None            # Created on the first NumPy generation
+sparse_engine = None           # Created on the first sparse generation
+bitboard_engine = None         # Created on the first bitboard generation
+frontier_engine = None         # Created on the first frontier generation, then kept so it remembers what changed
+parallel_engine = None         # Created on the first parallel generation, then its workers are reused
+parallel_workers = None        # Worker processes for the parallel engine (None means one per core)
+hashlife_engine = None         # Created on the first skip, then kept so its cache is reused
+hashlife_max_nodes = 1_000_000 # Memory cap for the HashLife node cache
+SKIP_MIN_JUMP = 16             # Shorter HashLife jumps than this are stepped with next_generation() instead
+
+# === CYCLE DETECTION ===
+detect_cycles = True             # Check every generation for a repeating board
+cycle_detector = CycleDetector() # period and start are set once the board starts repeating
+
+# === GENERATION HOOKS ===
+# Functions called with no arguments after every next_generation() and skip_generations(),
+# e.g. to record the run. They run on whichever thread stepped the board.
+generation_hooks = []
+
+# === SNAPSHOTS ===
+# A frozen copy of the board, so its next generation can be computed while the grid is
+# drawn and edited; commit_generation() only installs the result if the grid did not change.
+Snapshot = namedtuple("Snapshot", ["alive", "generation", "width", "height", "rule"])
+# The generation after a snapshot, with everything about it that can be worked out before it is
+# installed: the flat indices of its newborn cells, its population and its cycle digest.
+StepResult = namedtuple("StepResult", ["alive", "born", "population", "digest"])
+engine_lock = threading.Lock() # Held while an engine steps, since engines keep state between generations
+
+# === CHANGE TRACKING ===
+# Copies of the planes from the last take_changed_cells() call, so a renderer can redraw
+# only the cells that changed since it last looked. None means the whole grid changed.
+seen_alive = None
+seen_variants = None
+NONZERO_TO_ONE = bytes([0] + [1] * 255) # bytes.translate() table that turns any nonzero byte into 1
+
+# === GRID SETUP ===
+
+def clear_grid():
+    """Replaces the grid with all dead cells and resets the generation count to 0."""
+    global alive, variants, generation, live_count
+    alive = bytearray(grid_width * grid_height)
+    variants = bytearray(grid_width * grid_height)
+    generation = 0
+    live_count = 0
+    mark_grid_changed()
+    cycle_detector.reset()
+
+def mark_grid_changed():
+    """Records that every cell may have changed, so the whole grid needs redrawing."""
+    global seen_alive, seen_variants
+    seen_alive = None
+    seen_variants = None
+
+def take_changed_cells():
+    """
+    Returns the cells that changed since the last call and starts tracking afresh.
+    The planes are compared as big integers, so only the changed cells cost Python time.
+
+    Returns:
+        set: (row, col) of every cell whose blob appeared, vanished or changed,
+        or None if the whole grid changed.
+    """
+    global seen_alive, seen_variants
+    if seen_alive is None or len(seen_alive) != len(alive):
+        seen_alive, seen_variants = bytes(alive), bytes(variants)
+        return None
+
+    now_alive = int.from_bytes(alive, "big")
+    # A blob changed if it appeared or vanished, or if an alive cell got a different image
+    alive_diff = now_alive ^ int.from_bytes(seen_alive, "big")
+    variant_diff = int.from_bytes(variants, "big") ^ int.from_bytes(seen_variants, "big")
+    diff = alive_diff | (variant_diff & (now_alive * 0xFF))
+    seen_alive, seen_variants = bytes(alive), bytes(variants)
+    if not diff:
+        return set()
+    diff_plane = diff.to_bytes(len(alive), "big").translate(NONZERO_TO_ONE)
+    return {divmod(i, grid_width) for i in live_indices(diff_plane)}
+
+# === CELL ACCESS ===
+
+def live_indices(plane):
+    """
+    Finds every alive cell in a byte plane without looking at dead cells one by one.
+
+    Parameters:
+        plane (bytearray): An alive plane, one byte per cell.
+
+    Yields:
+        int: The flat index of each alive cell, in order.
+    """
+    i = plane.find(1)
+    while i != -1:
+        yield i
+        i = plane.find(1, i + 1)
+
+def live_bounds():
+    """
+    Finds the smallest rectangle holding every alive cell.
+
+    Returns:
+        tuple: (top row, left column, bottom row, right column), all inclusive,
+        or None if no cell is alive.
+    """
+    first = alive.find(1)
+    if first == -1:
+        return None
+    top, bottom = first // grid_width, alive.rfind(1) // grid_width
+    # OR the rows together, so the columns holding any blob are the set bytes of one row
+    columns = 0
+    for r in range(top, bottom + 1):
+        columns |= int.from_bytes(alive[r * grid_width:(r + 1) * grid_width], "big")
+    row = columns.to_bytes(grid_width, "big")
+    return top, row.find(1), bottom, row.rfind(1)
+
+def cell_image(r, c):
+    """
+    Parameters:
+        r (int): Row index of the cell.
+        c (int): Column index of the cell.
+
+    Returns:
+        The blob image of the cell, or None if the cell is dead.
+    """
+    i = r * grid_width + c
+    return blob_images[variants[i]] if alive[i] else None
+
+def get_cell(r, c):
+    """
+    Builds a Cell view of one position on the board.
+
+    Parameters:
+        r (int): Row index of the cell.
+        c (int): Column index of the cell.
+
+    Returns:
+        Cell: A copy of the cell's state; write changes back with set_cell().
+    """
+    cell = Cell(r, c)
+    cell.alive = bool(alive[r * grid_width + c])
+    cell.image = cell_image(r, c)
+    return cell
+
+def set_cell(cell):
+    """
+    Writes a Cell view back into the board.
+
+    Parameters:
+        cell (Cell): The cell to store at its row and column.
+    """
+    global live_count
+    i = cell.row * grid_width + cell.col
+    live_count += cell.alive - alive[i]
+    cycle_detector.reset() # An edited board starts a new history
+    alive[i] = cell.alive
+    variants[i] = blob_images.index(cell.image) if cell.alive else 0
+
+def toggle_cell(r, c):
+    """
+    Toggles one cell between alive and dead, giving it a blob image if it comes alive.
+
+    Parameters:
+        r (int): Row index of the cell.
+        c (int): Column index of the cell.
+    """
+    cell = get_cell(r, c)
+    cell.toggle(blob_images)
+    set_cell(cell)
+
+def population():
+    """
+    Returns:
+        int: Number of alive cells on the board.
+    """
+    return live_count
+
+def set_grid_size(width, height):
+    """
+    Changes the board size and clears the grid.
+
+    Parameters:
+        width (int): Number of columns on the board.
+        height (int): Number of rows on the board.
+    """
+    global grid_width, grid_height
+    grid_width = width
+    grid_height = height
+    clear_grid()
+
+def set_rule(text):
+    """
+    Chooses the rule every engine follows from now on.
+
+    Parameters:
+        text (str): A B/S rulestring like "B36/S23" or a name from rules.PRESETS like "HighLife".
+
+    Returns:
+        rules.Rule: The compiled rule.
+    """
+    global rule
+    new_rule = rules.parse_rule(text)
+    if new_rule != rule:
+        rule = new_rule
+        cycle_detector.reset() # Boards seen under the old rule say nothing about the new one
+    return rule
+
+def set_engine(name):
+    """
+    Chooses which engine next_generation() uses.
+
+    Parameters:
+        name (str): One of the names in engines.
+    """
+    global engine
+    if name not in engines:
+        raise ValueError(f"Unknown engine {name!r}, choose from {engines}")
+    engine = name
+
+# === GAME LOGIC ===
+
+def count_neighbors(r, c, plane=None, width=None, height=None):
+    """
+    Count the number of alive neighbors for a cell at (r, c).
+
+    Parameters:
+        r (int): Row index of the cell.
+        c (int): Column index of the cell.
+        plane (bytes-like): Alive plane to count in (default is the grid).
+        width (int): Number of columns in the plane (default is grid_width).
+        height (int): Number of rows in the plane (default is grid_height).
+
+    Returns:
+        int: Number of alive neighboring cells.
+    """
+    if plane is None:
+        plane, width, height = alive, grid_width, grid_height
+    count = 0
+    for dr in [-1, 0, 1]:
+        for dc in [-1, 0, 1]:
+            if dr == 0 and dc == 0:
+                continue
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < height and 0 <= nc < width:
+                if plane[nr * width + nc]:
+                    count += 1
+    return count
+
+def take_snapshot():
+    """
+    Freezes the board so its next generation can be computed while the grid keeps being
+    drawn and edited, e.g. on a background thread.
+
+    Returns:
+        Snapshot: A copy of the alive plane with the generation, size and rule it belongs to.
+    """
+    return Snapshot(bytes(alive), generation, grid_width, grid_height, rule)
+
+def compute_generation(snapshot):
+    """
+    Calculates the generation after a snapshot with the engine chosen with set_engine().
+    Only the engines are touched, never the grid, so this can run without holding the lock
+    that guards the board; engine_lock keeps two threads from sharing an engine at once.
+    The whole-plane work of installing the generation (finding births, counting the
+    population, hashing for cycle detection) is done here too, so commit_generation() is quick.
+
+    Parameters:
+        snapshot (Snapshot): The board to step.
+
+    Returns:
+        StepResult: The next generation.
+    """
+    with engine_lock:
+        engine_born = None # Set by engines that find the newborn cells themselves
+        if engine == "numpy":
+            alive_next = numpy_next_alive(snapshot)
+        elif engine == "bitboard":
+            alive_next = bitboard_next_alive(snapshot)
+        elif engine == "sparse":
+            alive_next = sparse_next_alive(snapshot)
+        elif engine == "parallel":
+            alive_next = parallel_next_alive(snapshot)
+        elif engine == "frontier":
+            alive_next = frontier_next_alive(snapshot)
+            engine_born = frontier_engine.born
+        else:
+            plane, width, height = snapshot.alive, snapshot.width, snapshot.height
+            alive_next = bytearray(width * height)
+            table = snapshot.rule.table # Next state, indexed by alive * 9 + neighbors
+            for r in range(height):
+                for c in range(width):
+                    i = r * width + c
+                    alive_next[i] = table[plane[i] * 9 + count_neighbors(r, c, plane, width, height)]
+
+    born = engine_born if engine_born is not None else born_cells(snapshot.alive, alive_next)
+    digest = board_digest(alive_next) if detect_cycles else None
+    return StepResult(alive_next, born, plane_population(alive_next), digest)
+
+def commit_generation(snapshot, result):
+    """
+    Makes a computed generation the current board, unless the board changed since the
+    snapshot was taken (an edit, a reset, a new size or rule); the result is then stale
+    and is thrown away.
+
+    Parameters:
+        snapshot (Snapshot): The board the result was computed from.
+        result (StepResult): What compute_generation() returned for it.
+
+    Returns:
+        int: Number of new cells born, or None if the result was thrown away.
+    """
+    global alive, generation, live_count
+    if (snapshot.generation, snapshot.width, snapshot.height, snapshot.rule) != (generation, grid_width, grid_height, rule) \
+            or (snapshot.alive is not alive and snapshot.alive != alive):
+        return None
+    if detect_cycles and len(cycle_detector) == 0:
+        cycle_detector.observe(alive, generation) # Remember the starting board too
+    give_random_variants_at(result.born) # Survivors keep their blob; only newborn cells get a new one
+    alive = result.alive
+    live_count = result.population
+    generation += 1
+    if detect_cycles:
+        cycle_detector.observe(alive, generation, result.digest)
+    for hook in generation_hooks:
+        hook()
+    return len(result.born)
+
+def next_generation():
+    """
+    Calcuklates the next generation of cells based on the current grid state.
+    Applies the current rule (Conway's Game of Life unless set_rule() changed it) to
+    determine which cells live, die, or are born.
+    The rules are computed by the engine chosen with set_engine().
+
+    Returns:
+        int: Number of new cells born this generation.
+    """
+    # Nothing else changes the grid until this returns, so the board itself is the snapshot
+    snapshot = Snapshot(alive, generation, grid_width, grid_height, rule)
+    return commit_generation(snapshot, compute_generation(snapshot))
+
+def replace_alive(alive_next):
+    """
+    Swaps in a new alive plane, gives every newborn cell a blob and updates live_count.
+
+    Parameters:
+        alive_next (bytearray): The new alive plane.
+
+    Returns:
+        int: Number of cells that are alive now but were dead before.
+    """
+    global alive, live_count
+    born = born_cells(alive, alive_next)
+    give_random_variants_at(born) # Survivors keep their blob; only newborn cells get a new one
+    live_count = plane_population(alive_next)
+    alive = alive_next
+    return len(born)
+
+def born_cells(before, after):
+    """
+    Finds the cells alive in one plane that were dead in another, comparing the whole
+    planes in C: as NumPy arrays when NumPy is installed, otherwise as big integers.
+
+    Parameters:
+        before (bytes-like): The earlier alive plane.
+        after (bytes-like): The later alive plane, the same size.
+
+    Returns:
+        The flat index of every newborn cell, in order (a NumPy array or a list).
+    """
+    if has_numpy:
+        import numpy as np
+        return np.flatnonzero(np.frombuffer(after, dtype=np.uint8) > np.frombuffer(before, dtype=np.uint8))
+    # Each cell is one byte holding 0 or 1, so births are the set bytes of (new AND NOT old)
+    born = int.from_bytes(after, "big") & ~int.from_bytes(before, "big")
+    return list(live_indices(born.to_bytes(len(after), "big"))) if born else []
+
+def plane_population(plane):
+    """
+    Parameters:
+        plane (bytes-like): An alive plane, one byte per cell.
+
+    Returns:
+        int: Number of alive cells in it.
+    """
+    if has_numpy:
+        import numpy as np
+        return int(np.count_nonzero(np.frombuffer(plane, dtype=np.uint8)))
+    return int.from_bytes(plane, "big").bit_count()
+
+def numpy_next_alive(snapshot):
+    """
+    Computes the next generation's alive states with the NumPy engine.
+    The engine is created once per board size so its buffers are reused every tick.
+
+    Parameters:
+        snapshot (Snapshot): The board to step.
+
+    Returns:
+        bytearray: The next alive plane.
+    """
+    global numpy_engine
+    if numpy_engine is None or (numpy_engine.width, numpy_engine.height, numpy_engine.rule) != snapshot[2:]:
+        from numpy_engine import NumpyEngine
+        numpy_engine = NumpyEngine(snapshot.width, snapshot.height, snapshot.rule)
+    numpy_engine.load_plane(snapshot.alive)
+    numpy_engine.step()
+    return numpy_engine.to_plane()
+
+def bitboard_next_alive(snapshot):
+    """
+    Computes the next generation's alive states with the bitboard engine.
+
+    Parameters:
+        snapshot (Snapshot): The board to step.
+
+    Returns:
+        bytearray: The next alive plane.
+    """
+    global bitboard_engine
+    if bitboard_engine is None or (bitboard_engine.width, bitboard_engine.height, bitboard_engine.rule) != snapshot[2:]:
+        bitboard_engine = BitboardEngine(snapshot.width, snapshot.height, snapshot.rule)
+    bitboard_engine.load_plane(snapshot.alive)
+    bitboard_engine.step()
+    return bitboard_engine.to_plane()
+
+def frontier_next_alive(snapshot):
+    """
+    Computes the next generation's alive states with the incremental frontier engine.
+    The engine is kept between generations so it knows which tiles changed last time;
+    edits made to the grid in between (clicks, templates) only wake the tiles around them.
+
+    Parameters:
+        snapshot (Snapshot): The board to step.
+
+    Returns:
+        bytearray: The next alive plane.
+    """
+    global frontier_engine
+    if frontier_engine is None or (frontier_engine.width, frontier_engine.height, frontier_engine.rule) != snapshot[2:]:
+        frontier_engine = FrontierEngine(snapshot.width, snapshot.height, rule=snapshot.rule)
+    frontier_engine.load_plane(snapshot.alive)
+    frontier_engine.step()
+    return frontier_engine.to_plane()
+
+def parallel_next_alive(snapshot):
+    """
+    Computes the next generation's alive states with the multi-core parallel engine.
+    The worker pool is started once and kept while the board size and worker count stay the same.
+
+    Parameters:
+        snapshot (Snapshot): The board to step.
+
+    Returns:
+        bytearray: The next alive plane.
+    """
+    global parallel_engine
+    if parallel_engine is None or (parallel_engine.width, parallel_engine.height, parallel_engine.rule) != snapshot[2:] \
+            or parallel_engine.workers != (parallel_workers or parallel_engine.workers):
+        if parallel_engine is not None:
+            parallel_engine.close()
+        from parallel_engine import ParallelEngine
+        parallel_engine = ParallelEngine(snapshot.width, snapshot.height, workers=parallel_workers, rule=snapshot.rule)
+    parallel_engine.load_plane(snapshot.alive)
+    parallel_engine.step()
+    return parallel_engine.to_plane()
+
+def sparse_next_alive(snapshot):
+    """
+    Computes the next generation's alive states with the sparse engine, bounded to the grid.
+
+    Parameters:
+        snapshot (Snapshot): The board to step.
+
+    Returns:
+        bytearray: The next alive plane.
+    """
+    global sparse_engine
+    width, height = snapshot.width, snapshot.height
+    if sparse_engine is None or (sparse_engine.bounds, sparse_engine.rule) != ((width, height), snapshot.rule):
+        sparse_engine = SparseEngine(bounds=(width, height), rule=snapshot.rule)
+    sparse_engine.load(divmod(i, width) for i in live_indices(snapshot.alive))
+    sparse_engine.step()
+    alive_next = bytearray(width * height)
+    for r, c in sparse_engine.live_cells():
+        alive_next[r * width + c] = 1
+    return alive_next
+
+def skip_generations(count):
+    """
+    Jumps the grid ahead by many generations at once, giving the same board as calling
+    next_generation() count times.
+    Once the board is known to repeat, only count % period generations are stepped.
+    Until then the HashLife engine jumps as far as it safely can: HashLife works on an
+    unbounded plane, while cells past the grid's edge are always dead, so a jump may only
+    last until the blobs could reach the edge (they spread at most one cell a generation).
+    Blobs touching or close to the edge are stepped one generation at a time instead.
+
+    Parameters:
+        count (int): How many generations to skip.
+
+    Returns:
+        int: Number of cells alive after the jump that were dead before it.
+    """
+    global hashlife_engine, generation
+    before = int.from_bytes(alive, "big")
+    remaining = count
+    while remaining:
+        if cycle_detector.period is not None:
+            leftover = remaining % cycle_detector.period
+            for _ in range(leftover):
+                next_generation()
+            generation += remaining - leftover
+            break
+        bounds = live_bounds()
+        if bounds is None:
+            generation += remaining # Nothing is alive, so nothing changes
+            break
+        top, left, bottom, right = bounds
+        # The pattern stays inside the grid for this many generations in HashLife, and the
+        # generation after that is computed only from cells inside it, so it is still exact
+        jump = min(top, left, grid_height - 1 - bottom, grid_width - 1 - right, remaining - 1) + 1
+        if jump < SKIP_MIN_JUMP:
+            next_generation()
+            remaining -= 1
+            continue
+
+        if hashlife_engine is None or (hashlife_engine.max_nodes, hashlife_engine.rule) != (hashlife_max_nodes, rule):
+            hashlife_engine = HashLifeEngine(max_nodes=hashlife_max_nodes, rule=rule)
+        hashlife_engine.load(divmod(i, grid_width) for i in live_indices(alive))
+        hashlife_engine.step(jump)
+        alive_next = bytearray(grid_width * grid_height)
+        for r, c in hashlife_engine.live_cells():
+            if 0 <= r < grid_height and 0 <= c < grid_width:
+                alive_next[r * grid_width + c] = 1
+        replace_alive(alive_next)
+        generation += jump
+        remaining -= jump
+        cycle_detector.reset() # The boards seen before the jump are no longer the recent ones
+    mark_grid_changed()
+    for hook in generation_hooks:
+        hook()
+    return (int.from_bytes(alive, "big") & ~before).bit_count()
+
+def set_alive_plane(plane, generation_number):
+    """
+    Shows a board that was stored earlier, e.g. a frame of a recording.
+    Only cells that differ from the current board are redrawn afterwards.
+
+    Parameters:
+        plane (bytes-like): The alive plane to show, one byte per cell.
+        generation_number (int): The generation the board belongs to.
+    """
+    global generation
+    replace_alive(bytearray(plane))
+    generation = generation_number
+    cycle_detector.reset()
+
+def random_plane(size, density=0.5, rng=random):
+    """
+    Makes a random alive plane in bulk. Each cell is alive when a random 16-bit number
+    is below density * 2**16; the numbers are never made one by one. Instead the
+    comparison is done bit by bit on getrandbits() ints holding one bit per cell, from the
+    lowest bit up: a 1 in the threshold ORs in a random int, a 0 ANDs one in.
+
+    Parameters:
+        size (int): Number of cells.
+        density (float): Chance that each cell is alive (default is 0.5).
+        rng (random.Random): Where the random bits come from (default is the random module).
+
+    Returns:
+        bytearray: size bytes of 0 or 1.
+    """
+    threshold = round(density * 2 ** DENSITY_BITS)
+    if threshold <= 0:
+        return bytearray(size)
+    if threshold >= 2 ** DENSITY_BITS:
+        return bytearray(b"\x01" * size)
+    bits = 0
+    for position in range(DENSITY_BITS):
+        if threshold >> position & 1:
+            bits |= rng.getrandbits(size)
+        elif bits:
+            bits &= rng.getrandbits(size)
+    return bytearray(format(bits, "b").zfill(size).encode().translate(TEXT_TO_PLANE))
+
+def give_random_variants(added, rng=random):
+    """
+    Gives every cell in a mask a random blob image in one pass over the whole plane.
+    Suited to filling many cells at once, like a new soup; give_random_variants_at() is
+    quicker for the few cells born each generation.
+
+    Parameters:
+        added (int): The alive plane packed big-endian into an int, with 1 bytes at the cells to change.
+        rng (random.Random): Where the random images come from (default is the random module).
+    """
+    if len(blob_images) == 1 or not added:
+        return # Every cell already shows the only image
+    placed = added * 0xFF # 0xFF bytes where a blob was added
+    variant_table = bytes(i % len(blob_images) for i in range(256)) # Random byte -> blob image index
+    random_variants = int.from_bytes(rng.randbytes(len(variants)).translate(variant_table), "big")
+    variants[:] = ((int.from_bytes(variants, "big") & ~placed) | (random_variants & placed)).to_bytes(len(variants), "big")
+
+def give_random_variants_at(cells, rng=random):
+    """
+    Gives each of a few cells a random blob image, in time proportional to the number of
+    cells rather than the board area. With NumPy the images are drawn and stored in one go.
+
+    Parameters:
+        cells: Flat indices of the cells to change (a NumPy array or any sequence of ints).
+        rng (random.Random): Where the random images come from (default is the random module).
+    """
+    count = len(blob_images)
+    if count == 1 or not len(cells):
+        return # Every cell already shows the only image
+    if has_numpy:
+        import numpy as np
+        generator = np.random.default_rng(rng.getrandbits(64))
+        np.frombuffer(variants, dtype=np.uint8)[cells] = generator.integers(0, count, len(cells), dtype=np.uint8)
+        return
+    for i in cells:
+        variants[i] = rng.randrange(count)
+
+def randomize_grid(density=0.5, seed=None):
+    """
+    Fills the grid with a random soup and resets the generation count to 0.
+    The same seed, density and grid size always give the same soup.
+
+    Parameters:
+        density (float): Chance that each cell starts alive (default is 0.5).
+        seed (int): Seed for the soup, or None to draw from the random module.
+    """
+    global alive, generation, live_count
+    rng = random if seed is None else random.Random(seed)
+    alive = random_plane(grid_width * grid_height, density, rng)
+    give_random_variants(int.from_bytes(alive, "big"), rng)
+    generation = 0
+    live_count = alive.count(1)
+    mark_grid_changed()
+    cycle_detector.reset()
+
+def apply_template(name):
+    """
+    Applies a predefined template to the grid based on the given name.
+
+    Parameters:
+        name (str): The name of the template to apply.
+    """
+    global live_count
+    clear_grid()
+    if name != "None":
+        for r, c in templates[name]:
+            alive[r * grid_width + c] = 1
+            variants[r * grid_width + c] = random.randrange(len(blob_images))
+        live_count = len(templates[name])
+
+def place_pattern(pattern, row=None, col=None, clear=True):
+    """
+    Draws a pattern onto the grid one run of cells at a time.
+    Cells that fall outside the grid are left out.
+
+    Parameters:
+        pattern (pattern_loader.Pattern): The pattern to place.
+        row (int): Grid row for the pattern's top edge (default centers it).
+        col (int): Grid column for the pattern's left edge (default centers it).
+        clear (bool): Whether to clear the grid first (default is True).
+    """
+    global live_count
+    if clear:
+        clear_grid()
+    if row is None:
+        row = (grid_height - pattern.height) // 2
+    if col is None:
+        col = (grid_width - pattern.width) // 2
+
+    before = int.from_bytes(alive, "big")
+    ones = b"\x01" * grid_width
+    runs = pattern.runs
+    for i in range(0, len(runs), 3):
+        r = row + runs[i]
+        if not 0 <= r < grid_height:
+            continue
+        start = max(col + runs[i + 1], 0)
+        end = min(col + runs[i + 1] + runs[i + 2], grid_width)
+        if start < end:
+            offset = r * grid_width
+            alive[offset + start:offset + end] = ones[:end - start]
+
+    give_random_variants(int.from_bytes(alive, "big") & ~before)
+    live_count = alive.count(1)
+    mark_grid_changed()
+    cycle_detector.reset()
+
+def load_pattern(path, row=None, col=None, clear=True):
+    """
+    Loads a pattern file (.rle, .cells, .lif or .life) onto the grid.
+
+    Parameters:
+        path (str): Path to the pattern file.
+        row (int): Grid row for the pattern's top edge (default centers it).
+        col (int): Grid column for the pattern's left edge (default centers it).
+        clear (bool): Whether to clear the grid first (default is True).
+
+    Returns:
+        pattern_loader.Pattern: The loaded pattern, e.g. for its name and size.
+    """
+    pattern = pattern_loader.load_pattern(path)
+    place_pattern(pattern, row, col, clear)
+    return pattern
+
+def all_blobs_dead():
+    """
+    Checks if all cells in the grid are dead (not alive).
+    Uses the running live_count, so no scan of the grid is needed.
+    Returns:
+        bool: True if all cells are dead, False otherwise.
+    """
+    return live_count == 0
@@ -4,9 +4,20 @@
 # Description: A fun version of Conway's Game of Life using blobs, animations, music, templates, and a colorful Pygame interface.
 
 # === IMPORTS ===
+import time
+startup_start = time.perf_counter() # When the game started loading, for --profile-startup
+import argparse
 import pygame
-import random
-from cell import Cell # Cell class handles each grid cell's state and image
+import blob_life_core as core # Grid state and rules (no pygame needed)
+from text_cache import TextCache # Reuses rendered text surfaces between frames
+from frame_profiler import FrameProfiler, PHASES # Per-phase frame timings for the F3 overlay
+from simulation_worker import SimulationWorker # Steps generations off the render loop
+from sound_scheduler import SoundScheduler # Plays a few pops per generation, however many blobs are born
+from recording import RecordingWriter, RecordingReader # Saves runs to disk and plays them back
+from rewind_history import RewindHistory, compress_step # Remembers recent generations for stepping back
+import pattern_loader # Reads .rle, .cells and .lif pattern files dropped on the window
+from asset_loader import AssetLoader # Loads images and audio in the background after the first frame
+from sprite_field import SpriteField # Moves and draws the menu blobs as arrays
 
 # === INITIALIZATION ===
 pygame.init()
@@ -15,16 +26,28 @@ screen_height = 630
 screen = pygame.display.set_mode((screen_width, screen_height))
 pygame.display.set_caption("Blob Life")
 clock = pygame.time.Clock()
+window_ready = time.perf_counter() # For --profile-startup
 
 # === GRID AND CELL SETTINGS ===
-grid_width = 10
-grid_height = 10
 cell_size = 50
-grid_pixel_width = grid_width * cell_size
-grid_pixel_height = grid_height * cell_size
+grid_pixel_width = core.grid_width * cell_size
+grid_pixel_height = core.grid_height * cell_size
 side_margin = (screen_width - grid_pixel_width) // 2
 top_margin = 120
 
+# === CAMERA ===
+# The grid is drawn through a fixed window on screen. The camera picks the zoom (screen
+# pixels per cell) and which part of the board the window shows, so big boards can be explored.
+board_view = pygame.Rect(side_margin, top_margin, grid_pixel_width, grid_pixel_height)
+ZOOM_LEVELS = [0.0625, 0.125, 0.25, 0.5, 1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 50, 64, 100]
+IMAGE_ZOOM = 12 # Cells at least this many pixels wide are drawn as blob images with grid lines
+BLOB_COLOR = (255, 160, 70) # Color of alive cells when zoomed out too far for images
+zoom_index = ZOOM_LEVELS.index(cell_size)
+camera_x = 0 # Board pixel (at the current zoom) shown at the left edge of board_view
+camera_y = 0 # Board pixel (at the current zoom) shown at the top edge of board_view
+camera_moved = False # True when the view needs a full redraw after a zoom or pan
+grid_overlays = {} # Pre-drawn grid lines for each zoom, covering the whole view
+
 # === COLORS ===
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -49,6 +72,7 @@ current_theme = "None"
 font = pygame.font.Font(None, 50)
 font_1 = pygame.font.Font(None, 36)
 font_2 = pygame.font.Font(None, 28)
+text_cache = TextCache(max_entries=256) # Rendered text, reused every frame
 
 # === STORYLINE TEXT ===
 story_lines = [
@@ -65,39 +89,42 @@ story_lines = [
 ]
 
 # === ASSETS ===
-# Load blob images and scale them to cell size
-blob_images = [
-    pygame.transform.scale(pygame.image.load("assets/blob1.png"), (cell_size, cell_size)),
-    pygame.transform.scale(pygame.image.load("assets/blob2.png"), (cell_size, cell_size))
-]
-blobbo_img = pygame.transform.scale(pygame.image.load("assets/blobbo.png"), (80, 80))
+# The blob images, Blobbo, the music and the pop sound are big, so they load on a background
+# thread once the first frame is up (see load_assets()). Until then, drawn circles stand in
+# for the blobs and Blobbo, and the game is silent.
+PLACEHOLDER_COLORS = [(255, 190, 120), (255, 235, 210)]
+blob_images = [] # The two blob images at cell size; filled in place when the real ones load
+for color in PLACEHOLDER_COLORS:
+    placeholder = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+    pygame.draw.circle(placeholder, color, (cell_size // 2, cell_size // 2), cell_size // 2 - 4)
+    blob_images.append(placeholder)
+scaled_blob_images = {cell_size: blob_images} # Blob images for each zoom, scaled and converted once
+blobbo_img = pygame.Surface((80, 80), pygame.SRCALPHA)
+pygame.draw.circle(blobbo_img, PLACEHOLDER_COLORS[0], (40, 40), 36)
+core.blob_images = blob_images # Alive cells in the core grid show these blobs
+asset_loader = AssetLoader()
 
 # === MUSIC AND SOUND ===
-pygame.mixer.music.load("assets/game-music.mp3")
-pygame.mixer.music.play(-1)
-blob_pop_sound = pygame.mixer.Sound("assets/button-click.mp3")
-
-# === TEMPLATES ===
-# Predefined templates for user convenience
-templates = {
-    "Letter A": [(1,3), (1,4), (1,5), (1,6), (2,3), (2,6), (3,3), (3,4), (3,5), (3,6), (4,3), (4,6), (5,3), (5,6)],
-    "Smiley": [(7,4), (6,3), (7,5), (6,6), (5,2), (5,7), (2,3), (2,6), (3,3), (3,6), (1,3), (1,6)],
-    "Heart": [(6,4), (5,3), (5,5), (4,2), (4,6), (3,2), (3,6), (2,3), (3,4), (2,5)]
-}
+pop_scheduler = None # Created once the pop sound has loaded
 
 # === GAME STATE ===
 screen_state = "start_page" # Current screen state
-grid = [[Cell(r, c) for c in range(grid_width)] for r in range(grid_height)]
 simulation_running = False # Controls whether the simulation is running
-generation = 0             # Current generation number
 tutorial_step = 0          # Current tutorial step
 just_paused = False        # Checks if the simulation was just paused
+pause_on_cycle = True      # Pauses the simulation once the blobs settle or start repeating (L toggles it)
+paused_cycle = None        # (start, period) of the loop the simulation last paused for, so it only pauses once
+turbo_mode = False         # Runs generations as fast as the engine allows instead of on a timer
 is_muted = False           # Checks if the music is muted
 
 # === BUTTON LOCATIONS ===
 mute_button_rect = pygame.Rect(screen_width - 120, 20, 100, 40)
 start_button_rect = pygame.Rect(screen_width//2 - 150, screen_height//2 +60 , 300, 50)
 back_button_rect = pygame.Rect(20, 20, 100, 30)  # Back button in the top left corner
+tutorial_button_rect = pygame.Rect(400, 200, 300, 40)  # Main menu options
+storyline_button_rect = pygame.Rect(400, 270, 300, 40)
+play_button_rect = pygame.Rect(400, 340, 300, 40)
+theme_button_rect = pygame.Rect(400, 410, 300, 40)
 
 # === TUTORIAL MESSAGES ===
 tutorial_messages = [
@@ -108,24 +135,103 @@ tutorial_messages = [
 ]
 
 # === ANIMATED BLOBS ===
-# Creates animated blobs that move across the screen
-animated_blobs = []
-for _ in range(30):
-    x = random.randint(0, 300)
-    y = random.randint(0, screen_height)
-    speed = random.choice([1, 2])
-    direction = random.choice([-1, 1])
-    img = random.choice(blob_images)
-    animated_blobs.append({"x": x, "y": y, "speed": speed, "dir": direction, "img": img})
+# Blobs that move across the menu screens, kept out of the middle where the text and buttons are
+menu_blobs = SpriteField(30, screen_width, screen_height, len(blob_images))
+menu_keep_out = (300, 800)      # x range blobs stay out of on the start page and menus
+storyline_keep_out = (250, 800) # x range blobs stay out of on the storyline screen
 
 # === TIMING FOR GENERATIONS ===
 generation_interval = 500  # Default time between generations in milliseconds
 default_interval = 500
 fast_interval = 100
-last_update_time = pygame.time.get_ticks()
+skip_amount = 1024 # Generations jumped when F is pressed
+
+# === REWIND ===
+rewind_history = RewindHistory(budget=8 * 1024 * 1024) # Recent generations, oldest dropped past 8 MiB
+rewind_hold_delay = 250 # Milliseconds Left must be held before it scrubs back every frame
+rewind_hold_start = None # When Left was pressed, while it is held
+
+# === RECORDING AND REPLAY ===
+recording_path = "blob_life_recording.blr" # C records generations here, P replays them
+recorder = None        # RecordingWriter while recording
+replay_reader = None   # RecordingReader while in replay mode
+replay_frame = 0       # Frame of the recording being shown
+shown_replay_frame = None
+replay_playing = False # Space plays the replay forward at the frame rate
+replay_jump = 100      # Frames jumped by Page Up and Page Down
+
+# === FRAME PROFILER ===
+profiler = FrameProfiler(window=120) # Times each phase of every frame
+show_profiler = False                # F3 shows the timings overlay
+profiler_font = pygame.font.Font(None, 22)
+profiler_rect = pygame.Rect(10, 356, 280, 264) # Below the rules, clear of the grid
+profiler_surface = None              # Overlay contents, redrawn a few times a second
+profiler_refresh_ms = 250
+last_profiler_refresh = 0
+trace_path = "frame_trace.csv"       # F4 starts and stops writing one row per frame here
 
 # === FUNCTION DEFINITIONS ===
 
+# --- Asset Loading ---
+
+def load_blob_images():
+    """
+    Loads the blob images and scales them to every size cells are drawn at. Runs on the
+    asset thread, so the large source images are never kept and no zoom has to scale them again.
+
+    Returns:
+        dict: Cell size -> [blob1, blob2] scaled to that size (not yet converted).
+    """
+    sources = [pygame.image.load("assets/blob1.png"), pygame.image.load("assets/blob2.png")]
+    sizes = {cell_size} | {zoom for zoom in ZOOM_LEVELS if zoom >= IMAGE_ZOOM}
+    return {size: [pygame.transform.scale(image, (size, size)) for image in sources] for size in sizes}
+
+def load_music():
+    """Loads the background music, ready to play. Runs on the asset thread."""
+    pygame.mixer.music.load("assets/game-music.mp3")
+
+def load_assets(wait=False):
+    """
+    Starts loading the images and audio in the background.
+
+    Parameters:
+        wait (bool): Block until everything has loaded and is in use (for tools like the benchmark).
+    """
+    if not asset_loader.started:
+        asset_loader.add("blobs", load_blob_images)
+        asset_loader.add("blobbo", lambda: pygame.transform.scale(pygame.image.load("assets/blobbo.png"), (80, 80)))
+        asset_loader.add("music", load_music)
+        asset_loader.add("pop_sound", lambda: pygame.mixer.Sound("assets/button-click.mp3"))
+        asset_loader.start()
+    if wait:
+        asset_loader.wait()
+        install_loaded_assets()
+
+def install_loaded_assets():
+    """
+    Swaps the assets that finished loading in for their placeholders. Called every frame on
+    the game thread, which is where surfaces are converted to the screen's pixel format.
+    """
+    global blobbo_img, pop_scheduler, camera_moved, drawn_screen_state
+    loaded = asset_loader.take_loaded()
+    for name, asset in loaded:
+        if name == "blobs":
+            for size, images in asset.items():
+                scaled_blob_images[size] = [image.convert_alpha() for image in images]
+            blob_images[:] = scaled_blob_images[cell_size]
+        elif name == "blobbo":
+            blobbo_img = asset.convert_alpha()
+        elif name == "music":
+            pygame.mixer.music.play(-1)
+            pygame.mixer.music.set_volume(0 if is_muted else 1)
+        elif name == "pop_sound":
+            pop_scheduler = SoundScheduler(asset, max_per_generation=3, max_per_second=20)
+    if loaded:
+        # Backgrounds and the board may show placeholders, so draw everything again
+        static_layers.clear()
+        camera_moved = True
+        drawn_screen_state = None
+
 # --- UI Drawing Functions ---
 
 def draw_text_centered(text, y, font_obj, color=WHITE):
@@ -138,7 +244,7 @@ def draw_text_centered(text, y, font_obj, color=WHITE):
         font_obj (pygame.font.Font): The font object to use for rendering the text.
         color (tuple): The RGB color of the text (default is WHITE).
     """
-    rendered = font_obj.render(text, True, color)
+    rendered = text_cache.render(font_obj, text, True, color)
     rect = rendered.get_rect(center=(screen_width // 2, y))
     screen.blit(rendered, rect)
 
@@ -152,32 +258,309 @@ def draw_text(text, x, y, font_obj, color=WHITE):
         y (int): Vertical position.
         font_obj (pygame.font.Font): The font object to use for rendering the text.
         color (tuple): The RGB color of the text (default is WHITE)."""
-    rendered = font_obj.render(text, True, color)
+    rendered = text_cache.render(font_obj, text, True, color)
     screen.blit(rendered, (x, y))
 
+# --- Camera ---
+
+def camera_zoom():
+    """
+    Returns:
+        float: Screen pixels per cell. Below 1, each pixel covers a square block of cells.
+    """
+    return ZOOM_LEVELS[zoom_index]
+
+def board_pixel_size():
+    """
+    Returns:
+        tuple: (width, height) of the whole board in screen pixels at the current zoom.
+    """
+    zoom = camera_zoom()
+    if zoom >= 1:
+        return core.grid_width * zoom, core.grid_height * zoom
+    block = round(1 / zoom)
+    return -(-core.grid_width // block), -(-core.grid_height // block)
+
+def clamp_camera():
+    """Keeps the camera on the board, centering the board when it is smaller than the view."""
+    global camera_x, camera_y, camera_moved
+    width, height = board_pixel_size()
+    if width <= board_view.width:
+        camera_x = (width - board_view.width) // 2
+    else:
+        camera_x = min(max(camera_x, 0), width - board_view.width)
+    if height <= board_view.height:
+        camera_y = (height - board_view.height) // 2
+    else:
+        camera_y = min(max(camera_y, 0), height - board_view.height)
+    camera_moved = True
+
+def fit_camera():
+    """Zooms in as far as possible while the whole board still fits in the view."""
+    global zoom_index
+    zoom_index = 0
+    for i, zoom in enumerate(ZOOM_LEVELS):
+        if zoom >= 1 and core.grid_width * zoom <= board_view.width and core.grid_height * zoom <= board_view.height:
+            zoom_index = i
+        elif zoom < 1 and -(-core.grid_width * zoom // 1) <= board_view.width and -(-core.grid_height * zoom // 1) <= board_view.height:
+            zoom_index = i
+    clamp_camera()
+
+def zoom_camera(steps, pos):
+    """
+    Zooms in or out, keeping the cell under a screen position where it is.
+
+    Parameters:
+        steps (int): Zoom levels to move; positive zooms in.
+        pos (tuple): Screen position to zoom around (the view's center if outside it).
+    """
+    global zoom_index, camera_x, camera_y
+    if not board_view.collidepoint(pos):
+        pos = board_view.center
+    old_zoom = camera_zoom()
+    zoom_index = min(max(zoom_index + steps, 0), len(ZOOM_LEVELS) - 1)
+    scale = camera_zoom() / old_zoom
+    camera_x = round((camera_x + pos[0] - board_view.x) * scale) - (pos[0] - board_view.x)
+    camera_y = round((camera_y + pos[1] - board_view.y) * scale) - (pos[1] - board_view.y)
+    clamp_camera()
+
+def pan_camera(dx, dy):
+    """
+    Moves the view by a number of screen pixels, like dragging the board.
+
+    Parameters:
+        dx (int): Pixels dragged to the right.
+        dy (int): Pixels dragged down.
+    """
+    global camera_x, camera_y
+    camera_x -= dx
+    camera_y -= dy
+    clamp_camera()
+
+def cell_at(pos):
+    """
+    Parameters:
+        pos (tuple): A screen position.
+
+    Returns:
+        tuple: (row, col) of the cell drawn there, or None if there is no cell there.
+    """
+    if not board_view.collidepoint(pos):
+        return None
+    zoom = camera_zoom()
+    col = int((pos[0] - board_view.x + camera_x) // zoom) if zoom >= 1 else (pos[0] - board_view.x + camera_x) * round(1 / zoom)
+    row = int((pos[1] - board_view.y + camera_y) // zoom) if zoom >= 1 else (pos[1] - board_view.y + camera_y) * round(1 / zoom)
+    if 0 <= row < core.grid_height and 0 <= col < core.grid_width:
+        return row, col
+    return None
+
+def cell_rect(r, c):
+    """
+    Parameters:
+        r (int): Row index of the cell.
+        c (int): Column index of the cell.
+
+    Returns:
+        pygame.Rect: Where the cell is drawn on screen at the current zoom (1 pixel or more).
+    """
+    zoom = camera_zoom()
+    return pygame.Rect(board_view.x + c * zoom - camera_x, board_view.y + r * zoom - camera_y, zoom, zoom)
+
+def visible_cells():
+    """
+    Returns:
+        tuple: (first row, end row, first col, end col) of the cells inside the view, for zoom >= 1.
+    """
+    zoom = camera_zoom()
+    first_row = max(camera_y // zoom, 0)
+    first_col = max(camera_x // zoom, 0)
+    end_row = min(-(-(camera_y + board_view.height) // zoom), core.grid_height)
+    end_col = min(-(-(camera_x + board_view.width) // zoom), core.grid_width)
+    return int(first_row), int(end_row), int(first_col), int(end_col)
+
+def blob_images_for(size):
+    """
+    Parameters:
+        size (int): Cell size in pixels.
+
+    Returns:
+        list: The blob images at that size. Once the images have loaded, every zoom's
+        images are ready; before that the placeholders are stretched to the size.
+    """
+    if size not in scaled_blob_images:
+        scaled_blob_images[size] = [pygame.transform.scale(image, (size, size)) for image in blob_images]
+    return scaled_blob_images[size]
+
+# --- Grid Drawing ---
+
 def draw_cells():
-    """Draw all cells on the grid. Alive cells are drawn with their images; grid lines are white."""
-    for row in grid:
-        for cell in row:
-            if cell.alive and cell.image:
-                screen.blit(cell.image, (side_margin + cell.col * cell_size, top_margin + cell.row * cell_size))
-            pygame.draw.rect(screen, WHITE, (side_margin + cell.col * cell_size, top_margin + cell.row * cell_size, cell_size, cell_size), 1)
+    """
+    Draws the part of the board inside the view. Only visible cells are touched, so the cost
+    depends on the view's size, not the board's. The level of detail follows the zoom:
+    blob images and grid lines up close, one flat color per cell further out, and
+    shaded pixels (by how many cells are alive) when a pixel covers several cells.
+    """
+    screen.set_clip(board_view)
+    zoom = camera_zoom()
+    if zoom >= IMAGE_ZOOM:
+        draw_cell_images()
+    elif zoom >= 1:
+        draw_cell_pixels()
+    else:
+        draw_cell_density()
+    screen.set_clip(None)
+
+def grid_overlay(zoom):
+    """
+    Parameters:
+        zoom (int): Cell size in pixels.
+
+    Returns:
+        pygame.Surface: White cell outlines (as pygame.draw.rect(..., 1) draws them) covering the
+        view plus one cell, with a transparent background. Drawn once per zoom.
+    """
+    if zoom not in grid_overlays:
+        overlay = pygame.Surface((board_view.width + zoom, board_view.height + zoom))
+        overlay.fill(BLACK)
+        overlay.set_colorkey(BLACK)
+        for x in range(0, overlay.get_width(), zoom):
+            pygame.draw.line(overlay, WHITE, (x, 0), (x, overlay.get_height()))
+            pygame.draw.line(overlay, WHITE, (x + zoom - 1, 0), (x + zoom - 1, overlay.get_height()))
+        for y in range(0, overlay.get_height(), zoom):
+            pygame.draw.line(overlay, WHITE, (0, y), (overlay.get_width(), y))
+            pygame.draw.line(overlay, WHITE, (0, y + zoom - 1), (overlay.get_width(), y + zoom - 1))
+        grid_overlays[zoom] = overlay.convert()
+    return grid_overlays[zoom]
+
+def draw_cell_images():
+    """
+    Draws every visible cell as its blob image with a white grid line around it.
+    The alive cells are found a row slice at a time and blitted in one Surface.blits() call,
+    and all the grid lines come from one blit of the pre-drawn overlay.
+    """
+    zoom = camera_zoom()
+    images = blob_images_for(zoom)
+    alive, variants, width = core.alive, core.variants, core.grid_width
+    first_row, end_row, first_col, end_col = visible_cells()
+    blits = []
+    for r in range(first_row, end_row):
+        y = board_view.y + r * zoom - camera_y
+        row_start = r * width
+        i = alive.find(1, row_start + first_col, row_start + end_col)
+        while i != -1:
+            blits.append((images[variants[i]], (board_view.x + (i - row_start) * zoom - camera_x, y)))
+            i = alive.find(1, i + 1, row_start + end_col)
+    screen.blits(blits, doreturn=False)
+
+    # Grid lines over the part of the board inside the view
+    board_rect = pygame.Rect(board_view.x - camera_x, board_view.y - camera_y, core.grid_width * zoom, core.grid_height * zoom)
+    shown = board_rect.clip(board_view)
+    if shown:
+        area = pygame.Rect((shown.x - board_rect.x) % zoom, (shown.y - board_rect.y) % zoom, shown.width, shown.height)
+        screen.blit(grid_overlay(zoom), shown, area)
+
+def draw_cell_pixels():
+    """Draws the visible cells as one flat colored square each, scaled up from a one-pixel-per-cell image."""
+    zoom = camera_zoom()
+    alive, width = core.alive, core.grid_width
+    first_row, end_row, first_col, end_col = visible_cells()
+    if first_row >= end_row or first_col >= end_col:
+        return
+    rows = b"".join(alive[r * width + first_col:r * width + end_col] for r in range(first_row, end_row))
+    image = pygame.image.frombuffer(rows, (end_col - first_col, end_row - first_row), "P")
+    image.set_palette([BLACK, BLOB_COLOR])
+    image.set_colorkey(0) # Dead cells let the background show through
+    image = pygame.transform.scale(image, ((end_col - first_col) * zoom, (end_row - first_row) * zoom))
+    screen.blit(image, (board_view.x + first_col * zoom - camera_x, board_view.y + first_row * zoom - camera_y))
+
+def draw_cell_density():
+    """
+    Draws the view when each pixel covers a block of cells. Every pixel is shaded by how
+    many of up to 4 x 4 sample cells in its block are alive. Whole rows of samples are taken
+    with strided slices and added as big integers, so no cell is visited in Python.
+    """
+    block = round(1 / camera_zoom())
+    alive, width = core.alive, core.grid_width
+    board_width, board_height = board_pixel_size()
+    first_x, first_y = max(camera_x, 0), max(camera_y, 0)
+    end_x = min(camera_x + board_view.width, board_width)
+    end_y = min(camera_y + board_view.height, board_height)
+    pixels = end_x - first_x
+    if pixels <= 0 or end_y <= first_y:
+        return
+    offsets = range(0, block, max(block // 4, 1))
+    rows = []
+    for y in range(first_y, end_y):
+        total = 0
+        for dy in offsets:
+            r = y * block + dy
+            if r >= core.grid_height:
+                break
+            start = r * width + first_x * block
+            stop = r * width + min(end_x * block, width)
+            for dx in offsets:
+                samples = alive[start + dx:stop:block]
+                total += int.from_bytes(samples.ljust(pixels, b"\0"), "big")
+        rows.append(total.to_bytes(pixels, "big"))
+
+    # Palette entry n is the color for n alive samples, fading from dim to full blob color
+    sample_count = len(offsets) ** 2
+    palette = [BLACK] + [tuple(max(1, channel * (n + sample_count // 2) // (sample_count + sample_count // 2)) for channel in BLOB_COLOR)
+                         for n in range(1, sample_count + 1)]
+    image = pygame.image.frombuffer(b"".join(rows), (pixels, end_y - first_y), "P")
+    image.set_palette(palette)
+    image.set_colorkey(0)
+    screen.blit(image, (board_view.x + first_x - camera_x, board_view.y + first_y - camera_y))
+
+def draw_board_view():
+    """
+    Redraws the whole view over a cleared background.
+
+    Returns:
+        pygame.Rect: The screen area that was redrawn.
+    """
+    global camera_moved
+    screen.blit(get_static_layer("simulation", draw_simulation_background), board_view, board_view)
+    draw_cells()
+    camera_moved = False
+    return board_view
 
 def draw_mute_button():
     """Draw the mute/unmute button based on the current mute state."""
     color = (200, 0, 0) if is_muted else (0, 200, 0) # Color changes based on mute state
     pygame.draw.rect(screen, color, mute_button_rect, border_radius=15)
     label = "Unmute" if is_muted else "Mute"
-    text = font_2.render(label, True, WHITE)
+    text = text_cache.render(font_2, label, True, WHITE)
     screen.blit(text, (mute_button_rect.x + 10, mute_button_rect.y + 10))
 
 def draw_start_page():
-    """Draw the start page with animated blobs, a welcome message, and a start button."""
-    animate_blobs()
+    """Draw the start page's background: a welcome message and a start button."""
+    screen.fill(themes[current_theme])
     draw_text_centered ("Welcome to Blob Life!", 120, font)
     draw_text_centered("A fun interactive game where blobs come to life!", 180, font_2)
     draw_button("Start", start_button_rect)
 
+def draw_theme_select_background():
+    """Draw the theme selection screen's background: a title and a button for each theme."""
+    screen.fill(themes[current_theme])
+    draw_text_centered("Choose Your Theme!", 100, font)
+    for i, theme in enumerate(themes):
+        # Draws button with contrasting text color if theme is black
+        if themes[theme] == BLACK:
+            draw_template_button(theme, pygame.Rect(400, 180 + i * 40, 300, 40), (255,255,255))
+        else:
+            draw_template_button(theme, pygame.Rect(400, 180 + i * 40, 300, 40), themes[theme])
+
+def draw_start_menu_background():
+    """Draw the main menu's background: the titles and a button for each option."""
+    screen.fill(themes[current_theme])
+    draw_text_centered("Welcome to Blob Life!", 100, font)
+    draw_text_centered("Game of Life with a Blob Twist!", 160, font_1)
+    draw_button("Tutorial", tutorial_button_rect)
+    draw_button("Storyline", storyline_button_rect)
+    draw_button("Play", play_button_rect)
+    draw_button("Theme Select", theme_button_rect)
+
 def draw_button(text,rect, color = WHITE):
     """
     Draw a button with the given text and rectangle.
@@ -188,7 +571,7 @@ def draw_button(text,rect, color = WHITE):
         color (tuple): The RGB color of the button background (default is WHITE).
     """
     pygame.draw.rect(screen, color, rect,border_radius=15)
-    label = font_2.render(text, True, BLACK)
+    label = text_cache.render(font_2, text, True, BLACK)
     label_rect = label.get_rect(center=rect.center)
     screen.blit(label, label_rect)
 
@@ -201,7 +584,7 @@ def draw_template_button(text, rect, color):
         rect (pygame.Rect): The rectangle defining the button's position and size.
         color (tuple): The RGB color of the button background."""
     pygame.draw.rect(screen, color, rect)
-    label = font_2.render(text, True, BLACK)
+    label = text_cache.render(font_2, text, True, BLACK)
     label_rect = label.get_rect(center=rect.center)
     screen.blit(label, label_rect)
 
@@ -210,143 +593,259 @@ def draw_back_button():
     rect = pygame.Rect(20, 20, 100, 30)  # x, y, width, height
     color = (255, 255, 255)  # White background
     pygame.draw.rect(screen, color, rect, border_radius=15)
-    label = font_2.render("Back", True, (0, 0, 0))  # Black text
+    label = text_cache.render(font_2, "Back", True, (0, 0, 0))  # Black text
     label_rect = label.get_rect(center=rect.center)
     screen.blit(label, label_rect)
 
 # === GAME LOGIC ===
 
-def count_neighbors(r, c):
+def advance_generation(count=1):
     """
-    Count the number of alive neighbors for a cell at (r, c).
-    
+    Advances the core grid and plays a pop sound for each new blob born.
+
     Parameters:
-        r (int): Row index of the cell.
-        c (int): Column index of the cell.
-    
+        count (int): Generations to advance. More than one skips ahead with HashLife (default is 1).
+    """
+    births = step_generation(count)
+    profiler.count_generations(count)
+    profiler.lap("generation")
+    play_birth_sounds(births, count)
+
+def step_generation(count=1):
+    """
+    Advances the core grid and remembers the step so it can be rewound.
+
+    Parameters:
+        count (int): Generations to advance. More than one skips ahead with HashLife (default is 1).
+
     Returns:
-        int: Number of alive neighboring cells.
-    """
-    count = 0
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:
-                continue
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < grid_height and 0 <= nc < grid_width:
-                if grid[nr][nc].alive:
-                    count += 1
-    return count
-
-def next_generation():
-    """
-    Calcuklates the next generation of cells based on the current grid state.
-    Applies Conway's Game of Life rules to determine which cells live, die, or are born.
-    Updates the global grid and plays a sound when a new cell is born.
-    """
-    global generation
-    new_grid = [[Cell(r, c) for c in range(grid_width)] for r in range(grid_height)]
-    for r in range(grid_height):
-        for c in range(grid_width):
-            neighbors = count_neighbors(r, c)
-            if grid[r][c].alive:
-                alive_next = neighbors in [2, 3]
-            else:
-                alive_next = neighbors == 3
-
-            new_grid[r][c].alive = alive_next
-
-            # Set image for alive cells, None for dead
-            if alive_next:
-                new_grid[r][c].image = random.choice(blob_images)
-            else:
-                new_grid[r][c].image = None
-
-            # Play sound only if a new cell is born
-            if new_grid[r][c].alive and not grid[r][c].alive:
-                if not is_muted:
-                    blob_pop_sound.play()
-
-
-    # Update the global grid
-    grid[:] = new_grid
-    generation += 1
-
-def randomize_grid():
-    """
-    Randomizes the grid by setting each cell to a random alive or dead state.
-    Resets the generation count to 0.
-    """
-    global grid, generation
-    for row in grid:
-        for cell in row:
-            cell.alive = random.choice([True, False])
-            cell.image = random.choice(blob_images) if cell.alive else None
-    generation = 0
-
-def apply_template(name):
-    """
-    Applies a predefined template to the grid based on the given name.
-    
+        int: Number of blobs born.
+    """
+    if count == 1:
+        snapshot = core.take_snapshot()
+        return finish_generation(snapshot, compute_generation(snapshot))
+    before, before_generation = bytes(core.alive), core.generation
+    births = core.skip_generations(count)
+    rewind_history.record(before, before_generation, core.alive)
+    return births
+
+def compute_generation(snapshot):
+    """
+    Computes the generation after a snapshot and compresses the step for the rewind history.
+    Neither touches the board, so the simulation worker calls this without holding its lock.
+
     Parameters:
-        name (str): The name of the template to apply.
-    """
-    global grid, generation
-    grid = [[Cell(r, c) for c in range(grid_width)] for r in range(grid_height)]
-    if name != "None":
-        for r, c in templates[name]:
-            grid[r][c].alive = True
-            grid[r][c].image = random.choice(blob_images)
-    generation = 0
-
-def all_blobs_dead():
-    """ 
-    Checks if all cells in the grid are dead (not alive).
+        snapshot (core.Snapshot): The board to step.
+
     Returns:
-        bool: True if all cells are dead, False otherwise.
+        tuple: (core.StepResult, compressed diff for rewind_history).
+    """
+    result = core.compute_generation(snapshot)
+    return result, compress_step(snapshot.alive, result.alive)
+
+def finish_generation(snapshot, computed):
     """
-    return all(not cell.alive for row in grid for cell in row)
+    Installs a generation computed from a snapshot and remembers the step so it can be rewound.
+    The simulation worker calls this, holding its lock, for every generation it runs.
+
+    Parameters:
+        snapshot (core.Snapshot): The board the generation was computed from.
+        computed (tuple): What compute_generation() returned for it.
+
+    Returns:
+        int: Number of blobs born, or None if the board was edited meanwhile and the generation was thrown away.
+    """
+    result, compressed = computed
+    births = core.commit_generation(snapshot, result)
+    if births is not None:
+        rewind_history.record(snapshot.alive, snapshot.generation, core.alive, compressed)
+    return births
+
+def step_back():
+    """
+    Rewinds the grid by one remembered step without computing anything.
+
+    Returns:
+        bool: False if there was nothing to rewind.
+    """
+    state = rewind_history.step_back(core.alive)
+    if state is None:
+        return False
+    generation, plane = state
+    core.set_alive_plane(plane, generation)
+    return True
+
+def play_birth_sounds(births, generations=1):
+    """
+    Plays pop sounds for new blobs unless the game is muted.
+    The pop scheduler coalesces the births into a few pops, louder for bigger bursts.
+
+    Parameters:
+        births (int): Number of blobs born.
+        generations (int): How many generations the births came from (default is 1).
+    """
+    if not is_muted and pop_scheduler is not None:
+        pop_scheduler.add_births(births, generations)
+    profiler.lap("sound")
+
+def simulation_should_stop():
+    """
+    Checked by the simulation worker after every generation.
+
+    Returns:
+        bool: True once every blob is gone, or the blobs just settled into a loop and pause_on_cycle is on.
+        Each loop only pauses the simulation once, so pressing Space lets an oscillator keep running.
+    """
+    global paused_cycle
+    if core.all_blobs_dead():
+        return True
+    cycle = (core.cycle_detector.start, core.cycle_detector.period)
+    if pause_on_cycle and cycle[1] is not None and cycle != paused_cycle:
+        paused_cycle = cycle
+        return True
+    return False
+
+# Steps generations in the background while the simulation runs
+simulation_worker = SimulationWorker(core.take_snapshot, compute_generation, finish_generation,
+                                     simulation_should_stop)
+
+# === RECORDING AND REPLAY ===
+
+def record_generation():
+    """Generation hook: appends the new board to the recording."""
+    recorder.record(core.alive, core.generation)
+
+def start_recording():
+    """Starts appending every generation to recording_path, beginning with the current board."""
+    global recorder
+    try:
+        recorder = RecordingWriter(recording_path, core.grid_width, core.grid_height)
+    except ValueError as error:
+        print(f"Could not record: {error}")
+        return
+    recorder.record(core.alive, core.generation)
+    core.generation_hooks.append(record_generation)
+
+def stop_recording():
+    """Stops recording and closes the file."""
+    global recorder
+    if recorder is not None:
+        core.generation_hooks.remove(record_generation)
+        recorder.close()
+        recorder = None
+
+def start_replay():
+    """
+    Switches the simulation screen to replay mode, showing the last frame of the recording.
+    Any recording in progress is finished first so its last frames can be replayed.
+    """
+    global replay_reader, replay_frame, shown_replay_frame, replay_playing
+    stop_recording()
+    try:
+        reader = RecordingReader(recording_path)
+    except (OSError, ValueError) as error:
+        print(f"Could not replay: {error}")
+        return
+    if len(reader) == 0 or (reader.width, reader.height) != (core.grid_width, core.grid_height):
+        reader.close()
+        return
+    replay_reader = reader
+    replay_frame = len(reader) - 1
+    shown_replay_frame = None
+    replay_playing = False
+
+def stop_replay():
+    """Leaves replay mode. The board stays at the frame that was shown, so play can continue from it."""
+    global replay_reader
+    replay_reader.close()
+    replay_reader = None
+
+def update_replay(keys):
+    """
+    Moves the replay along for this frame and shows the current frame.
+    Holding Left or Right scrubs one recorded frame per screen frame.
+
+    Parameters:
+        keys (sequence): Pressed keys from pygame.key.get_pressed().
+    """
+    global replay_frame, shown_replay_frame, replay_playing
+    step = keys[pygame.K_RIGHT] - keys[pygame.K_LEFT] + replay_playing
+    replay_frame = min(max(replay_frame + step, 0), len(replay_reader) - 1)
+    if replay_frame == len(replay_reader) - 1:
+        replay_playing = False
+    if replay_frame != shown_replay_frame:
+        generation, plane = replay_reader.frame(replay_frame)
+        core.set_alive_plane(plane, generation)
+        shown_replay_frame = replay_frame
 
 # === ANIMATION ===
 
-def animate_blobs():
-    """
-    Animate blobs by moving them horizontalle, keeping them away from the center area (300-800).
-    If a blob goes out of bounds or enters the center area, it is repositioned randomly.
-    """
-    for blob in animated_blobs:
-        screen.blit(blob["img"], (blob["x"], blob["y"]))
-        blob["x"] += blob["speed"] * blob["dir"]
-        if 300 <= blob["x"] <= 800 or blob["x"] < 0 or blob["x"] > screen_width:
-            # Keep blobs away from the center area (300–800)
-            left_range = range(0, 300)
-            right_range = range(801, screen_width)
-            selected_range = random.choice([left_range, right_range])
-            
-            blob["x"] = random.randint(selected_range.start, selected_range.stop - 1)
-            blob["y"] = random.randint(0, screen_height)
-
-def animate_storyline_blobs():
-    """
-    Animate blobs for the storyline screen, moving them horizontally and keeping them away from the center area (250-800).
-    If a blob goes out of bounds or enters the center area, it is repositioned randomly."""
-    for blob in animated_blobs:
-        screen.blit(blob["img"], (blob["x"], blob["y"]))
-        blob["x"] += blob["speed"] * blob["dir"]
-        if 250 <= blob["x"] <= 800 or blob["x"] < 0 or blob["x"] > screen_width:
-            # Keep blobs away from the center area (250–800)
-            left_range = range(0, 250)
-            right_range = range(801, screen_width)
-            selected_range = random.choice([left_range, right_range])
-            
-            blob["x"] = random.randint(selected_range.start, selected_range.stop - 1)
-            blob["y"] = random.randint(0, screen_height)
+def draw_menu_screen(name, draw_background, keep_out, full):
+    """
+    Moves the menu blobs one step and draws them over the screen's cached background.
+    Only the areas the blobs left or moved into are redrawn, unless full is True.
+
+    Parameters:
+        name (str): The screen being drawn, used to cache its background.
+        draw_background (function): Draws everything on the screen except the blobs and corner buttons.
+        keep_out (tuple): (left, right) x coordinates the blobs stay out of.
+        full (bool): True to redraw the whole screen, e.g. when it was just opened.
+
+    Returns:
+        list: The screen rectangles that need to be pushed to the display.
+    """
+    background = get_static_layer(name, draw_background)
+    if show_profiler:
+        screen.blit(background, profiler_rect, profiler_rect) # The overlay is translucent, so start it from a clean background
+    menu_blobs.update(keep_out)
+    dirty_rects = menu_blobs.draw(screen, background, blob_images, full)
+    # The corner buttons sit on top of the blobs
+    if name == "storyline":
+        draw_back_button()
+        dirty_rects.append(back_button_rect)
+    draw_mute_button()
+    dirty_rects.append(mute_button_rect)
+    return dirty_rects
+
+# === STATIC LAYERS ===
+# Each screen's unchanging background, drawn once per theme and then blitted in one go
+static_layers = {}
+
+def get_static_layer(name, draw_function):
+    """
+    Returns the cached background layer for a screen, drawing it the first time it is needed.
+
+    Parameters:
+        name (str): The screen the layer belongs to.
+        draw_function (function): Draws the layer's contents onto screen.
+
+    Returns:
+        pygame.Surface: A full-window surface holding the static parts of the screen.
+    """
+    global screen
+    key = (name, current_theme)
+    if key not in static_layers:
+        # Point screen at an offscreen surface so the normal draw functions paint the layer
+        display = screen
+        screen = pygame.Surface((screen_width, screen_height)).convert()
+        try:
+            draw_function()
+        finally:
+            static_layers[key], screen = screen, display
+    return static_layers[key]
+
+def draw_tutorial_background():
+    """Draws the parts of the tutorial screen that stay the same for every step."""
+    screen.fill(themes[current_theme])
+    draw_text_centered("Blobbo Tutorial", 100, font)
+    screen.blit(blobbo_img, (screen_width // 2 - 40, 300))
+    draw_text_centered("Click to continue tutorial", 450, font_2)
+    draw_back_button()
 
 # === STORYLINE SCREEN ===
 
-def draw_storyline_screen():
+def draw_storyline_background():
     """
-    Draws the storyline screen with a background box and storyline text.
     Fills the screen with the current theme color and draws the storyline text inside a box.
     """
     screen.fill(themes[current_theme])
@@ -365,11 +864,225 @@ def draw_storyline_screen():
     x_offset = 0   
     for i, line in enumerate(story_lines):
         font_used = font if i == 0 else font_2
-        rendered = font_used.render(line, True, WHITE)
+        rendered = text_cache.render(font_used, line, True, WHITE)
         rect = rendered.get_rect(center=(screen_width // 2 + x_offset, y))
         screen.blit(rendered, rect)
         y += 40
 
+# === SIMULATION SCREEN ===
+
+# Area holding the generation label, progress bar and loop message, between the back and mute buttons
+generation_area = pygame.Rect(back_button_rect.right + 10, 20, mute_button_rect.left - back_button_rect.right - 20, 92)
+drawn_generation = None # generation_bar_state() currently shown on screen
+drawn_mute_state = None # Mute state currently shown on screen
+
+def draw_generation_bar():
+    """
+    Draws the generation number and the progress bar over a cleared background.
+
+    Returns:
+        pygame.Rect: The screen area that was redrawn.
+    """
+    screen.blit(get_static_layer("simulation", draw_simulation_background), generation_area, generation_area)
+    draw_text_centered(f"Generation: {core.generation}", 40, font_1)
+
+    # Draw progress bar
+    bar_x = side_margin
+    bar_y = 70
+    bar_width = screen_width - 2 * side_margin
+    bar_height = 10
+    pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height))
+
+    # Compute progress: 1–20 fills the bar fully
+    # So gen 1 = 1/20 filled, gen 2 = 2/20 filled, ..., gen 20 = full bar
+    progress_position = core.generation % 20
+    if progress_position == 0 and core.generation != 0:
+        progress_position = 20  # Full bar at generation 20, 40, etc.
+
+    filled_width = int((progress_position / 20) * bar_width)
+    pygame.draw.rect(screen, (255, 105, 180), (bar_x, bar_y, filled_width, bar_height))
+
+    # In replay mode, show where we are in the recording instead
+    period = core.cycle_detector.period
+    if replay_reader is not None:
+        draw_text_centered(f"Replay: frame {replay_frame + 1} of {len(replay_reader)} (P to exit)", 100, font_2)
+    elif period == 1:
+        draw_text_centered(f"The blobs settled down at generation {core.cycle_detector.start}!", 100, font_2)
+    elif period is not None:
+        draw_text_centered(f"The blobs repeat every {period} generations!", 100, font_2)
+    return generation_area
+
+def generation_bar_state():
+    """
+    Returns:
+        tuple: Everything the generation bar shows, so it is only redrawn when this changes.
+    """
+    replay = replay_frame if replay_reader is not None else None
+    return (core.generation, core.cycle_detector.period, replay)
+
+def draw_cell(r, c):
+    """
+    Redraws a single grid cell over a cleared background, for zooms where cells are blob images.
+
+    Parameters:
+        r (int): Row index of the cell.
+        c (int): Column index of the cell.
+
+    Returns:
+        pygame.Rect: The screen area that was redrawn.
+    """
+    i = r * core.grid_width + c
+    rect = cell_rect(r, c)
+    screen.set_clip(board_view)
+    screen.blit(get_static_layer("simulation", draw_simulation_background), rect, rect)
+    if core.alive[i]:
+        screen.blit(blob_images_for(rect.width)[core.variants[i]], rect.topleft)
+    pygame.draw.rect(screen, WHITE, rect, 1)
+    screen.set_clip(None)
+    return rect.clip(board_view)
+
+def draw_simulation_background():
+    """Draws the parts of the simulation screen that never change: the back button and the controls and rules text."""
+    screen.fill(themes[current_theme])
+    draw_back_button()
+
+    # Display control instructions on the right side of the screen
+    draw_text("Controls:", screen_width - 280, 120, font_2)
+    draw_text("Space: Pause/Resume", screen_width - 280, 150, font_2)
+    draw_text("R: Randomize", screen_width - 280, 170, font_2)
+    draw_text("Left Arrow: Step Back (hold)", screen_width - 280, 190, font_2)
+    draw_text("Backspace: Reset Grid", screen_width - 280, 210, font_2)
+    draw_text("1: Heart Template", screen_width - 280, 230, font_2)
+    draw_text("2: Smiley Template", screen_width - 280, 250, font_2)
+    draw_text("3: Letter A Template", screen_width - 280, 270, font_2)
+    draw_text("Click to toggle blobs", screen_width - 280, 290, font_2)
+    draw_text("Right Arrow: Next Generation", screen_width - 280, 310, font_2)
+    draw_text("S: Speed Up Generations", screen_width - 280, 330, font_2)
+    draw_text("T: Turbo  L: Pause on Loops", screen_width - 280, 350, font_2)
+    draw_text(f"F: Skip {skip_amount} Generations", screen_width - 280, 370, font_2)
+    draw_text("Mute/Unmute Music", screen_width - 280, 390, font_2)
+    draw_text("Click to place blobs", screen_width - 280, 420, font_2)
+    draw_text("C: Record  P: Replay", screen_width - 280, 450, font_2)
+    draw_text("F3: Profiler  F4: CSV Trace", screen_width - 280, 470, font_2)
+    draw_text("Wheel: Zoom  Right Drag: Pan", screen_width - 280, 490, font_2)
+
+    # Display the rules for Blob Life on the left side of the screen
+    draw_text("Blob Life Rules:", 10, 120, font)
+    if core.rule == core.rules.CONWAY:
+        draw_text("Lonely blob? It poofs!", 10, 180, font_2)
+        draw_text("(0-1 friends)", 10, 200, font_2)
+        draw_text("Happy blob? It stays!", 10, 225, font_2)
+        draw_text("(2-3 friends)", 10, 245, font_2)
+        draw_text("Crowded blob? It poofs!", 10, 270, font_2)
+        draw_text("(4+ friends)", 10, 290, font_2)
+        draw_text("New blob? 3 nearby friends!", 10, 315, font_2)
+    else:
+        # Another rule picked with --rule, described by its friend counts
+        stays = ", ".join(map(str, sorted(core.rule.survival)))
+        born = ", ".join(map(str, sorted(core.rule.birth)))
+        draw_text(f"Playing {core.rule.name}", 10, 180, font_2)
+        draw_text("Happy blob? It stays!", 10, 225, font_2)
+        draw_text(f"({stays} friends)" if stays else "(never, every blob poofs)", 10, 245, font_2)
+        draw_text("New blob? Nearby friends:", 10, 270, font_2)
+        draw_text(f"({born})", 10, 290, font_2)
+
+def draw_simulation_screen(full):
+    """
+    Draws the simulation screen, redrawing only the cells and widgets that changed.
+    The whole screen is redrawn when it was just opened or the whole grid was replaced.
+
+    Parameters:
+        full (bool): True to redraw everything regardless of what changed.
+
+    Returns:
+        list: The screen rectangles that need to be pushed to the display.
+    """
+    global drawn_generation, drawn_mute_state, camera_moved
+    background = get_static_layer("simulation", draw_simulation_background)
+    changed = core.take_changed_cells()
+    if full or changed is None:
+        screen.blit(background, (0, 0))
+        draw_generation_bar()
+        profiler.lap("text")
+        draw_cells()
+        camera_moved = False
+        profiler.lap("cells")
+        draw_mute_button()
+        profiler.lap("text")
+        drawn_generation = generation_bar_state()
+        drawn_mute_state = is_muted
+        return [screen.get_rect()]
+
+    # Zoomed in, only the changed cells that are on screen are redrawn; otherwise the whole view
+    first_row, end_row, first_col, end_col = visible_cells() if camera_zoom() >= IMAGE_ZOOM else (0, 0, 0, 0)
+    on_screen = [(r, c) for r, c in changed if first_row <= r < end_row and first_col <= c < end_col]
+    if camera_moved or (changed and camera_zoom() < IMAGE_ZOOM):
+        dirty_rects = [draw_board_view()]
+    else:
+        dirty_rects = [draw_cell(r, c) for r, c in on_screen]
+    profiler.lap("cells")
+    if generation_bar_state() != drawn_generation:
+        dirty_rects.append(draw_generation_bar())
+        drawn_generation = generation_bar_state()
+    if is_muted != drawn_mute_state:
+        screen.blit(background, mute_button_rect, mute_button_rect)
+        draw_mute_button()
+        dirty_rects.append(mute_button_rect)
+        drawn_mute_state = is_muted
+    profiler.lap("text")
+    return dirty_rects
+
+# === PROFILER OVERLAY ===
+
+def render_profiler_overlay():
+    """
+    Draws the profiler's current numbers onto a new overlay surface.
+
+    Returns:
+        pygame.Surface: A translucent panel the size of profiler_rect.
+    """
+    panel = pygame.Surface(profiler_rect.size, pygame.SRCALPHA)
+    panel.fill((0, 0, 0, 190))
+    frame_average, frame_p99 = profiler.stats("frame")
+    lines = [
+        f"FPS {profiler.fps():5.1f} / 60   Gen/s {profiler.generations_per_second():6.1f}",
+        f"Frame  avg {frame_average:6.2f}  p99 {frame_p99:6.2f} ms",
+    ]
+    for phase in PHASES:
+        average, p99 = profiler.stats(phase)
+        lines.append(f"{phase:<11} {average:6.2f}  {p99:6.2f}")
+    lines.append(f"F4 trace: {'recording' if profiler.tracing else 'off'}")
+
+    y = 8
+    for line in lines:
+        panel.blit(profiler_font.render(line, True, WHITE), (8, y))
+        y += 18
+    return panel
+
+def draw_profiler_overlay(full):
+    """
+    Draws the profiler overlay, re-rendering its numbers a few times a second.
+
+    Parameters:
+        full (bool): True if the area under the overlay was just redrawn, so it must be drawn again.
+
+    Returns:
+        pygame.Rect: The overlay area if it was drawn this frame, otherwise None.
+    """
+    global profiler_surface, last_profiler_refresh
+    now = pygame.time.get_ticks()
+    refreshed = profiler_surface is None or now - last_profiler_refresh >= profiler_refresh_ms
+    if refreshed:
+        profiler_surface = render_profiler_overlay()
+        last_profiler_refresh = now
+    if not (refreshed or full):
+        return None
+    if screen_state == "simulation":
+        # The panel is translucent, so clear what the previous panel left behind
+        screen.blit(get_static_layer("simulation", draw_simulation_background), profiler_rect, profiler_rect)
+    screen.blit(profiler_surface, profiler_rect)
+    return profiler_rect
+
 # === MESSAGE HANDLING ===
 
 def show_message_and_wait(message):
@@ -395,230 +1108,307 @@ def show_message_and_wait(message):
 
 
 # --- Main Game Loop ---
-running = True
-while running:
-    # Fill the screen with the current theme color
-    screen.fill(themes[current_theme])
-    
-    # Handle all incoming events (like mouse clicks and key presses)
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False # Exits the game loop if window is closed
-
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            mx, my = pygame.mouse.get_pos() # Gets current mouse click position
-
-            # Checks if the mute button is clicked
-            if mute_button_rect.collidepoint(mx, my):
-                is_muted = not is_muted # Toggle mute state
-                pygame.mixer.music.set_volume ((0 if is_muted else 1))  # Mute or unmute music
-
-            # Back button returns to start menu from certain screens
-            elif back_button_rect.collidepoint(mx, my):
-                if screen_state in ["tutorial", "storyline", "simulation"]:
-                    screen_state = "start_menu"
-
-            # Handles clicks on the start page's start button and sends to theme selection
-            elif screen_state == "start_page":
-                if start_button_rect.collidepoint(mx,my):
-                    screen_state = "theme_select"
-
-            # Handles the theme selection screen
-            elif screen_state == "theme_select":
-                y_offset = 180
-                for i, theme in enumerate(themes):
-                    # Checks if the mouse is over a theme button
-                    if y_offset + i * 40 <= my <= y_offset + (i+1) * 40:
-                        current_theme = theme # Change theme
-                        screen_state = "start_menu" # Go to the main menu
-
-            # Main menu buttons
-            elif screen_state == "start_menu":
-                if tutorial_button_rect.collidepoint(mx, my):
-                    screen_state = "tutorial"
-                    tutorial_step = 0 # Reset tutorial step
-                elif storyline_button_rect.collidepoint(mx, my):
-                    screen_state = "storyline"
-                elif play_button_rect.collidepoint(mx, my):
-                    screen_state = "simulation"
-                    # Initialize new grid when entering simulation
-                    grid = [[Cell(r, c) for c in range(grid_width)] for r in range(grid_height)]
-                    generation = 0
-                    simulation_running = False
-                elif theme_button_rect.collidepoint(mx, my):
-                    screen_state = "theme_select"
-
-            # Tutorial steps advance on click
-            elif screen_state == "tutorial":
-                if tutorial_step < len(tutorial_messages) - 1:
-                    tutorial_step += 1
-                else:
-                    screen_state = "simulation"
-                    # Initialize new grid when entering simulation
-                    grid = [[Cell(r, c) for c in range(grid_width)] for r in range(grid_height)]
-                    generation = 0
-                    simulation_running = False
-
-            # Simulation blob toggling on click
-            elif screen_state == "simulation":
-                mx, my = event.pos
-                col = (mx - side_margin) // cell_size
-                row = (my - top_margin) // cell_size
-                if 0 <= row < grid_height and 0 <= col < grid_width:
-                    grid[row][col].toggle(blob_images)
-
-        elif event.type == pygame.KEYDOWN:
-            if screen_state == "simulation":
-                # Spacebar toggles simulation play/pause
-                if event.key == pygame.K_SPACE:
-                    simulation_running = not simulation_running
-                    just_paused = not simulation_running  # Tracks if just paused
-                
-                if not simulation_running:
-                    # R randomizes the grid cells
-                    if event.key == pygame.K_r:
-                        randomize_grid()
-                    # Left arrow resets the grid to all dead blobs
-                    elif event.key == pygame.K_LEFT:
-                        grid = [[Cell(r, c) for c in range(grid_width)] for r in range(grid_height)]
-                        generation = 0
-                        simulation_running = False
-                    # Right arrow advances to the next generation
-                    elif event.key == pygame.K_RIGHT:
-                        if not simulation_running:
-                            next_generation()
-                    # Applies predefined templates based on key presses
-                    elif event.key == pygame.K_1:
-                        apply_template("Heart")
-                    elif event.key == pygame.K_2:
-                        apply_template("Smiley")
-                    elif event.key == pygame.K_3:
-                        apply_template("Letter A")
-
-    # --- Drawing UI and game elements based on current state ---
-    
-    # Start page
-    if screen_state == "start_page":
-        draw_start_page()
-        animate_blobs()
-        draw_mute_button()
-
-    # Theme selection screen
-    elif screen_state == "theme_select":
-        animate_blobs()
-        draw_text_centered("Choose Your Theme!", 100, font)
-        for i, theme in enumerate(themes):
-            # Draws button with contrasting text color if theme is black
-            if themes[theme] == BLACK:
-                draw_template_button(theme, pygame.Rect(400, 180 + i * 40, 300, 40), (255,255,255))
-            else:
-                draw_template_button(theme, pygame.Rect(400, 180 + i * 40, 300, 40), themes[theme])
-        draw_mute_button()
+# Only runs when the game is started directly, so tools can import the drawing functions
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Blob Life.")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long the window, the first frame and the assets took to appear")
+    parser.add_argument("--rule", default="B3/S23",
+                        help="life-like rule as B/S notation (e.g. B36/S23) or a name like HighLife or Seeds")
+    parser.add_argument("--menu-blobs", type=int, default=len(menu_blobs),
+                        help="number of blobs moving across the menu screens")
+    args = parser.parse_args()
+    try:
+        core.set_rule(args.rule)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.menu_blobs != len(menu_blobs):
+        menu_blobs = SpriteField(args.menu_blobs, screen_width, screen_height, len(blob_images))
+
+    running = True
+    drawn_screen_state = None # Screen state drawn on the previous frame
+    assets_reported = not args.profile_startup # Whether the asset load times still need printing
+    while running:
+        # The board is only changed and drawn while holding the worker's lock, so the
+        # background simulation cannot swap in a generation halfway through a frame.
+        # The worker computes generations without the lock, so this wait is short.
+        simulation_worker.lock.acquire()
+        profiler.lap("lock")
+        install_loaded_assets()
+
+        # Handle all incoming events (like mouse clicks and key presses)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False # Exits the game loop if window is closed
 
-    # Main menu
-    elif screen_state == "start_menu":
-        animate_blobs()
-        draw_text_centered("Welcome to Blob Life!", 100, font)
-        draw_text_centered("Game of Life with a Blob Twist!", 160, font_1)
-        # Defines button rectangles for each menu option
-        tutorial_button_rect = pygame.Rect(400, 200, 300, 40)
-        storyline_button_rect = pygame.Rect(400, 270, 300, 40)
-        play_button_rect = pygame.Rect(400, 340, 300, 40)
-        theme_button_rect = pygame.Rect(400, 410, 300, 40)
-        # Draws buttons for each option
-        draw_button("Tutorial", tutorial_button_rect)
-        draw_button("Storyline", storyline_button_rect)
-        draw_button("Play", play_button_rect)
-        draw_button("Theme Select", theme_button_rect)
-        draw_mute_button()
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                mx, my = pygame.mouse.get_pos() # Gets current mouse click position
+
+                # Checks if the mute button is clicked
+                if mute_button_rect.collidepoint(mx, my):
+                    is_muted = not is_muted # Toggle mute state
+                    pygame.mixer.music.set_volume ((0 if is_muted else 1))  # Mute or unmute music
+
+                # Back button returns to start menu from certain screens
+                elif back_button_rect.collidepoint(mx, my):
+                    if screen_state in ["tutorial", "storyline", "simulation"]:
+                        screen_state = "start_menu"
+
+                # Handles clicks on the start page's start button and sends to theme selection
+                elif screen_state == "start_page":
+                    if start_button_rect.collidepoint(mx,my):
+                        screen_state = "theme_select"
+
+                # Handles the theme selection screen
+                elif screen_state == "theme_select":
+                    y_offset = 180
+                    for i, theme in enumerate(themes):
+                        # Checks if the mouse is over a theme button
+                        if y_offset + i * 40 <= my <= y_offset + (i+1) * 40:
+                            current_theme = theme # Change theme
+                            screen_state = "start_menu" # Go to the main menu
+
+                # Main menu buttons
+                elif screen_state == "start_menu":
+                    if tutorial_button_rect.collidepoint(mx, my):
+                        screen_state = "tutorial"
+                        tutorial_step = 0 # Reset tutorial step
+                    elif storyline_button_rect.collidepoint(mx, my):
+                        screen_state = "storyline"
+                    elif play_button_rect.collidepoint(mx, my):
+                        screen_state = "simulation"
+                        # Initialize new grid when entering simulation
+                        core.clear_grid()
+                        simulation_running = False
+                    elif theme_button_rect.collidepoint(mx, my):
+                        screen_state = "theme_select"
+
+                # Tutorial steps advance on click
+                elif screen_state == "tutorial":
+                    if tutorial_step < len(tutorial_messages) - 1:
+                        tutorial_step += 1
+                    else:
+                        screen_state = "simulation"
+                        # Initialize new grid when entering simulation
+                        core.clear_grid()
+                        simulation_running = False
 
-    # Tutorial screen
-    elif screen_state == "tutorial":
-        draw_text_centered("Blobbo Tutorial", 100, font)
-        draw_text_centered(tutorial_messages[tutorial_step], 200, font_2)
-        screen.blit(blobbo_img, (screen_width // 2 - 40, 300))
-        draw_text_centered("Click to continue tutorial", 450, font_2)
-        draw_back_button()
-        draw_mute_button()
+                # Simulation blob toggling on left click (the other buttons pan and zoom)
+                elif screen_state == "simulation" and event.button == 1:
+                    cell = cell_at(event.pos)
+                    if cell is not None:
+                        core.toggle_cell(*cell)
+
+            # The mouse wheel zooms the simulation view in and out around the pointer
+            elif event.type == pygame.MOUSEWHEEL:
+                if screen_state == "simulation":
+                    zoom_camera(event.y, pygame.mouse.get_pos())
+
+            # Dragging with the right or middle button pans the simulation view
+            elif event.type == pygame.MOUSEMOTION:
+                if screen_state == "simulation" and (event.buttons[1] or event.buttons[2]):
+                    pan_camera(*event.rel)
+
+            # Dropping a pattern file (.rle, .cells, .lif) on the paused simulation loads it onto the grid
+            elif event.type == pygame.DROPFILE:
+                if screen_state == "simulation" and not simulation_running:
+                    try:
+                        pattern = pattern_loader.load_pattern(event.file)
+                    except (OSError, ValueError) as error:
+                        print(f"Could not load pattern {event.file}: {error}")
+                    else:
+                        # The pattern replaces the replayed board, whose frames may no longer fit it
+                        if replay_reader is not None:
+                            stop_replay()
+                        # Patterns bigger than the board get a bigger board, with room to grow
+                        if pattern.width > core.grid_width or pattern.height > core.grid_height:
+                            stop_recording()
+                            core.set_grid_size(max(core.grid_width, pattern.width + 20), max(core.grid_height, pattern.height + 20))
+                            fit_camera()
+                        core.place_pattern(pattern)
+
+            elif event.type == pygame.KEYDOWN:
+                # F3 shows or hides the profiler overlay on any screen
+                if event.key == pygame.K_F3:
+                    show_profiler = not show_profiler
+                    drawn_screen_state = None # Redraw everything so the overlay appears or disappears cleanly
+                # F4 starts or stops writing the per-frame CSV trace
+                elif event.key == pygame.K_F4:
+                    if profiler.tracing:
+                        profiler.stop_trace()
+                    else:
+                        profiler.start_trace(trace_path)
+
+                # Replay mode has its own keys; the arrows are read every frame to scrub
+                if screen_state == "simulation" and replay_reader is not None:
+                    if event.key == pygame.K_p:
+                        stop_replay()
+                    elif event.key == pygame.K_SPACE:
+                        replay_playing = not replay_playing
+                    elif event.key == pygame.K_HOME:
+                        replay_frame = 0
+                    elif event.key == pygame.K_END:
+                        replay_frame = len(replay_reader) - 1
+                    elif event.key == pygame.K_PAGEUP:
+                        replay_frame = max(replay_frame - replay_jump, 0)
+                    elif event.key == pygame.K_PAGEDOWN:
+                        replay_frame = min(replay_frame + replay_jump, len(replay_reader) - 1)
+
+                elif screen_state == "simulation":
+                    # C starts or stops recording every generation to a file
+                    if event.key == pygame.K_c:
+                        if recorder is None:
+                            start_recording()
+                        else:
+                            stop_recording()
+
+                    # Spacebar toggles simulation play/pause
+                    if event.key == pygame.K_SPACE:
+                        simulation_running = not simulation_running
+                        just_paused = not simulation_running  # Tracks if just paused
+                    # T switches turbo mode, which runs generations as fast as possible
+                    elif event.key == pygame.K_t:
+                        turbo_mode = not turbo_mode
+                    # L switches pausing when the blobs settle into a loop
+                    elif event.key == pygame.K_l:
+                        pause_on_cycle = not pause_on_cycle
+                
+                    if not simulation_running:
+                        # R randomizes the grid cells
+                        if event.key == pygame.K_r:
+                            core.randomize_grid()
+                        # Left arrow steps back a generation; holding it keeps rewinding
+                        elif event.key == pygame.K_LEFT:
+                            step_back()
+                            rewind_hold_start = pygame.time.get_ticks()
+                        # Backspace resets the grid to all dead blobs
+                        elif event.key == pygame.K_BACKSPACE:
+                            core.clear_grid()
+                            simulation_running = False
+                        # Right arrow advances to the next generation
+                        elif event.key == pygame.K_RIGHT:
+                            if not simulation_running:
+                                advance_generation()
+                        # F fast-forwards many generations at once
+                        elif event.key == pygame.K_f:
+                            advance_generation(skip_amount)
+                        # P replays the recording, with the arrows scrubbing through it
+                        elif event.key == pygame.K_p:
+                            start_replay()
+                        # Applies predefined templates based on key presses
+                        elif event.key == pygame.K_1:
+                            core.apply_template("Heart")
+                        elif event.key == pygame.K_2:
+                            core.apply_template("Smiley")
+                        elif event.key == pygame.K_3:
+                            core.apply_template("Letter A")
+
+        profiler.lap("events")
+
+        # --- Drawing UI and game elements based on current state ---
+
+        # Each screen returns the parts of the window it changed; menus only redraw around their moving blobs
+        full_redraw = drawn_screen_state != screen_state
+
+        # Start page
+        if screen_state == "start_page":
+            dirty_rects = draw_menu_screen("start_page", draw_start_page, menu_keep_out, full_redraw)
+
+        # Theme selection screen
+        elif screen_state == "theme_select":
+            dirty_rects = draw_menu_screen("theme_select", draw_theme_select_background, menu_keep_out, full_redraw)
+
+        # Main menu
+        elif screen_state == "start_menu":
+            dirty_rects = draw_menu_screen("start_menu", draw_start_menu_background, menu_keep_out, full_redraw)
+
+        # Tutorial screen
+        elif screen_state == "tutorial":
+            screen.blit(get_static_layer("tutorial", draw_tutorial_background), (0, 0))
+            draw_text_centered(tutorial_messages[tutorial_step], 200, font_2)
+            draw_mute_button()
+            dirty_rects = [screen.get_rect()]
     
-    # Storyline screen
-    elif screen_state == "storyline":
-        draw_storyline_screen()
-        animate_storyline_blobs()
-        draw_back_button()
-        draw_mute_button()
-
-    # Simulation screen
-    elif screen_state == "simulation":
-        # Display generation number and progress bar
-        draw_text_centered(f"Generation: {generation}", 40, font_1)
-        
-        # Draw progress bar
-        bar_x = side_margin
-        bar_y = 70
-        bar_width = screen_width - 2 * side_margin
-        bar_height = 10
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height))
-
-        # Compute progress: 1–20 fills the bar fully
-        # So gen 1 = 1/20 filled, gen 2 = 2/20 filled, ..., gen 20 = full bar
-        progress_position = generation % 20
-        if progress_position == 0 and generation != 0:
-            progress_position = 20  # Full bar at generation 20, 40, etc.
-
-        filled_width = int((progress_position / 20) * bar_width)
-        pygame.draw.rect(screen, (255, 105, 180), (bar_x, bar_y, filled_width, bar_height))
-
-        # Draw all cells (blobs) on the grid
-        draw_cells()
-        draw_back_button()
-        draw_mute_button()
-        
-        # Display control instructions on the right side of the screen
-        draw_text("Controls:", screen_width - 280, 120, font_2)
-        draw_text("Space: Pause/Resume", screen_width - 280, 150, font_2)
-        draw_text("R: Randomize", screen_width - 280, 170, font_2)
-        draw_text("Left Arrow: Reset Grid", screen_width - 280, 190, font_2)
-        draw_text("1: Heart Template", screen_width - 280, 210, font_2)
-        draw_text("2: Smiley Template", screen_width - 280, 230, font_2)
-        draw_text("3: Letter A Template", screen_width - 280, 250, font_2)
-        draw_text("Click to toggle blobs", screen_width - 280, 270, font_2)
-        draw_text("Right Arrow: Next Generation", screen_width - 280, 290, font_2)
-        draw_text("S: Speed Up Generations", screen_width - 280, 310, font_2)
-        draw_text("Mute/Unmute Music", screen_width - 280, 330, font_2)
-        draw_text("Click to place blobs", screen_width - 280, 360, font_2)
-        
-        # Display the rules for Blob Life on the left side of the screen
-        draw_text("Blob Life Rules:", 10, 120, font)
-        draw_text("Lonely blob? It poofs!", 10, 180, font_2)
-        draw_text("(0-1 friends)", 10, 200, font_2)
-        draw_text("Happy blob? It stays!", 10, 225, font_2)
-        draw_text("(2-3 friends)", 10, 245, font_2)
-        draw_text("Crowded blob? It poofs!", 10, 270, font_2)
-        draw_text("(4+ friends)", 10, 290, font_2)
-        draw_text("New blob? 3 nearby friends!", 10, 315, font_2)
-
-        # Check if 'S' key pressed to speed up generations
-        keys = pygame.key.get_pressed()
-        generation_interval = fast_interval if keys[pygame.K_s] else default_interval
-
-        # Update generations if running and interval time has passed
-        current_time = pygame.time.get_ticks()
-        if simulation_running and (current_time - last_update_time >= generation_interval):
-            next_generation()
-
-            # Stop simulation if all blobs are dead
-            if all_blobs_dead():
+        # Storyline screen
+        elif screen_state == "storyline":
+            dirty_rects = draw_menu_screen("storyline", draw_storyline_background, storyline_keep_out, full_redraw)
+
+        # Simulation screen
+        elif screen_state == "simulation":
+            # In replay mode, move to the frame picked with the keys before drawing it
+            if replay_reader is not None:
+                update_replay(pygame.key.get_pressed())
+
+            # Holding Left while paused rewinds one generation per frame
+            elif not simulation_running and rewind_hold_start is not None:
+                if not pygame.key.get_pressed()[pygame.K_LEFT]:
+                    rewind_hold_start = None
+                elif pygame.time.get_ticks() - rewind_hold_start >= rewind_hold_delay:
+                    step_back()
+
+            # Only the parts that changed are drawn unless the screen was just opened
+            dirty_rects = draw_simulation_screen(full=full_redraw)
+
+            # Check if 'S' key pressed to speed up generations
+            keys = pygame.key.get_pressed()
+            generation_interval = fast_interval if keys[pygame.K_s] else default_interval
+
+            # Play sounds for the generations the worker finished since the last frame
+            generations, births, finished, step_time = simulation_worker.take_results()
+            profiler.count_generations(generations)
+            profiler.add_time("worker", step_time)
+            play_birth_sounds(births, generations)
+
+            # The worker pauses itself once the blobs die out or settle into a loop
+            if simulation_running and finished:
                 simulation_running = False
-                show_message_and_wait("Oh no! All the blobs have vanished!")
-                # Reset grid and generation
-                grid = [[Cell(r, c) for c in range(grid_width)] for r in range(grid_height)]
-                generation = 0
-
-            last_update_time = current_time
-
-    # Refresh the display to show the updated screen with everything drawn
-    pygame.display.flip()
-    clock.tick(60) # Limit to 60 frames per second
-
-pygame.quit() # Cleanly exits pygame
+                # Stop simulation if all blobs are dead
+                if core.all_blobs_dead():
+                    show_message_and_wait("Oh no! All the blobs have vanished!")
+                    # Reset grid and generation
+                    core.clear_grid()
+
+        if screen_state != "simulation":
+            profiler.lap("menus")
+
+        # Generations only run in the background while the simulation screen is open and playing
+        if screen_state == "simulation" and simulation_running:
+            simulation_worker.resume(None if turbo_mode else 1000 / generation_interval)
+        else:
+            simulation_worker.pause()
+        simulation_worker.lock.release()
+
+        # Profiler overlay goes on top of everything else
+        if show_profiler:
+            full_frame = screen_state != "simulation" or screen.get_rect() in dirty_rects
+            overlay_rect = draw_profiler_overlay(full_frame)
+            if overlay_rect:
+                dirty_rects.append(overlay_rect)
+            profiler.lap("overlay")
+
+        # Refresh the display to show the parts of the screen that changed
+        pygame.display.update(dirty_rects) # Nothing is pushed while the board is idle
+        profiler.lap("flip")
+        drawn_screen_state = screen_state
+
+        # Assets only start loading once the first frame is on screen, so they never delay it
+        if not asset_loader.started:
+            load_assets()
+            if args.profile_startup:
+                print(f"Startup: window after {(window_ready - startup_start) * 1000:.0f} ms, "
+                      f"first frame after {(time.perf_counter() - startup_start) * 1000:.0f} ms")
+        elif not assets_reported and asset_loader.finished:
+            times = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in asset_loader.timings.items())
+            print(f"Startup: assets ready after {(time.perf_counter() - startup_start) * 1000:.0f} ms ({times})")
+            for name, error in asset_loader.errors.items():
+                print(f"Startup: could not load {name}: {error}")
+            assets_reported = True
+        clock.tick(60) # Limit to 60 frames per second
+        profiler.lap("wait")
+        profiler.end_frame()
+
+    simulation_worker.close()
+    stop_recording()
+    profiler.stop_trace()
+
+    pygame.quit() # Cleanly exits pygame
@@ -1,12 +1,15 @@
 # --- Imports ---
-import pygame
 import random
+from rules import CONWAY # The default rule, B3/S23
 
 class Cell:
     """
     Represents a single in the grid for Blob Life Game.
     Each cell can be alive or dead, and it can toggle its state.
+    The board itself is stored as byte planes in blob_life_core; a Cell is a small
+    view of one position, used where code wants to work with a single cell.
     """
+    __slots__ = ("row", "col", "alive", "image")
 
     def __init__(self, row, col):
         """
@@ -33,26 +36,27 @@ class Cell:
         else:
             self.image = None
 
-    def update_state(self, neighbors, blob_images, current_image):
+    def update_state(self, neighbors, blob_images, current_image, rule=CONWAY):
         """
-        Updates the cell's state based on the number of alive neighbor using Conway's Game of Life rules.
+        Updates the cell's state based on the number of alive neighbor using a life-like rule.
         
         Parameters:
             neighbors (int): The number of alive neighbors surrounding this cell.
             blob_images (list): List of images to choose from when the cell becomes alive.
             current_image: The current image of the cell if it is alive.
+            rule (rules.Rule): The rule to follow (default is Conway's: born with 3, survives with 2 or 3).
         """
         if self.alive:
-            # Stays alive with 2 or 3 neighbors, dies otherwise
-            if neighbors in [2, 3]:
+            # Stays alive with a survival count (2 or 3 for Conway), dies otherwise
+            if rule.table[9 + neighbors]:
                 self.alive = True
                 self.image = current_image  # Keep the same blob
             else:
                 self.alive = False
                 self.image = None
         else:
-            # Becomes alive with exactly 3 neighbors
-            if neighbors == 3:
+            # Becomes alive with a birth count (exactly 3 for Conway)
+            if rule.table[neighbors]:
                 self.alive = True
                 self.image = random.choice(blob_images)
             else:
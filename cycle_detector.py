@@ -0,0 +1,76 @@
+# cycle_detector.py
+# Description: Notices when a Blob Life board starts repeating itself (a still life,
+# a blinker, or any other loop) by remembering short hashes of recent boards.
+
+# === IMPORTS ===
+import hashlib
+from collections import deque
+
+
+def board_digest(state):
+    """
+    Parameters:
+        state (bytes-like): The packed board, e.g. an alive plane.
+
+    Returns:
+        bytes: The 16-byte digest CycleDetector remembers the board by.
+    """
+    return hashlib.blake2b(state, digest_size=16).digest()
+
+
+class CycleDetector:
+    """
+    Keeps a rolling window of board hashes and reports the first repeat.
+    Each board is reduced to a 16-byte BLAKE2 digest, so memory stays small even for
+    huge boards and an accidental match is practically impossible.
+    """
+
+    def __init__(self, max_history=256):
+        """
+        Create a detector with no history.
+
+        Parameters:
+            max_history (int): How many recent boards to remember. Loops longer than this are not found.
+        """
+        self.max_history = max_history
+        self.reset()
+
+    def reset(self):
+        """Forget every remembered board, e.g. after the user edits the grid."""
+        self._seen = {}         # digest -> generation it was seen at
+        self._order = deque()   # digests from oldest to newest
+        self.period = None      # Length of the loop once one is found
+        self.start = None       # Generation where the loop started
+
+    def observe(self, state, generation, digest=None):
+        """
+        Records a board and checks whether it has been seen before.
+
+        Parameters:
+            state (bytes-like): The packed board, e.g. an alive plane.
+            generation (int): The generation the board belongs to.
+            digest (bytes): board_digest(state) if it was already worked out, e.g. on
+                            another thread (default is None, which hashes the board here).
+
+        Returns:
+            bool: True if the board repeats an earlier one; period and start are then set.
+        """
+        if self.period is not None:
+            return True # Once a loop is found the board stays in it until reset()
+        if digest is None:
+            digest = board_digest(state)
+        first_seen = self._seen.get(digest)
+        if first_seen is not None:
+            self.period = generation - first_seen
+            self.start = first_seen
+            return True
+
+        self._seen[digest] = generation
+        self._order.append(digest)
+        if len(self._order) > self.max_history:
+            del self._seen[self._order.popleft()]
+        return False
+
+    def __len__(self):
+        """int: Number of boards currently remembered."""
+        return len(self._order)
@@ -0,0 +1,143 @@
+# frame_profiler.py
+# Description: Low-overhead timers for the game loop. Splits every frame into phases
+# (events, generation, drawing, sound, flip...), keeps rolling statistics for an on-screen
+# overlay and can write one CSV row per frame to profile long sessions.
+
+# === IMPORTS ===
+import csv
+import time
+from collections import deque
+
+# === PHASES ===
+# Every frame is split into these phases, in the order they are shown and written.
+# "lock" is waiting for the simulation worker to let go of the board, "menus" is drawing
+# on every screen except the simulation, and "wait" is the time clock.tick() sleeps to hold
+# the frame rate. "worker" is not part of the frame: it is the time the simulation worker
+# spent computing generations on its own thread while the frame ran.
+PHASES = ["lock", "events", "generation", "cells", "text", "menus", "sound", "overlay", "flip", "wait", "worker"]
+
+
+class FrameProfiler:
+    """
+    Times each phase of a frame with lap() calls: the time since the previous lap is added
+    to the named phase. A phase can be lapped several times in one frame and its times add up.
+    Finished frames are kept in a rolling window for averages and p99, and are optionally
+    written to a CSV trace file.
+    """
+
+    def __init__(self, window=120):
+        """
+        Create a profiler with no recorded frames.
+
+        Parameters:
+            window (int): How many recent frames the rolling statistics cover.
+        """
+        self.window = window
+        self.history = {phase: deque(maxlen=window) for phase in PHASES + ["frame"]}
+        self.generation_history = deque(maxlen=window) # Generations advanced in each frame
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.generations = 0
+        self.frame_count = 0
+        self.trace_file = None
+        self.trace_writer = None
+        self._frame_start = self._last_lap = time.perf_counter()
+
+    def lap(self, phase):
+        """
+        Adds the time since the last lap (or the start of the frame) to a phase.
+
+        Parameters:
+            phase (str): One of PHASES.
+        """
+        now = time.perf_counter()
+        self.current[phase] += now - self._last_lap
+        self._last_lap = now
+
+    def add_time(self, phase, seconds):
+        """
+        Adds time measured elsewhere (e.g. on another thread) to a phase, without a lap.
+
+        Parameters:
+            phase (str): One of PHASES.
+            seconds (float): Time to add.
+        """
+        self.current[phase] += seconds
+
+    def count_generations(self, count):
+        """
+        Records generations advanced during this frame, for the generations/sec figure.
+
+        Parameters:
+            count (int): Number of generations advanced.
+        """
+        self.generations += count
+
+    def end_frame(self):
+        """
+        Finishes the current frame: saves its phase times, writes its trace row and starts the next frame.
+        Call right after clock.tick() so the frame time covers the whole loop.
+        """
+        now = time.perf_counter()
+        frame_time = now - self._frame_start
+        current = self.current
+        for phase in PHASES:
+            self.history[phase].append(current[phase])
+        self.history["frame"].append(frame_time)
+        self.generation_history.append(self.generations)
+        self.frame_count += 1
+        if self.trace_writer is not None:
+            self.trace_writer.writerow([self.frame_count, f"{frame_time * 1000:.3f}", self.generations]
+                                       + [f"{current[phase] * 1000:.3f}" for phase in PHASES])
+
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.generations = 0
+        self._frame_start = self._last_lap = now
+
+    def stats(self, phase):
+        """
+        Parameters:
+            phase (str): One of PHASES, or "frame" for the whole frame.
+
+        Returns:
+            tuple: (rolling average, p99) of the phase in milliseconds, (0, 0) before any frame.
+        """
+        times = self.history[phase]
+        if not times:
+            return 0.0, 0.0
+        ordered = sorted(times)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return sum(times) / len(times) * 1000, p99 * 1000
+
+    def fps(self):
+        """float: Frames per second over the rolling window."""
+        total = sum(self.history["frame"])
+        return len(self.history["frame"]) / total if total > 0 else 0.0
+
+    def generations_per_second(self):
+        """float: Generations advanced per second over the rolling window."""
+        total = sum(self.history["frame"])
+        return sum(self.generation_history) / total if total > 0 else 0.0
+
+    def start_trace(self, path):
+        """
+        Starts writing one CSV row per frame (times in milliseconds).
+
+        Parameters:
+            path (str): The CSV file to write; it is overwritten.
+        """
+        self.stop_trace()
+        self.trace_file = open(path, "w", newline="")
+        self.trace_writer = csv.writer(self.trace_file)
+        self.trace_writer.writerow(["frame", "frame_ms", "generations"] + [f"{phase}_ms" for phase in PHASES])
+
+    def stop_trace(self):
+        """Finishes and closes the CSV trace, if one is being written."""
+        if self.trace_file is not None:
+            self.trace_file.close()
+        self.trace_file = None
+        self.trace_writer = None
+
+    @property
+    def tracing(self):
+        """bool: True while a CSV trace is being written."""
+        return self.trace_writer is not None
@@ -0,0 +1,189 @@
+# frontier_engine.py
+# Description: Incremental backend for Blob Life. The board is split into square tiles and
+# only tiles next to last generation's changes are recomputed, so once a soup has burnt
+# down to still lifes and blinkers a generation costs time in proportion to the activity,
+# not the board area.
+
+# === IMPORTS ===
+from bitboard_engine import BitboardEngine, PLANE_TO_TEXT # Steps each tile (plus a 1-cell halo) as a packed int
+from rules import CONWAY # The default rule, B3/S23
+
+# === SETTINGS ===
+DEFAULT_TILE_SIZE = 32     # Cells along each side of a tile
+FULL_RELOAD_CHANGES = 4096 # Past this many cells changed from outside, every tile is marked active instead of finding them one by one
+
+
+class FrontierEngine:
+    """
+    Steps a Blob Life board held as a flat alive plane, skipping tiles that cannot change.
+    A cell can only change if something within one cell of it changed last generation, so
+    a tile whose own cells and neighboring tiles were all unchanged is copied as is. Active
+    tiles are stepped with their one-cell halo by a small bitboard, which keeps cells past
+    the edge of the board dead, the same as count_neighbors().
+    """
+
+    def __init__(self, width, height, tile_size=DEFAULT_TILE_SIZE, rule=CONWAY):
+        """
+        Create an empty board.
+
+        Parameters:
+            width (int): Number of columns on the board.
+            height (int): Number of rows on the board.
+            tile_size (int): Cells along each side of a tile.
+            rule (rules.Rule): The rule cells follow (default is Conway's B3/S23).
+        """
+        self.width = width
+        self.height = height
+        self.rule = rule
+        self.tile_size = tile_size
+        self.tile_cols = -(-width // tile_size)
+        self.tile_rows = -(-height // tile_size)
+        self.generation = 0
+        self.plane = bytearray(width * height)
+        self.active = set()        # (tile row, tile col) of every tile to recompute next step
+        self.changed_tiles = set() # Tiles whose cells changed in the last step
+        self.births = 0            # Cells born in the last step
+        self.born = []             # Flat index of every cell born in the last step
+        self._windows = {}         # (window width, window height) -> BitboardEngine, reused between steps
+
+    def load_plane(self, plane):
+        """
+        Replace the board with a flat alive plane, one byte per cell in row order.
+        If the board only differs from the last generation in a few cells (a click, a
+        template), only the tiles around those cells become active.
+
+        Parameters:
+            plane (bytearray): height * width bytes of 0 or 1.
+        """
+        if plane == self.plane:
+            return
+        packed_diff = int.from_bytes(plane, "big") ^ int.from_bytes(self.plane, "big")
+        self.plane = bytearray(plane)
+        # Cells are 0/1 bytes, so every changed cell is exactly one set bit of the XOR
+        if packed_diff.bit_count() > FULL_RELOAD_CHANGES:
+            self.active = self.all_tiles()
+            return
+        diff = packed_diff.to_bytes(len(plane), "big")
+        changed = set()
+        i = diff.find(1)
+        while i != -1:
+            row, col = divmod(i, self.width)
+            changed.add((row // self.tile_size, col // self.tile_size))
+            i = diff.find(1, i + 1)
+        self.active |= self.neighborhood(changed)
+
+    def to_plane(self):
+        """
+        Returns:
+            bytearray: A copy of the board as a flat alive plane, one byte per cell in row order.
+        """
+        return bytearray(self.plane)
+
+    def clear(self):
+        """Kill every cell on the board and reset the generation count."""
+        self.plane = bytearray(self.width * self.height)
+        self.active = set()
+        self.changed_tiles = set()
+        self.births = 0
+        self.born = []
+        self.generation = 0
+
+    def all_tiles(self):
+        """
+        Returns:
+            set: (tile row, tile col) of every tile on the board.
+        """
+        return {(tr, tc) for tr in range(self.tile_rows) for tc in range(self.tile_cols)}
+
+    def neighborhood(self, tiles):
+        """
+        Parameters:
+            tiles (set): (tile row, tile col) of some tiles.
+
+        Returns:
+            set: Those tiles and every tile touching them, clipped to the board.
+        """
+        around = set()
+        for tr, tc in tiles:
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    if 0 <= tr + dr < self.tile_rows and 0 <= tc + dc < self.tile_cols:
+                        around.add((tr + dr, tc + dc))
+        return around
+
+    def step(self, generations=1):
+        """
+        Advance the board by the given number of generations using the engine's rule.
+
+        Parameters:
+            generations (int): How many generations to advance (default is 1).
+        """
+        for _ in range(generations):
+            plane = self.plane
+            next_plane = bytearray(plane)
+            changed = set()
+            self.births = 0
+            self.born = []
+            for tile in self.active:
+                if self._step_tile(tile, plane, next_plane):
+                    changed.add(tile)
+            self.plane = next_plane
+            self.changed_tiles = changed
+            self.active = self.neighborhood(changed)
+            self.generation += 1
+
+    def _step_tile(self, tile, plane, next_plane):
+        """
+        Computes one tile of the next generation and adds its births to self.births and self.born.
+
+        Parameters:
+            tile (tuple): (tile row, tile col) of the tile.
+            plane (bytearray): The current alive plane.
+            next_plane (bytearray): The next alive plane, written in place.
+
+        Returns:
+            bool: True if any cell in the tile changed.
+        """
+        width, size = self.width, self.tile_size
+        top, left = tile[0] * size, tile[1] * size
+        bottom, right = min(top + size, self.height), min(left + size, self.width)
+        # The window is the tile plus a one-cell halo, cut off at the board's edges
+        window_top, window_left = max(top - 1, 0), max(left - 1, 0)
+        window_bottom, window_right = min(bottom + 1, self.height), min(right + 1, width)
+        window_width, window_height = window_right - window_left, window_bottom - window_top
+
+        rows = b"".join(plane[r * width + window_left:r * width + window_right] for r in range(window_top, window_bottom))
+        board = int(rows.translate(PLANE_TO_TEXT), 2)
+        if not board:
+            return False # Nothing alive in or next to the tile, so nothing can be born
+        key = (window_width, window_height)
+        if key not in self._windows:
+            self._windows[key] = BitboardEngine(window_width, window_height, self.rule)
+        window = self._windows[key]
+        window.board = board
+        window.step()
+        stepped = window.to_plane()
+
+        changed = False
+        inner_left = left - window_left
+        for r in range(top, bottom):
+            start = (r - window_top) * window_width + inner_left
+            row = stepped[start:start + right - left]
+            old_row = plane[r * width + left:r * width + right]
+            if row != old_row:
+                next_plane[r * width + left:r * width + right] = row
+                born = int.from_bytes(row, "big") & ~int.from_bytes(old_row, "big")
+                if born:
+                    self.births += born.bit_count()
+                    born_row = born.to_bytes(right - left, "big")
+                    i = born_row.find(1)
+                    while i != -1:
+                        self.born.append(r * width + left + i)
+                        i = born_row.find(1, i + 1)
+                changed = True
+        return changed
+
+    @property
+    def population(self):
+        """int: Number of alive cells on the board."""
+        return self.plane.count(1)
@@ -0,0 +1,309 @@
+# hashlife_engine.py
+# Description: HashLife backend for Blob Life. Stores the plane as a memoized quadtree
+# so repeated regions are computed once, which lets long-running patterns jump ahead
+# by millions or billions of generations in one call.
+
+# === IMPORTS ===
+from itertools import islice
+from rules import CONWAY # The default rule, B3/S23
+
+# === CACHE SETTINGS ===
+DEFAULT_MAX_NODES = 1_000_000 # Roughly 250 MB of quadtree nodes and cached results
+
+
+class Node:
+    """
+    A square block of the plane, 2^level cells wide.
+    Level 0 nodes are single cells; bigger nodes are made of four quadrants.
+    Nodes are never changed after they are made, so equal blocks can share one node.
+    """
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        """
+        Parameters:
+            nw, ne, sw, se (Node): The four quadrants (None for single cells).
+            level (int): The node is 2^level cells wide.
+            population (int): Number of live cells inside the node.
+        """
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+DEAD = Node(None, None, None, None, 0, 0)
+ALIVE = Node(None, None, None, None, 0, 1)
+
+
+class HashLifeEngine:
+    """
+    Steps an unbounded Blob Life plane with the HashLife algorithm.
+    Every distinct block is stored once in a canonical-node cache together with its
+    future; when the cache grows past max_nodes the oldest half is evicted.
+    """
+
+    def __init__(self, max_nodes=DEFAULT_MAX_NODES, rule=CONWAY):
+        """
+        Create an empty plane.
+
+        Parameters:
+            max_nodes (int): Cap on cached nodes and results before the oldest half is evicted.
+            rule (rules.Rule): The rule cells follow (default is Conway's B3/S23).
+        """
+        self.max_nodes = max_nodes
+        self.rule = rule
+        self.generation = 0
+        self._nodes = {}   # (nw, ne, sw, se) -> canonical Node
+        self._results = {} # (node, j) -> centre of node after 2^j generations
+        self._empty = [DEAD]
+        self.clear()
+
+    # --- Board setup ---
+
+    def clear(self):
+        """Kill every cell and reset the generation count."""
+        self.root = self._empty_node(3)
+        self.origin = (0, 0) # (row, col) of the root's top-left cell
+        self.generation = 0
+
+    def load(self, cells):
+        """
+        Replace the plane with the given live cells.
+
+        Parameters:
+            cells: An iterable of (row, col) positions that are alive.
+        """
+        cells = set(cells)
+        self.generation = 0
+        if not cells:
+            self.clear()
+            return
+        top = min(r for r, c in cells)
+        left = min(c for r, c in cells)
+        blocks = {(r - top, c - left): ALIVE for r, c in cells}
+        level = 0
+        # Merge 2x2 groups of blocks into parents until one block holds everything
+        while len(blocks) > 1 or level < 3:
+            empty = self._empty_node(level)
+            parents = {}
+            for (r, c) in blocks:
+                parents.setdefault((r >> 1, c >> 1), None)
+            for (r, c) in parents:
+                parents[(r, c)] = self._join(
+                    blocks.get((2 * r, 2 * c), empty), blocks.get((2 * r, 2 * c + 1), empty),
+                    blocks.get((2 * r + 1, 2 * c), empty), blocks.get((2 * r + 1, 2 * c + 1), empty),
+                )
+            blocks = parents
+            level += 1
+        self.root = blocks[(0, 0)]
+        self.origin = (top, left)
+
+    def live_cells(self):
+        """
+        Returns:
+            list: The (row, col) position of every live cell.
+        """
+        cells = []
+        stack = [(self.root, self.origin[0], self.origin[1])]
+        while stack:
+            node, row, col = stack.pop()
+            if node.population == 0:
+                continue
+            if node.level == 0:
+                cells.append((row, col))
+                continue
+            half = 1 << (node.level - 1)
+            stack.append((node.nw, row, col))
+            stack.append((node.ne, row, col + half))
+            stack.append((node.sw, row + half, col))
+            stack.append((node.se, row + half, col + half))
+        return cells
+
+    @property
+    def population(self):
+        """int: Number of live cells."""
+        return self.root.population
+
+    # --- Stepping ---
+
+    def step(self, generations=1):
+        """
+        Skip ahead by any number of generations using the engine's rule.
+        The jump is split into powers of two, so a billion generations takes about 30 jumps.
+
+        Parameters:
+            generations (int): How many generations to advance (default is 1).
+        """
+        if generations < 0:
+            raise ValueError("HashLife can only step forward")
+        for j in reversed(range(generations.bit_length())):
+            if generations >> j & 1:
+                # Grow the root until the pattern cannot escape the centre in 2^j generations
+                while self.root.level < j + 3 or not self._is_padded(self.root):
+                    self._expand()
+                quarter = 1 << (self.root.level - 2)
+                self.root = self._successor(self.root, j)
+                self.origin = (self.origin[0] + quarter, self.origin[1] + quarter)
+        self.generation += generations
+
+    def _expand(self):
+        """Put the root in the middle of a block twice as wide."""
+        root = self.root
+        empty = self._empty_node(root.level - 1)
+        self.root = self._join(
+            self._join(empty, empty, empty, root.nw), self._join(empty, empty, root.ne, empty),
+            self._join(empty, root.sw, empty, empty), self._join(root.se, empty, empty, empty),
+        )
+        half = 1 << (root.level - 1)
+        self.origin = (self.origin[0] - half, self.origin[1] - half)
+
+    @staticmethod
+    def _is_padded(node):
+        """
+        Checks that every live cell of a node is inside its central quarter-width block.
+
+        Parameters:
+            node (Node): A node of level 3 or more.
+
+        Returns:
+            bool: True if the pattern has room to grow before it could leave the centre.
+        """
+        return (node.nw.population == node.nw.se.se.population
+                and node.ne.population == node.ne.sw.sw.population
+                and node.sw.population == node.sw.ne.ne.population
+                and node.se.population == node.se.nw.nw.population)
+
+    def _successor(self, node, j):
+        """
+        Compute the centre of a node after 2^j generations.
+
+        Parameters:
+            node (Node): A node of level 2 or more.
+            j (int): log2 of the number of generations. Values above node.level - 2 are capped.
+
+        Returns:
+            Node: The centre of the node (one level smaller) after 2^j generations.
+        """
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            # Nine overlapping sub-blocks, each one level below the node
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join = self._join
+            c1 = self._successor(join(nw.nw, nw.ne, nw.sw, nw.se), j)
+            c2 = self._successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = self._successor(join(ne.nw, ne.ne, ne.sw, ne.se), j)
+            c4 = self._successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = self._successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = self._successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = self._successor(join(sw.nw, sw.ne, sw.sw, sw.se), j)
+            c8 = self._successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = self._successor(join(se.nw, se.ne, se.sw, se.se), j)
+            if j < node.level - 2:
+                # The sub-blocks already moved 2^j generations; just take their centres
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                # The sub-blocks moved 2^(j-1) generations; move them another 2^(j-1)
+                result = join(
+                    self._successor(join(c1, c2, c4, c5), j - 1), self._successor(join(c2, c3, c5, c6), j - 1),
+                    self._successor(join(c4, c5, c7, c8), j - 1), self._successor(join(c5, c6, c8, c9), j - 1),
+                )
+        self._results[key] = result
+        self._evict_if_full()
+        return result
+
+    def _life_4x4(self, node):
+        """
+        Apply one generation to the middle 2x2 cells of a 4x4 block.
+
+        Parameters:
+            node (Node): A level 2 node.
+
+        Returns:
+            Node: The level 1 centre after one generation.
+        """
+        # Pack the 4x4 block into 16 bits, row by row, first cell in the top bit
+        rows = (
+            (node.nw.nw, node.nw.ne, node.ne.nw, node.ne.ne),
+            (node.nw.sw, node.nw.se, node.ne.sw, node.ne.se),
+            (node.sw.nw, node.sw.ne, node.se.nw, node.se.ne),
+            (node.sw.sw, node.sw.se, node.se.sw, node.se.se),
+        )
+        block = 0
+        for row in rows:
+            for cell in row:
+                block = block << 1 | cell.population
+
+        # Each centre cell's 3x3 neighborhood is 3 bits from each of 3 rows, looked up in the rule's table
+        table = self.rule.neighborhood_table
+        centre = []
+        for r in (1, 2):
+            for c in (1, 2):
+                neighborhood = 0
+                for dr in (-1, 0, 1):
+                    neighborhood = neighborhood << 3 | (block >> (14 - 4 * (r + dr) - c) & 0b111)
+                centre.append(ALIVE if table[neighborhood] else DEAD)
+        return self._join(*centre)
+
+    # --- Canonical node cache ---
+
+    def _join(self, nw, ne, sw, se):
+        """
+        Return the one shared node made of the four given quadrants.
+
+        Parameters:
+            nw, ne, sw, se (Node): Quadrants of the same level.
+
+        Returns:
+            Node: The canonical parent node.
+        """
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = Node(nw, ne, sw, se, nw.level + 1,
+                        nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+
+    def _empty_node(self, level):
+        """
+        Parameters:
+            level (int): Level of the node.
+
+        Returns:
+            Node: An all-dead node of that level.
+        """
+        while len(self._empty) <= level:
+            smaller = self._empty[-1]
+            self._empty.append(self._join(smaller, smaller, smaller, smaller))
+        return self._empty[level]
+
+    def _evict_if_full(self):
+        """
+        Drop the oldest half of the node and result caches once they pass max_nodes.
+        Evicted nodes that are still in use keep working; they just stop being shared,
+        so eviction only costs speed, never correctness.
+        """
+        for cache in (self._nodes, self._results):
+            if len(cache) > self.max_nodes:
+                for key in list(islice(cache, len(cache) // 2)):
+                    del cache[key]
+
+    @property
+    def cache_size(self):
+        """int: Number of nodes plus cached results currently held."""
+        return len(self._nodes) + len(self._results)
@@ -0,0 +1,88 @@
+# headless.py
+# Description: Runs Blob Life generations without pygame, a window or audio, and prints timing.
+# Usage: python headless.py --width 1000 --height 1000 --generations 100
+
+# === IMPORTS ===
+import time
+start_time = time.perf_counter() # Measured before the core import so startup includes it
+
+import argparse
+import random
+import blob_life_core as core
+
+
+def parse_args(argv=None):
+    """
+    Reads the command line options for a headless run.
+
+    Parameters:
+        argv (list): Arguments to parse (default is sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Run Blob Life generations headlessly and print timing.")
+    parser.add_argument("--width", type=int, default=core.grid_width, help="number of columns on the board")
+    parser.add_argument("--height", type=int, default=core.grid_height, help="number of rows on the board")
+    parser.add_argument("--generations", type=int, default=100, help="how many generations to run")
+    parser.add_argument("--template", choices=sorted(core.templates), help="start from a template instead of a random board")
+    parser.add_argument("--pattern", help="start from an .rle, .cells, .lif or .life pattern file")
+    parser.add_argument("--offset", type=int, nargs=2, metavar=("ROW", "COL"), help="where the pattern's top-left corner goes (default centers it)")
+    parser.add_argument("--seed", type=int, help="random seed for the starting board")
+    parser.add_argument("--density", type=float, default=0.5, help="chance that each cell of a random board starts alive")
+    parser.add_argument("--engine", choices=core.engines, default=core.engine, help="engine used to compute generations")
+    parser.add_argument("--rule", default="B3/S23", help="life-like rule as B/S notation (e.g. B36/S23) or a name like HighLife")
+    parser.add_argument("--workers", type=int, help="worker processes for the parallel engine (default is one per core)")
+    parser.add_argument("--skip", type=int, help="jump this many generations in one HashLife skip instead of stepping")
+    args = parser.parse_args(argv)
+    try:
+        core.rules.parse_rule(args.rule)
+    except ValueError as error:
+        parser.error(str(error))
+    return args
+
+
+def main(argv=None):
+    """
+    Sets up the board, runs the requested generations and prints the timings.
+
+    Parameters:
+        argv (list): Arguments to parse (default is sys.argv).
+    """
+    args = parse_args(argv)
+    random.seed(args.seed)
+    core.set_engine(args.engine)
+    core.set_rule(args.rule)
+    core.parallel_workers = args.workers
+    core.set_grid_size(args.width, args.height)
+    if args.pattern:
+        row, col = args.offset or (None, None)
+        core.load_pattern(args.pattern, row, col)
+    elif args.template:
+        core.apply_template(args.template)
+    else:
+        core.randomize_grid(args.density, args.seed)
+    startup = time.perf_counter() - start_time
+
+    run_start = time.perf_counter()
+    if args.skip:
+        core.skip_generations(args.skip)
+    else:
+        for _ in range(args.generations):
+            core.next_generation()
+            if core.all_blobs_dead() or core.cycle_detector.period is not None:
+                break
+    elapsed = time.perf_counter() - run_start
+
+    population = core.population()
+    rate = core.generation / elapsed if elapsed > 0 else float("inf")
+    print(f"Board: {args.width}x{args.height} ({'hashlife' if args.skip else args.engine} engine, {core.rule.name} rule)")
+    print(f"Startup: {startup * 1000:.1f} ms")
+    print(f"Generations: {core.generation} in {elapsed:.3f} s ({rate:.1f} generations/sec)")
+    print(f"Population: {population}")
+    if core.cycle_detector.period is not None:
+        print(f"Cycle: period {core.cycle_detector.period} starting at generation {core.cycle_detector.start}")
+
+
+if __name__ == "__main__":
+    main()
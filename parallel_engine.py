@@ -0,0 +1,180 @@
+# parallel_engine.py
+# Description: Multi-core backend for Blob Life. Splits the board into row bands that a
+# pool of worker processes steps at the same time. The board lives in shared memory, so
+# workers read their band and its one-row halos directly instead of pickling rows around.
+
+# === IMPORTS ===
+import os
+import weakref
+from multiprocessing import Pool, shared_memory
+from bitboard_engine import BitboardEngine # Steps a band when NumPy is not installed
+from rules import CONWAY, parse_rule # Rules travel to the workers as rulestrings
+try:
+    from numpy_engine import NumpyEngine # Steps a band at array speed
+except ImportError:
+    NumpyEngine = None
+
+# === WORKER STATE ===
+# Set up once in each worker process by attach_worker()
+worker_state = {}
+
+
+def attach_worker(buffer_names, width, rulestring="B3/S23"):
+    """
+    Pool initializer: opens the shared board buffers inside a worker process.
+
+    Parameters:
+        buffer_names (list): Names of the two shared memory blocks (current and next board).
+        width (int): Number of columns on the board.
+        rulestring (str): The rule to step bands with, e.g. "B3/S23".
+    """
+    worker_state["buffers"] = [shared_memory.SharedMemory(name=name) for name in buffer_names]
+    worker_state["width"] = width
+    worker_state["rule"] = parse_rule(rulestring)
+    worker_state["engines"] = {} # Band engines, reused by band height
+
+
+def step_band(task):
+    """
+    Computes the next generation for one band of rows.
+    The band is read together with the row above and below it (its halo) from the current
+    buffer, stepped once, and its inner rows are written to the other buffer.
+
+    Parameters:
+        task (tuple): (current buffer index, first row, end row) of the band.
+
+    Returns:
+        int: Number of alive cells in the band after the step.
+    """
+    current, start, end = task
+    width = worker_state["width"]
+    source = worker_state["buffers"][current].buf
+    target = worker_state["buffers"][1 - current].buf
+    rows = end - start + 2
+
+    engine = worker_state["engines"].get(rows)
+    if engine is None:
+        engine_class = NumpyEngine if NumpyEngine is not None else BitboardEngine
+        engine = worker_state["engines"][rows] = engine_class(width, rows, worker_state["rule"])
+
+    # Buffer row k holds board row k - 1, so the band plus its halos is rows start..end + 1
+    engine.load_plane(source[start * width:(end + 2) * width])
+    engine.step()
+    inner = engine.to_plane()[width:-width]
+    target[(start + 1) * width:(end + 1) * width] = inner
+    return inner.count(1)
+
+
+def release(pool, buffers):
+    """
+    Stops the worker pool and frees the shared memory blocks.
+
+    Parameters:
+        pool (multiprocessing.Pool): The worker pool.
+        buffers (list): The shared memory blocks to free.
+    """
+    pool.terminate()
+    pool.join()
+    for buffer in buffers:
+        buffer.close()
+        buffer.unlink()
+
+
+class ParallelEngine:
+    """
+    Steps a Blob Life board on several cores at once.
+    The board is double-buffered in shared memory with a dead row above and below it, so the
+    halo rows every band needs are already in place when the next generation starts.
+    Results are the same as the single-process engines. Call close() (or use a with block)
+    to stop the workers when finished.
+    """
+
+    def __init__(self, width, height, workers=None, rule=CONWAY):
+        """
+        Create an empty board and start the worker pool.
+
+        Parameters:
+            width (int): Number of columns on the board.
+            height (int): Number of rows on the board.
+            workers (int): Number of worker processes (default is one per CPU core).
+            rule (rules.Rule): The rule cells follow (default is Conway's B3/S23).
+        """
+        self.width = width
+        self.height = height
+        self.rule = rule
+        self.workers = workers or os.cpu_count() or 1
+        self.generation = 0
+        self._population = 0
+
+        size = max((height + 2) * width, 1)
+        self._buffers = [shared_memory.SharedMemory(create=True, size=size) for _ in range(2)]
+        for buffer in self._buffers:
+            buffer.buf[:size] = bytes(size)
+        self._current = 0
+
+        # One band of rows per worker, as even as possible
+        band_count = min(self.workers, max(height, 1))
+        edges = [height * i // band_count for i in range(band_count + 1)]
+        self._bands = [(edges[i], edges[i + 1]) for i in range(band_count) if edges[i] < edges[i + 1]]
+
+        self._pool = Pool(self.workers, initializer=attach_worker,
+                          initargs=([buffer.name for buffer in self._buffers], width, rule.rulestring))
+        self._release = weakref.finalize(self, release, self._pool, self._buffers)
+
+    def _board(self):
+        """
+        Returns:
+            memoryview: The current board's cells inside the padded shared buffer.
+        """
+        return self._buffers[self._current].buf[self.width:(self.height + 1) * self.width]
+
+    def load_plane(self, plane):
+        """
+        Replace the board with a flat alive plane, one byte per cell in row order.
+
+        Parameters:
+            plane (bytearray): height * width bytes of 0 or 1.
+        """
+        self._board()[:] = plane
+        self._population = plane.count(1)
+
+    def to_plane(self):
+        """
+        Returns:
+            bytearray: The board as a flat alive plane, one byte per cell in row order.
+        """
+        return bytearray(self._board())
+
+    def clear(self):
+        """Kill every cell on the board and reset the generation count."""
+        self._board()[:] = bytes(self.width * self.height)
+        self._population = 0
+        self.generation = 0
+
+    def step(self, generations=1):
+        """
+        Advance the board by the given number of generations using the engine's rule.
+
+        Parameters:
+            generations (int): How many generations to advance (default is 1).
+        """
+        for _ in range(generations):
+            counts = self._pool.map(step_band, [(self._current, start, end) for start, end in self._bands])
+            self._current = 1 - self._current
+            self._population = sum(counts)
+            self.generation += 1
+
+    @property
+    def population(self):
+        """int: Number of alive cells on the board."""
+        return self._population
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
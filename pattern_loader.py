@@ -0,0 +1,383 @@
+# pattern_loader.py
+# Description: Reads Game of Life pattern files (RLE, plaintext .cells and Life 1.06) into
+# a compact list of horizontal runs. Files are parsed a line at a time, so even
+# multi-megabyte patterns never build per-cell Python objects, and every parsed pattern is
+# kept in a small binary cache so loading it again is instant.
+
+# === IMPORTS ===
+import hashlib
+import os
+import re
+import struct
+import sys
+from array import array
+from itertools import chain
+
+# === CACHE SETTINGS ===
+cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "blob_life", "patterns") # None turns the cache off
+CACHE_MAX_BYTES = 64 * 1024 * 1024 # Past this much, the least recently used cache files are deleted (64 MiB)
+CACHE_MAGIC = b"BLPC\x01"
+CACHE_HEADER = struct.Struct("<IIIHH") # width, height, run count, name length, rule length
+
+# === PARSING PATTERNS ===
+RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*(\S+))?", re.IGNORECASE)
+RLE_TOKEN = re.compile(r"(\d*)([^\d\s])")
+CELLS_ALIVE = re.compile(r"[^.\s]+") # Plaintext marks alive cells with O (or *) and dead ones with .
+TRAILING_DIGITS = re.compile(r"\d+$")
+
+
+class Pattern:
+    """
+    A pattern stored as horizontal runs of alive cells.
+    runs is a flat array of (row, col, length) triples relative to the pattern's top-left
+    corner, so a pattern costs 12 bytes per run however many cells it has.
+    """
+
+    def __init__(self, width, height, runs, name=None, rule=None):
+        """
+        Parameters:
+            width (int): Columns spanned by the pattern.
+            height (int): Rows spanned by the pattern.
+            runs (array): Flat array('i') of (row, col, length) triples.
+            name (str): The pattern's name from the file, if it had one.
+            rule (str): The rule given in the file (e.g. "B3/S23"), if any.
+        """
+        self.width = width
+        self.height = height
+        self.runs = runs
+        self.name = name
+        self.rule = rule
+
+    @property
+    def population(self):
+        """int: Number of alive cells in the pattern."""
+        return sum(self.runs[2::3])
+
+    def cells(self):
+        """
+        Yields:
+            tuple: (row, col) of every alive cell, for engines that take cell lists.
+        """
+        runs = self.runs
+        for i in range(0, len(runs), 3):
+            row, col = runs[i], runs[i + 1]
+            for c in range(col, col + runs[i + 2]):
+                yield row, c
+
+
+def add_run(runs, row, col, length):
+    """
+    Appends a run of alive cells, joining it onto the previous run when they touch.
+
+    Parameters:
+        runs (array): The flat (row, col, length) array being built.
+        row (int): Row of the run.
+        col (int): First column of the run.
+        length (int): Number of alive cells in the run.
+    """
+    if runs and runs[-3] == row and runs[-2] + runs[-1] == col:
+        runs[-1] += length
+    else:
+        runs.extend((row, col, length))
+
+
+def finish(runs, width, height, name, rule):
+    """
+    Works out a pattern's real size, which can be bigger than its file header says.
+
+    Parameters:
+        runs (array): The flat (row, col, length) array.
+        width (int): Width from the file header (0 if there was none).
+        height (int): Height from the file header (0 if there was none).
+        name (str): The pattern's name, if any.
+        rule (str): The pattern's rule, if any.
+
+    Returns:
+        Pattern: The finished pattern.
+    """
+    if not runs:
+        return Pattern(width, height, runs, name, rule)
+    right = max(c + n for c, n in zip(runs[1::3], runs[2::3]))
+    return Pattern(max(width, right), max(height, max(runs[0::3]) + 1), runs, name, rule)
+
+
+def parse_rle(lines):
+    """
+    Parses a run-length encoded pattern.
+    States other than b and . are treated as alive, so multi-state files still load.
+
+    Parameters:
+        lines (iterable): Lines of the file, read lazily.
+
+    Returns:
+        Pattern: The parsed pattern.
+    """
+    runs = array("i")
+    width = height = 0
+    name = rule = None
+    row = col = 0
+    pending = "" # Digits at the end of a line that belong to the next line's first tag
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            if line.startswith("#N"):
+                name = line[2:].strip() or None
+            continue
+        header = RLE_HEADER.match(line) if not runs and row == col == 0 else None
+        if header:
+            width, height = int(header.group(1)), int(header.group(2))
+            rule = header.group(3)
+            continue
+
+        line = pending + line
+        trailing = TRAILING_DIGITS.search(line)
+        pending = trailing.group() if trailing else ""
+        for count, tag in RLE_TOKEN.findall(line):
+            n = int(count) if count else 1
+            if tag == "!":
+                return finish(runs, width, height, name, rule)
+            if tag == "$":
+                row += n
+                col = 0
+            elif tag in "b.":
+                col += n
+            else:
+                add_run(runs, row, col, n)
+                col += n
+    return finish(runs, width, height, name, rule)
+
+
+def parse_cells(lines):
+    """
+    Parses a plaintext (.cells) pattern: one line per row, O for alive and . for dead.
+
+    Parameters:
+        lines (iterable): Lines of the file, read lazily.
+
+    Returns:
+        Pattern: The parsed pattern.
+    """
+    runs = array("i")
+    name = None
+    row = 0
+    for line in lines:
+        if line.startswith("!"):
+            if line.startswith("!Name:"):
+                name = line[6:].strip() or None
+            continue
+        for match in CELLS_ALIVE.finditer(line):
+            runs.extend((row, match.start(), match.end() - match.start()))
+        row += 1
+    return finish(runs, 0, 0, name, None)
+
+
+def parse_life106(lines):
+    """
+    Parses a Life 1.06 pattern: one "x y" coordinate pair per alive cell.
+
+    Parameters:
+        lines (iterable): Lines of the file, read lazily.
+
+    Returns:
+        Pattern: The parsed pattern.
+    """
+    cells = array("i")
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            x, y = line.split()
+            cells.extend((int(y), int(x)))
+        except ValueError:
+            raise ValueError(f"Line {number} is not an 'x y' coordinate pair: {line!r}") from None
+
+    if not cells:
+        return finish(array("i"), 0, 0, None, None)
+    # Cells can come in any order, so sort them by row and column before joining runs.
+    # Each cell is sorted as one packed key, row * span + col counted from the top-left alive
+    # cell, so no tuple is made per cell and the pattern already starts at (0, 0).
+    rows, cols = cells[0::2], cells[1::2]
+    top, left = min(rows), min(cols)
+    span = max(cols) - left + 1
+    try:
+        import numpy as np # Sorts the keys and finds the runs in a few whole-array operations
+    except ImportError:
+        np = None
+    if np is not None:
+        keys = np.unique((np.frombuffer(rows, dtype=np.int32).astype(np.int64) - top) * span
+                         + (np.frombuffer(cols, dtype=np.int32) - left))
+        key_rows, key_cols = np.divmod(keys, span)
+        # A run ends wherever the next cell is not the one just to its right
+        breaks = np.flatnonzero((np.diff(keys) != 1) | (np.diff(key_rows) != 0)) + 1
+        starts = np.concatenate(([0], breaks))
+        lengths = np.diff(np.concatenate((starts, [len(keys)])))
+        runs = array("i")
+        runs.frombytes(np.column_stack((key_rows[starts], key_cols[starts], lengths)).astype(np.int32).tobytes())
+        return finish(runs, 0, 0, None, None)
+
+    runs = array("i")
+    previous = None
+    for key in sorted(array("q", ((r - top) * span + c - left for r, c in zip(rows, cols)))):
+        if key != previous: # The same cell listed twice is still one cell
+            row, col = divmod(key, span)
+            add_run(runs, row, col, 1)
+            previous = key
+    return finish(runs, 0, 0, None, None)
+
+
+def detect_format(path, first_line):
+    """
+    Works out a pattern file's format from its first line and its extension.
+
+    Parameters:
+        path (str): The file's path.
+        first_line (str): The first line of the file.
+
+    Returns:
+        str: "rle", "cells" or "life106".
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if first_line.startswith("#Life 1.06") or extension in (".lif", ".life"):
+        return "life106"
+    if extension == ".cells" or first_line.startswith("!"):
+        return "cells"
+    return "rle"
+
+
+def parse_pattern(path):
+    """
+    Parses a pattern file without using the cache.
+
+    Parameters:
+        path (str): Path to an .rle, .cells, .lif or .life file.
+
+    Returns:
+        Pattern: The parsed pattern.
+    """
+    parsers = {"rle": parse_rle, "cells": parse_cells, "life106": parse_life106}
+    with open(path, encoding="utf-8", errors="replace") as file:
+        first_line = file.readline()
+        parser = parsers[detect_format(path, first_line)]
+        return parser(chain([first_line], file))
+
+# === PATTERN CACHE ===
+
+def cache_path(path):
+    """
+    Parameters:
+        path (str): Path to a pattern file.
+
+    Returns:
+        str: Where the parsed pattern is cached. The name changes whenever the file does.
+    """
+    info = os.stat(path)
+    key = f"{os.path.abspath(path)}|{info.st_size}|{info.st_mtime_ns}".encode()
+    return os.path.join(cache_dir, hashlib.blake2b(key, digest_size=16).hexdigest() + ".bin")
+
+
+def save_cached(pattern, cached):
+    """
+    Writes a parsed pattern to the cache.
+
+    Parameters:
+        pattern (Pattern): The parsed pattern.
+        cached (str): The cache file to write.
+    """
+    name = (pattern.name or "").encode()
+    rule = (pattern.rule or "").encode()
+    runs = pattern.runs
+    if sys.byteorder == "big":
+        runs = array("i", runs)
+        runs.byteswap()
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    temporary = cached + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(CACHE_MAGIC)
+        file.write(CACHE_HEADER.pack(pattern.width, pattern.height, len(runs) // 3, len(name), len(rule)))
+        file.write(name + rule)
+        runs.tofile(file)
+    os.replace(temporary, cached) # Another process never sees a half-written cache file
+    trim_cache(os.path.dirname(cached))
+
+
+def trim_cache(folder, limit=CACHE_MAX_BYTES):
+    """
+    Deletes the least recently used cache files until the cache fits its size limit.
+    Edited or moved pattern files get new cache files, so without this the cache only grows.
+
+    Parameters:
+        folder (str): The cache folder.
+        limit (int): Most bytes of cache files to keep (default is CACHE_MAX_BYTES).
+    """
+    entries = []
+    with os.scandir(folder) as scan:
+        for entry in scan:
+            if entry.name.endswith(".bin"):
+                info = entry.stat()
+                entries.append((info.st_mtime, info.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue # Another process may have removed it already
+        total -= size
+
+
+def load_cached(cached):
+    """
+    Reads a pattern back from the cache.
+
+    Parameters:
+        cached (str): The cache file to read.
+
+    Returns:
+        Pattern: The cached pattern, or None if there is no valid cache file.
+    """
+    try:
+        with open(cached, "rb") as file:
+            if file.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                return None
+            width, height, run_count, name_length, rule_length = CACHE_HEADER.unpack(file.read(CACHE_HEADER.size))
+            name = file.read(name_length).decode() or None
+            rule = file.read(rule_length).decode() or None
+            runs = array("i")
+            runs.fromfile(file, run_count * 3)
+    except (OSError, EOFError, struct.error):
+        return None
+    if sys.byteorder == "big":
+        runs.byteswap()
+    return Pattern(width, height, runs, name, rule)
+
+
+def load_pattern(path):
+    """
+    Loads a pattern file, from the cache when it was parsed before.
+
+    Parameters:
+        path (str): Path to an .rle, .cells, .lif or .life file.
+
+    Returns:
+        Pattern: The loaded pattern.
+    """
+    if cache_dir is None:
+        return parse_pattern(path)
+    cached = cache_path(path)
+    pattern = load_cached(cached)
+    if pattern is not None:
+        try:
+            os.utime(cached) # Marks the file as recently used, so trim_cache() keeps it
+        except OSError:
+            pass
+    else:
+        pattern = parse_pattern(path)
+        try:
+            save_cached(pattern, cached)
+        except OSError:
+            pass # A read-only cache folder only makes the next load slower
+    return pattern
@@ -0,0 +1,297 @@
+# recording.py
+# Description: Saves Blob Life runs to a compact file and plays them back. Every frame is
+# either a keyframe (the whole board packed to one bit per cell and compressed) or a delta
+# (the cells that flipped since the previous frame, as varint gaps). Files can be appended to
+# while the simulation runs and are read through mmap, so long recordings stay on disk.
+
+# === IMPORTS ===
+import mmap
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from bitboard_engine import PLANE_TO_TEXT, TEXT_TO_PLANE # Alive plane <-> packed int conversions
+
+# === FILE FORMAT ===
+# Header: magic, then width, height and keyframe interval.
+# Each frame: a tag byte (KEYFRAME or DELTA), the generation and payload length as varints, then the payload.
+MAGIC = b"BLREC\x01"
+HEADER = struct.Struct("<IIH")
+KEYFRAME = 0x4B # "K": payload is the zlib-compressed board, one bit per cell
+DELTA = 0x44    # "D": payload is the flipped cells' index gaps, one varint each
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+
+def encode_varint(value, out):
+    """
+    Appends a non-negative int to a buffer, 7 bits per byte (LEB128).
+
+    Parameters:
+        value (int): The number to write.
+        out (bytearray): The buffer to append to.
+    """
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, position):
+    """
+    Reads one varint.
+
+    Parameters:
+        data (bytes-like): The buffer to read from.
+        position (int): Where the varint starts.
+
+    Returns:
+        tuple: (value, position just after the varint).
+    """
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def pack_plane(plane):
+    """
+    Parameters:
+        plane (bytearray): An alive plane, one byte per cell.
+
+    Returns:
+        bytes: The plane as one bit per cell, compressed.
+    """
+    bits = int(bytes(plane).translate(PLANE_TO_TEXT), 2) if plane else 0
+    return zlib.compress(bits.to_bytes((len(plane) + 7) // 8, "big"))
+
+
+def unpack_plane(payload, size):
+    """
+    Parameters:
+        payload (bytes-like): Output of pack_plane().
+        size (int): Number of cells on the board.
+
+    Returns:
+        bytearray: The alive plane, one byte per cell.
+    """
+    bits = int.from_bytes(zlib.decompress(payload), "big")
+    return bytearray(format(bits, "b").zfill(size).encode().translate(TEXT_TO_PLANE))
+
+
+def flipped_cells(old_plane, new_plane):
+    """
+    Finds the cells that were born or died between two alive planes.
+
+    Parameters:
+        old_plane (bytes-like): The earlier alive plane.
+        new_plane (bytes-like): The later alive plane.
+
+    Yields:
+        int: Flat index of each cell that changed, in order.
+    """
+    diff = int.from_bytes(old_plane, "big") ^ int.from_bytes(new_plane, "big")
+    if not diff:
+        return
+    diff_plane = diff.to_bytes(len(new_plane), "big")
+    i = diff_plane.find(1)
+    while i != -1:
+        yield i
+        i = diff_plane.find(1, i + 1)
+
+
+class RecordingWriter:
+    """
+    Appends frames to a recording file.
+    A keyframe is written every keyframe_interval frames, when the generation goes backwards
+    (the board was reset) and as the first frame after opening, so a reader never has to
+    go back more than one keyframe interval to rebuild any frame.
+    """
+
+    def __init__(self, path, width, height, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Opens a recording for appending, creating it if needed.
+
+        Parameters:
+            path (str): The recording file.
+            width (int): Number of columns on the board.
+            height (int): Number of rows on the board.
+            keyframe_interval (int): Frames between keyframes.
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.keyframe_interval = keyframe_interval
+        self.previous = None # Alive plane of the last frame written
+        self.previous_generation = None
+        self.since_keyframe = 0
+        self.frames = 0      # Frames written since opening
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, "rb") as file:
+                header = file.read(len(MAGIC) + HEADER.size)
+            if header[:len(MAGIC)] != MAGIC or HEADER.unpack(header[len(MAGIC):])[:2] != (width, height):
+                raise ValueError(f"{path} is not a recording of a {width}x{height} board")
+        self.file = open(path, "ab")
+        if not exists:
+            self.file.write(MAGIC + HEADER.pack(width, height, keyframe_interval))
+
+    def record(self, plane, generation):
+        """
+        Appends one frame.
+
+        Parameters:
+            plane (bytearray): The board's alive plane.
+            generation (int): The generation shown by the frame.
+        """
+        keyframe = (self.previous is None or self.since_keyframe >= self.keyframe_interval
+                    or generation < self.previous_generation)
+        if keyframe:
+            payload = pack_plane(plane)
+            self.since_keyframe = 0
+        else:
+            payload = bytearray()
+            last = 0
+            for i in flipped_cells(self.previous, plane):
+                encode_varint(i - last, payload)
+                last = i
+        self.since_keyframe += 1
+
+        record = bytearray([KEYFRAME if keyframe else DELTA])
+        encode_varint(generation, record)
+        encode_varint(len(payload), record)
+        self.file.write(record + payload)
+        self.previous = bytes(plane)
+        self.previous_generation = generation
+        self.frames += 1
+
+    def flush(self):
+        """Pushes written frames to disk so a reader can see them."""
+        self.file.flush()
+
+    def close(self):
+        """Finishes the recording."""
+        self.file.close()
+
+
+class RecordingReader:
+    """
+    Reads frames from a recording through a memory map.
+    Opening only walks the frame headers to index the keyframes; frames are decoded on demand
+    by starting at the nearest keyframe and applying deltas. Reading the next frame after the
+    last one read only applies one delta, so scrubbing forward is cheap.
+    """
+
+    def __init__(self, path):
+        """
+        Opens a recording and indexes its frames.
+
+        Parameters:
+            path (str): The recording file.
+        """
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = None
+        self.keyframes = []        # Frame number of each keyframe
+        self.keyframe_offsets = [] # File offset of each keyframe
+        self.frame_count = 0
+        self._scan_offset = None   # Where indexing stopped
+        self._cached = None        # (frame number, offset after it, generation, plane) of the last frame read
+        try:
+            self.refresh()
+        except ValueError:
+            self.close()
+            raise
+
+    def refresh(self):
+        """Picks up frames appended since the recording was opened or last refreshed."""
+        size = os.fstat(self.file.fileno()).st_size
+        if self.data is not None and len(self.data) == size:
+            return
+        if self.data is not None:
+            self.data.close()
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self.data
+        if self._scan_offset is None:
+            # A file cut off inside its header (e.g. the game was killed mid-write) has no frames to read
+            if size < len(MAGIC) + HEADER.size or data[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self.path} is not a Blob Life recording")
+            self.width, self.height, self.keyframe_interval = HEADER.unpack_from(data, len(MAGIC))
+            self._scan_offset = len(MAGIC) + HEADER.size
+
+        offset = self._scan_offset
+        while offset < size:
+            try:
+                tag = data[offset]
+                _, position = decode_varint(data, offset + 1)
+                length, position = decode_varint(data, position)
+            except IndexError:
+                break # A frame is still being written
+            if position + length > size:
+                break
+            if tag == KEYFRAME:
+                self.keyframes.append(self.frame_count)
+                self.keyframe_offsets.append(offset)
+            self.frame_count += 1
+            offset = position + length
+        self._scan_offset = offset
+
+    def __len__(self):
+        """int: Number of frames in the recording."""
+        return self.frame_count
+
+    def _read_record(self, offset):
+        """
+        Returns:
+            tuple: (tag, generation, payload, offset of the next frame) for the frame at offset.
+        """
+        tag = self.data[offset]
+        generation, position = decode_varint(self.data, offset + 1)
+        length, position = decode_varint(self.data, position)
+        return tag, generation, self.data[position:position + length], position + length
+
+    def frame(self, number):
+        """
+        Rebuilds one frame.
+
+        Parameters:
+            number (int): Frame number, from 0 to len(self) - 1.
+
+        Returns:
+            tuple: (generation, alive plane as a bytearray). Treat the plane as read-only;
+            it is reused to build the next frame.
+        """
+        if not 0 <= number < self.frame_count:
+            raise IndexError(f"Frame {number} is outside the recording (0 to {self.frame_count - 1})")
+        cached = self._cached
+        keyframe = bisect_right(self.keyframes, number) - 1
+        if cached is not None and self.keyframes[keyframe] <= cached[0] <= number:
+            current, offset, generation, plane = cached # Carry on from the last frame read
+        else:
+            current, offset = self.keyframes[keyframe], self.keyframe_offsets[keyframe]
+            _, generation, payload, offset = self._read_record(offset)
+            plane = unpack_plane(payload, self.width * self.height)
+
+        while current < number:
+            tag, generation, payload, offset = self._read_record(offset)
+            if tag == KEYFRAME:
+                plane = unpack_plane(payload, self.width * self.height)
+            else:
+                position = index = 0
+                while position < len(payload):
+                    gap, position = decode_varint(payload, position)
+                    index += gap
+                    plane[index] ^= 1
+            current += 1
+        self._cached = (current, offset, generation, plane)
+        return generation, plane
+
+    def close(self):
+        """Closes the memory map and the file."""
+        if self.data is not None:
+            self.data.close()
+        self.file.close()
@@ -0,0 +1,101 @@
+# rewind_history.py
+# Description: Remembers recent generations so the simulation can step backwards. Each
+# step is kept as a compressed XOR of the alive plane before and after it, in a ring
+# buffer with a byte budget; when the budget is full the oldest steps are forgotten.
+
+# === IMPORTS ===
+import zlib
+from collections import deque
+
+# === SETTINGS ===
+DEFAULT_BUDGET = 8 * 1024 * 1024 # Bytes of history kept (8 MiB)
+ENTRY_OVERHEAD = 64              # Rough bytes each remembered step costs besides its diff
+
+
+def compress_step(before, after):
+    """
+    Compresses the XOR of the alive planes before and after a step.
+    This touches nothing but its arguments, so it can run on another thread.
+
+    Parameters:
+        before (bytes-like): The alive plane before the step.
+        after (bytes-like): The alive plane after the step.
+
+    Returns:
+        bytes: The compressed diff, ready for RewindHistory.record().
+    """
+    diff = int.from_bytes(before, "big") ^ int.from_bytes(after, "big")
+    return zlib.compress(diff.to_bytes(len(after), "big"), 1)
+
+
+class RewindHistory:
+    """
+    A bounded history of board changes for stepping backwards.
+    Call record() for every step. Stepping back XORs the newest diff into the board, which,
+    like a forward step, is a few whole-plane operations done in C, so scrubbing backwards
+    never recomputes a generation.
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        """
+        Create an empty history.
+
+        Parameters:
+            budget (int): Most bytes of diffs to keep before the oldest are dropped.
+        """
+        self.budget = budget
+        self.clear()
+
+    def clear(self):
+        """Forget every remembered step."""
+        self._entries = deque() # (generation before the step, compressed XOR diff), oldest first
+        self.size = 0           # Bytes used by the entries
+        self._latest = None     # Alive plane after the newest remembered step
+
+    def record(self, before, before_generation, after, compressed=None):
+        """
+        Remembers one step.
+
+        Parameters:
+            before (bytes-like): The alive plane before the step.
+            before_generation (int): The generation before the step.
+            after (bytes-like): The alive plane after the step.
+            compressed (bytes): compress_step(before, after) if it was already worked out,
+                                e.g. before taking a lock (default is None, which works it out here).
+        """
+        if self._latest is not None and self._latest != before:
+            self.clear() # The board was reset or edited, so older steps no longer lead here
+        if compressed is None:
+            compressed = compress_step(before, after)
+        self._entries.append((before_generation, compressed))
+        self.size += len(compressed) + ENTRY_OVERHEAD
+        while self.size > self.budget and self._entries:
+            self.size -= len(self._entries.popleft()[1]) + ENTRY_OVERHEAD
+        self._latest = bytes(after)
+
+    def step_back(self, current):
+        """
+        Undoes the newest remembered step.
+        If the board was edited since that step, the history no longer matches it and is
+        forgotten instead.
+
+        Parameters:
+            current (bytes-like): The board's alive plane now.
+
+        Returns:
+            tuple: (generation, alive plane as a bytearray) before the step,
+            or None if there is nothing to rewind.
+        """
+        if not self._entries or self._latest != current:
+            self.clear()
+            return None
+        generation, compressed = self._entries.pop()
+        self.size -= len(compressed) + ENTRY_OVERHEAD
+        diff = int.from_bytes(zlib.decompress(compressed), "big")
+        plane = (int.from_bytes(current, "big") ^ diff).to_bytes(len(current), "big")
+        self._latest = plane
+        return generation, bytearray(plane)
+
+    def __len__(self):
+        """int: Number of steps that can be undone."""
+        return len(self._entries)
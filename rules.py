@@ -0,0 +1,170 @@
+# rules.py
+# Description: Life-like rules for Blob Life, written as B/S rulestrings such as B3/S23
+# (Conway's Game of Life) or B36/S23 (HighLife). Each rule is compiled once into lookup
+# tables and a bitboard formula, so engines can run any rule with no per-cell cost.
+
+# === IMPORTS ===
+import re
+
+# === KNOWN RULES ===
+PRESETS = {
+    "Conway": "B3/S23",
+    "HighLife": "B36/S23",
+    "Seeds": "B2/S",
+    "Day & Night": "B3678/S34678",
+}
+BIRTH_SURVIVAL = re.compile(r"B([0-8]*)/S([0-8]*)", re.IGNORECASE)
+SURVIVAL_BIRTH = re.compile(r"S?([0-8]*)/B?([0-8]*)", re.IGNORECASE) # Older "23/3" and "S23/B3" forms
+
+# Bits of a neighbor count in the bitboard formula, most significant first
+COUNT_BITS = ("eights", "fours", "twos", "ones")
+
+
+class Rule:
+    """
+    A compiled life-like rule.
+    table[alive * 9 + neighbors] is 1 if a cell with that state and number of alive
+    neighbors is alive next generation. neighborhood_table does the same for a whole 3x3
+    block packed into 9 bits (bit 4 is the cell itself), and next_bits() applies the rule
+    to bitboards of neighbor-count bits.
+    """
+
+    def __init__(self, birth, survival):
+        """
+        Compile a rule.
+
+        Parameters:
+            birth (iterable): Neighbor counts (0-8) that bring a dead cell to life.
+            survival (iterable): Neighbor counts (0-8) that keep an alive cell alive.
+        """
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
+        if 0 in self.birth:
+            raise ValueError("Rules where blobs are born with no neighbors (B0) are not supported")
+        self.table = bytes(int(n in self.birth) for n in range(9)) + bytes(int(n in self.survival) for n in range(9))
+        self.neighborhood_table = bytes(
+            self.table[(block >> 4 & 1) * 9 + (block & 0b111101111).bit_count()] for block in range(512)
+        )
+        self.formula = bitboard_formula(self.table)
+        self.next_bits = eval(f"lambda alive, ones, twos, fours, eights, full: {self.formula}")
+
+    @property
+    def rulestring(self):
+        """str: The rule written as B.../S..., e.g. "B3/S23"."""
+        return "B" + "".join(map(str, sorted(self.birth))) + "/S" + "".join(map(str, sorted(self.survival)))
+
+    @property
+    def name(self):
+        """str: The rule's well-known name, or its rulestring if it has none."""
+        for name, rulestring in PRESETS.items():
+            if rulestring == self.rulestring:
+                return name
+        return self.rulestring
+
+    def __eq__(self, other):
+        return isinstance(other, Rule) and (self.birth, self.survival) == (other.birth, other.survival)
+
+    def __hash__(self):
+        return hash((self.birth, self.survival))
+
+    def __repr__(self):
+        return f"Rule({self.rulestring!r})"
+
+
+def parse_rule(text):
+    """
+    Reads a rule from a rulestring or a preset name.
+
+    Parameters:
+        text (str): e.g. "B36/S23", "23/36" (survival/birth), or "HighLife".
+
+    Returns:
+        Rule: The compiled rule.
+    """
+    cleaned = text.strip()
+    for name, rulestring in PRESETS.items():
+        if cleaned.lower() == name.lower():
+            cleaned = rulestring
+    match = BIRTH_SURVIVAL.fullmatch(cleaned)
+    if match:
+        birth, survival = match.groups()
+    else:
+        match = SURVIVAL_BIRTH.fullmatch(cleaned)
+        if not match:
+            raise ValueError(f"{text!r} is not a rule; use B/S notation like B3/S23 or one of {', '.join(PRESETS)}")
+        survival, birth = match.groups()
+    return Rule(map(int, birth), map(int, survival))
+
+
+def bitboard_formula(table):
+    """
+    Turns a rule table into the smallest AND/OR formula over bitboards that this simple
+    method finds (Quine-McCluskey with a greedy cover). The inputs are the cell's own
+    bitboard and the four bits of its neighbor count; counts 9-15 cannot happen, so they are
+    free to make the formula shorter. For B3/S23 the result is the familiar
+    "twos and not fours, and ones or alive".
+
+    Parameters:
+        table (bytes): The rule's 18-entry table.
+
+    Returns:
+        str: A Python expression using alive, ones, twos, fours, eights and full.
+    """
+    # Inputs are 5-bit numbers: alive, then the count's eights, fours, twos and ones bits
+    wanted = {alive << 4 | count for alive in (0, 1) for count in range(9) if table[alive * 9 + count]}
+    free = {alive << 4 | count for alive in (0, 1) for count in range(9, 16)}
+    if not wanted:
+        return "0"
+
+    # Merge terms that differ in one bit until nothing merges; what is left are the prime implicants.
+    # A term is (value, mask): mask bits are the inputs the term does not care about.
+    terms = {(value, 0) for value in wanted | free}
+    primes = set()
+    while terms:
+        merged = set()
+        used = set()
+        for value, mask in terms:
+            for bit in range(5):
+                other = (value ^ (1 << bit), mask)
+                if not mask >> bit & 1 and other in terms:
+                    merged.add((value & ~(1 << bit), mask | 1 << bit))
+                    used.update(((value, mask), other))
+        primes |= terms - used
+        terms = merged
+
+    def covers(term, value):
+        return value & ~term[1] == term[0]
+
+    # Pick primes until every wanted input is covered, taking the one covering the most each time
+    chosen = []
+    uncovered = set(wanted)
+    while uncovered:
+        best = max(sorted(primes), key=lambda term: (sum(covers(term, v) for v in uncovered), term[1].bit_count()))
+        chosen.append(best)
+        uncovered = {v for v in uncovered if not covers(best, v)}
+
+    names = ("alive",) + COUNT_BITS
+    clauses = []
+    for value, mask in chosen:
+        clauses.append([name if value >> (4 - position) & 1 else f"~{name}"
+                        for position, name in enumerate(names) if not mask >> (4 - position) & 1])
+
+    # Pull out the inputs every term shares, e.g. (a & b) | (a & c) -> a & (b | c)
+    common = [literal for literal in clauses[0] if all(literal in clause for clause in clauses)] if len(clauses) > 1 else []
+    rest = [[literal for literal in clause if literal not in common] for clause in clauses]
+    if any(not clause for clause in rest):
+        rest = [] # One term is only the shared inputs, so the OR of the rest is always true
+    parts = list(common)
+    if len(rest) == 1:
+        parts += rest[0]
+    elif rest:
+        parts.append("(" + " | ".join(" & ".join(clause) if len(clause) == 1 else f"({' & '.join(clause)})" for clause in rest) + ")")
+    formula = " & ".join(parts) or "full"
+
+    # Terms made only of negations come out negative, so those are cut back to the board
+    bounded = any(not literal.startswith("~") for literal in common) or all(
+        any(not literal.startswith("~") for literal in clause) for clause in clauses)
+    return formula if bounded else f"({formula}) & full"
+
+
+CONWAY = parse_rule("B3/S23")
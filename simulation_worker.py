@@ -0,0 +1,162 @@
+# simulation_worker.py
+# Description: Runs Blob Life generations on a background thread so the simulation is no
+# longer tied to the frame rate. The worker steps at a target rate or as fast as the engine
+# allows (turbo), and the game draws whatever generation is newest when a frame comes round.
+
+# === IMPORTS ===
+import threading
+import time
+
+# === SETTINGS ===
+TURBO_SLICE = 0.008 # Longest a turbo burst runs before the worker rests (seconds)
+TURBO_REST = 0.001  # Pause between turbo bursts so the game thread is sure to get the lock (seconds)
+MAX_WAIT = 0.05     # Longest the worker sleeps at once, so rate changes and pauses apply quickly
+
+
+class SimulationWorker:
+    """
+    Runs generations on a background thread, either a set number of times per second or
+    back to back in turbo mode.
+    Each generation is split in three so the board is only locked briefly: begin() takes a
+    snapshot of the board and finish() installs the new generation, both while holding
+    `lock`, and compute() steps the snapshot in between without it. The game holds the same
+    lock while it handles input and draws, so every frame shows one complete generation and
+    never waits for one to be computed. A thread is used rather than a process because the
+    board lives in module globals, and NumPy releases the GIL while it steps big boards.
+    """
+
+    def __init__(self, begin, compute, finish, should_stop=None):
+        """
+        Create a paused worker. Its thread starts the first time it is resumed.
+
+        Parameters:
+            begin (function): Returns a snapshot of the board to step.
+            compute (function): Takes the snapshot and returns the next generation, without
+                                touching the board.
+            finish (function): Takes the snapshot and the next generation and installs it,
+                               returning the number of births, or None if the board was
+                               changed in the meantime and the generation was thrown away.
+            should_stop (function): Checked after every step; returning True pauses the worker
+                                    (e.g. when every blob is gone).
+        """
+        self.begin = begin
+        self.compute = compute
+        self.finish = finish
+        self.should_stop = should_stop
+        self.lock = threading.RLock() # Guards the board; hold it to read or change the board safely
+        self.rate = None              # Generations per second, or None for turbo
+        self._running = threading.Event()
+        self._closed = False
+        self._thread = None
+        self._next_time = 0.0
+        self._generations = 0         # Generations, births and compute() seconds since the last take_results()
+        self._births = 0
+        self._step_time = 0.0
+        self._finished = False        # True once should_stop() paused the worker
+
+    def resume(self, rate=None):
+        """
+        Starts stepping, or changes the rate if already running.
+
+        Parameters:
+            rate (float): Generations per second, or None to step as fast as possible (turbo).
+        """
+        with self.lock:
+            if not self._running.is_set():
+                self._next_time = time.perf_counter()
+            self.rate = rate
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+                self._thread.start()
+            self._running.set()
+
+    def pause(self):
+        """
+        Stops stepping. Once this returns no more generations are installed until resume();
+        one being computed is thrown away.
+        """
+        with self.lock:
+            self._running.clear()
+
+    @property
+    def running(self):
+        """bool: True while the worker is stepping."""
+        return self._running.is_set()
+
+    def take_results(self):
+        """
+        Returns what the worker did since the last call and resets it.
+
+        Returns:
+            tuple: (generations stepped, blobs born, whether should_stop() paused the worker,
+                   seconds spent in compute()) since the previous call.
+        """
+        with self.lock:
+            results = (self._generations, self._births, self._finished, self._step_time)
+            self._generations = self._births = 0
+            self._step_time = 0.0
+            self._finished = False
+        return results
+
+    def close(self):
+        """Stops the thread for good."""
+        self._closed = True
+        self._running.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _active(self):
+        """bool: True unless the worker was paused or closed. Check while holding lock."""
+        return self._running.is_set() and not self._closed
+
+    def _advance(self):
+        """
+        Steps one generation, holding lock only to begin and finish it.
+
+        Returns:
+            bool: False if the worker was paused, or should_stop() paused it.
+        """
+        with self.lock:
+            if not self._active():
+                return False
+            snapshot = self.begin()
+        started = time.perf_counter()
+        result = self.compute(snapshot)
+        step_time = time.perf_counter() - started
+        with self.lock:
+            self._step_time += step_time
+            # The game may have paused (or closed) the worker while the generation was computed
+            if not self._active():
+                return False
+            births = self.finish(snapshot, result)
+            if births is None:
+                return True # The board was edited meanwhile, so step the edited board next
+            self._births += births
+            self._generations += 1
+            if self.should_stop is not None and self.should_stop():
+                self._finished = True
+                self._running.clear()
+                return False
+        return True
+
+    def _run(self):
+        """Thread body: waits while paused, then steps at the set rate or in turbo bursts."""
+        while True:
+            self._running.wait()
+            if self._closed:
+                return
+
+            rate = self.rate
+            if rate:
+                delay = self._next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(min(delay, MAX_WAIT))
+                    continue
+                self._advance()
+                # Catch up on at most one late generation instead of bursting after a stall
+                self._next_time = max(self._next_time + 1 / rate, time.perf_counter() - 1 / rate)
+            else:
+                deadline = time.perf_counter() + TURBO_SLICE
+                while self._advance() and time.perf_counter() < deadline:
+                    pass
+                time.sleep(TURBO_REST)
@@ -0,0 +1,81 @@
+# sound_scheduler.py
+# Description: Turns birth counts into a small, steady number of pop sounds. However many
+# blobs are born, only a few pops are played per generation and per second, so big boards
+# and turbo mode never spend their time in the sound mixer.
+
+# === IMPORTS ===
+import math
+import time
+
+
+class SoundScheduler:
+    """
+    Plays a sound for new blobs, coalescing many births into a few pops.
+    Pops are limited per generation and per second (a token bucket refilled over time), and
+    the volume can rise with the number of births so a big burst still sounds bigger.
+    """
+
+    def __init__(self, sound, max_per_generation=3, max_per_second=20, scale_volume=True,
+                 min_volume=0.3, loud_births=100, clock=time.monotonic):
+        """
+        Create a scheduler for a sound.
+
+        Parameters:
+            sound (pygame.mixer.Sound): The pop sound; anything with play() and set_volume() works.
+            max_per_generation (int): Most pops played for one generation.
+            max_per_second (float): Most pops played in any second.
+            scale_volume (bool): Whether louder pops are played for more births.
+            min_volume (float): Volume for a single birth when scale_volume is on (0 to 1).
+            loud_births (int): Births in one call that play at full volume.
+            clock (function): Returns the time in seconds (replaceable for tests and tools).
+        """
+        self.sound = sound
+        self.max_per_generation = max_per_generation
+        self.max_per_second = max_per_second
+        self.scale_volume = scale_volume
+        self.min_volume = min_volume
+        self.loud_births = loud_births
+        self.clock = clock
+        self.tokens = float(max_per_second)
+        self.last_time = clock()
+        self.played = 0  # Pops played so far
+        self.dropped = 0 # Births that did not get a pop of their own
+
+    def volume_for(self, births):
+        """
+        Parameters:
+            births (int): Births being announced at once.
+
+        Returns:
+            float: Volume from min_volume (one birth) up to 1 (loud_births or more), on a log scale.
+        """
+        loudness = min(1.0, math.log2(1 + births) / math.log2(1 + self.loud_births))
+        return self.min_volume + (1 - self.min_volume) * loudness
+
+    def add_births(self, births, generations=1):
+        """
+        Plays pops for the blobs born over some generations, within the limits.
+
+        Parameters:
+            births (int): Blobs born.
+            generations (int): How many generations those births came from (default is 1).
+
+        Returns:
+            int: Number of pops played.
+        """
+        now = self.clock()
+        self.tokens = min(self.max_per_second, self.tokens + (now - self.last_time) * self.max_per_second)
+        self.last_time = now
+        if births <= 0:
+            return 0
+
+        pops = min(births, self.max_per_generation * generations, int(self.tokens))
+        self.dropped += births - pops
+        if pops:
+            self.tokens -= pops
+            if self.scale_volume:
+                self.sound.set_volume(self.volume_for(births))
+            for _ in range(pops):
+                self.sound.play()
+            self.played += pops
+        return pops
@@ -0,0 +1,434 @@
+# soup_search.py
+# Description: Runs thousands of seeded random soups across a pool of worker processes and
+# records how each one ends: how long it lived, how many blobs were left and which objects
+# they formed. Every soup follows the same rules as the game (blob_life_core). Results are
+# appended to a CSV or JSONL file as soon as each soup finishes, so a search that is stopped
+# can be started again with the same command and only runs the soups that are missing.
+# Usage: python soup_search.py --soups 10000 --output soups.jsonl [--workers 8]
+
+# === IMPORTS ===
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+import blob_life_core as core
+from bitboard_engine import BitboardEngine # Steps the known objects to find all their phases
+
+# === KNOWN OBJECTS ===
+# Common Conway still lifes and oscillators, drawn as plaintext rows (O alive, . dead).
+# Only one phase is listed; object_names() steps each one to find the rest under the search's rule.
+KNOWN_OBJECTS = [
+    ("block", ["OO", "OO"]),
+    ("beehive", [".OO.", "O..O", ".OO."]),
+    ("loaf", [".OO.", "O..O", ".O.O", "..O."]),
+    ("boat", ["OO.", "O.O", ".O."]),
+    ("ship", ["OO.", "O.O", ".OO"]),
+    ("tub", [".O.", "O.O", ".O."]),
+    ("pond", [".OO.", "O..O", "O..O", ".OO."]),
+    ("long boat", ["OO..", "O.O.", ".O.O", "..O."]),
+    ("barge", [".O..", "O.O.", ".O.O", "..O."]),
+    ("mango", [".OO..", "O..O.", ".O..O", "..OO."]),
+    ("aircraft carrier", ["OO..", "O..O", "..OO"]),
+    ("snake", ["OO.O", "O.OO"]),
+    ("eater", ["OO..", "O.O.", "..O.", "..OO"]),
+    ("blinker", ["OOO"]),
+    ("toad", [".OOO", "OOO."]),
+    ("beacon", ["OO..", "OO..", "..OO", "..OO"]),
+    ("traffic light", ["..OOO..", ".......", "O.....O", "O.....O", "O.....O", ".......", "..OOO.."]),
+    ("pulsar", ["..OOO...OOO..", ".............", "O....O.O....O", "O....O.O....O", "O....O.O....O",
+                "..OOO...OOO..", ".............", "..OOO...OOO..", "O....O.O....O", "O....O.O....O",
+                "O....O.O....O", ".............", "..OOO...OOO.."]),
+]
+MAX_OBJECT_PERIOD = 4 # Phases stepped through when looking for a known object's other phases
+
+# === SEARCH SETTINGS ===
+# Written with every result, so a resumed search can check it is continuing the same search
+SETTING_FIELDS = ["width", "height", "density", "rule", "max_generations"]
+FIELDS = ["seed"] + SETTING_FIELDS + ["outcome", "lifespan", "period", "initial_population",
+                                      "final_population", "objects", "census"]
+
+# === WORKER STATE ===
+# Set up once in each worker process by set_up_worker()
+worker_settings = {} # The search settings written with every result
+worker_names = {}    # Canonical shape -> name of the known objects under the search's rule
+
+
+def canonical(cells):
+    """
+    Parameters:
+        cells (iterable): (row, col) of the cells of one object.
+
+    Returns:
+        tuple: The object's cells moved to the origin and sorted, picking whichever of its
+        eight rotations and reflections sorts first, so every orientation gives the same tuple.
+    """
+    cells = list(cells)
+    forms = []
+    for flip_r, flip_c, swap in ((1, 1, False), (1, -1, False), (-1, 1, False), (-1, -1, False),
+                                 (1, 1, True), (1, -1, True), (-1, 1, True), (-1, -1, True)):
+        moved = [(flip_r * c, flip_c * r) if swap else (flip_r * r, flip_c * c) for r, c in cells]
+        top = min(r for r, _ in moved)
+        left = min(c for _, c in moved)
+        forms.append(tuple(sorted((r - top, c - left) for r, c in moved)))
+    return min(forms)
+
+
+def object_code(shape):
+    """
+    Parameters:
+        shape (tuple): Canonical cells from canonical().
+
+    Returns:
+        str: The shape as plaintext rows joined by "/", e.g. "OO/OO" for a block.
+    """
+    height = max(r for r, _ in shape) + 1
+    width = max(c for _, c in shape) + 1
+    rows = [["."] * width for _ in range(height)]
+    for r, c in shape:
+        rows[r][c] = "O"
+    return "/".join("".join(row) for row in rows)
+
+
+def object_names(rule):
+    """
+    Finds every phase of the known objects under a rule. Each object is stepped on a
+    small board with room to grow until it comes back to its first shape; objects that
+    do not (they die, grow or move under this rule) are left out, so an object is only
+    named if it really is that object under the rule being searched.
+
+    Parameters:
+        rule (rules.Rule): The rule soups follow.
+
+    Returns:
+        dict: Canonical shape -> name of every phase of every known object.
+    """
+    names = {}
+    for name, rows in KNOWN_OBJECTS:
+        width, height = len(rows[0]) + 4, len(rows) + 4
+        engine = BitboardEngine(width, height, rule)
+        plane = bytearray(width * height)
+        for r, row in enumerate(rows):
+            for c, cell in enumerate(row):
+                plane[(r + 2) * width + c + 2] = cell == "O"
+        engine.load_plane(plane)
+        first = canonical(divmod(i, width) for i in core.live_indices(plane))
+        phases = [first]
+        for _ in range(MAX_OBJECT_PERIOD):
+            engine.step()
+            cells = [divmod(i, width) for i in core.live_indices(engine.to_plane())]
+            if not cells:
+                break
+            shape = canonical(cells)
+            if shape == first:
+                names.update(dict.fromkeys(phases, name))
+                break
+            phases.append(shape)
+    return names
+
+
+def census(plane, footprint, width, names):
+    """
+    Splits a settled board into objects and counts each kind.
+    Objects are groups of cells touching (diagonals included) in the footprint, which is
+    every cell alive at any point of the final loop. Using it instead of one generation
+    keeps oscillators like the beacon whole in every phase.
+
+    Parameters:
+        plane (bytes-like): The final alive plane.
+        footprint (bytes-like): Alive plane of every cell alive during the final loop.
+        width (int): Number of columns on the board.
+        names (dict): Canonical shape -> name of the known objects, from object_names().
+
+    Returns:
+        Counter: Object name -> how many there are. Unknown objects are named by their
+        plaintext shape, e.g. "other OOO./O..O".
+    """
+    counts = Counter()
+    size = len(footprint)
+    unvisited = set(core.live_indices(footprint))
+    while unvisited:
+        stack = [unvisited.pop()]
+        cells = []
+        while stack:
+            i = stack.pop()
+            r, c = divmod(i, width)
+            if plane[i]:
+                cells.append((r, c))
+            for dr in (-width, 0, width):
+                for dc in (-1, 0, 1):
+                    j = i + dr + dc
+                    # Stay on the board and do not wrap from one row's end to the next row
+                    if 0 <= j < size and 0 <= c + dc < width and j in unvisited:
+                        unvisited.remove(j)
+                        stack.append(j)
+        if cells:
+            shape = canonical(cells)
+            counts[names.get(shape) or "other " + object_code(shape)] += 1
+    return counts
+
+
+def set_up_worker(width, height, density, rulestring, engine, max_generations):
+    """
+    Pool initializer: sets up the core grid once inside a worker process.
+
+    Parameters:
+        width (int): Number of columns on each soup's board.
+        height (int): Number of rows on each soup's board.
+        density (float): Chance that each cell of a soup starts alive.
+        rulestring (str): The rule soups follow, e.g. "B3/S23".
+        engine (str): Core engine used to step the soups.
+        max_generations (int): Generations after which an unsettled soup is given up on.
+    """
+    core.set_grid_size(width, height)
+    core.set_rule(rulestring)
+    core.set_engine(engine)
+    core.detect_cycles = True
+    worker_settings.update(width=width, height=height, density=density, rule=core.rule.rulestring,
+                           max_generations=max_generations)
+    worker_names.update(object_names(core.rule))
+
+
+def run_soup(seed):
+    """
+    Runs one soup until every blob is gone, the board repeats, or max_generations is reached.
+
+    Parameters:
+        seed (int): Seed of the soup.
+
+    Returns:
+        dict: One result row (see FIELDS). outcome is "extinct", "cycle" or "unsettled";
+        lifespan is the generation the blobs died out or the final loop started.
+    """
+    settings = worker_settings
+    core.randomize_grid(settings["density"], seed)
+    initial_population = core.live_count
+    outcome = "unsettled"
+    while core.generation < settings["max_generations"]:
+        core.next_generation()
+        if core.all_blobs_dead():
+            outcome = "extinct"
+            break
+        if core.cycle_detector.period is not None:
+            outcome = "cycle"
+            break
+
+    period = core.cycle_detector.period if outcome == "cycle" else None
+    if outcome == "extinct":
+        lifespan = core.generation
+    elif outcome == "cycle":
+        lifespan = core.cycle_detector.start
+    else:
+        lifespan = None
+    objects = Counter()
+    if outcome == "cycle":
+        # Step once around the loop to see every cell the objects use
+        plane = bytes(core.alive)
+        footprint = int.from_bytes(plane, "big")
+        for _ in range(period):
+            core.next_generation()
+            footprint |= int.from_bytes(core.alive, "big")
+        objects = census(plane, footprint.to_bytes(len(plane), "big"), settings["width"], worker_names)
+    return dict(seed=seed, **settings, outcome=outcome, lifespan=lifespan, period=period,
+                initial_population=initial_population,
+                final_population=core.population(),
+                objects=sum(objects.values()), census=dict(objects.most_common()))
+
+
+# === RESULTS FILE ===
+
+def is_csv(path):
+    """
+    Parameters:
+        path (str): Path of the results file.
+
+    Returns:
+        bool: True for a .csv file; anything else is written as JSON lines.
+    """
+    return path.lower().endswith(".csv")
+
+
+def read_results(path):
+    """
+    Reads the results already saved by an earlier run of the search.
+    A line cut short because that run was stopped mid-write is removed from the file.
+
+    Parameters:
+        path (str): Path of the results file.
+
+    Returns:
+        list: One dict per saved soup, with numbers and the census decoded.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb+") as file:
+        data = file.read()
+        if data and not data.endswith(b"\n"):
+            file.truncate(data.rfind(b"\n") + 1)
+            data = data[:data.rfind(b"\n") + 1]
+    text = data.decode()
+    if not is_csv(path):
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    rows = []
+    for row in csv.DictReader(text.splitlines()):
+        for field in ("seed", "width", "height", "max_generations", "initial_population", "final_population", "objects"):
+            row[field] = int(row[field])
+        for field in ("lifespan", "period"):
+            row[field] = int(row[field]) if row[field] else None
+        row["density"] = float(row["density"])
+        row["census"] = json.loads(row["census"])
+        rows.append(row)
+    return rows
+
+
+class ResultWriter:
+    """Appends result rows to a CSV or JSONL file, flushing each one so none are lost if the search stops."""
+
+    def __init__(self, path):
+        """
+        Open a results file for appending, writing the CSV header if the file is new.
+
+        Parameters:
+            path (str): Path of the results file.
+        """
+        self.csv = is_csv(path)
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a", newline="" if self.csv else None)
+        if self.csv:
+            self.writer = csv.DictWriter(self.file, FIELDS)
+            if new:
+                self.writer.writeheader()
+
+    def write(self, result):
+        """
+        Saves one soup's result.
+
+        Parameters:
+            result (dict): A row from run_soup().
+        """
+        if self.csv:
+            self.writer.writerow({**result, "census": json.dumps(result["census"])})
+        else:
+            self.file.write(json.dumps(result) + "\n")
+        self.file.flush()
+
+    def close(self):
+        """Closes the file."""
+        self.file.close()
+
+
+# === SUMMARY ===
+
+def print_summary(results):
+    """
+    Prints how the soups ended and the most common objects across all of them.
+
+    Parameters:
+        results (list): Every result row of the search.
+    """
+    if not results:
+        return
+    outcomes = Counter(result["outcome"] for result in results)
+    lifespans = [result["lifespan"] for result in results if result["lifespan"] is not None]
+    objects = Counter()
+    for result in results:
+        objects.update(result["census"])
+    print(f"Soups: {len(results)} ({', '.join(f'{count} {outcome}' for outcome, count in outcomes.most_common())})")
+    if lifespans:
+        print(f"Lifespan: mean {sum(lifespans) / len(lifespans):.1f}, longest {max(lifespans)} generations")
+    print(f"Objects: {sum(objects.values())} in total")
+    for name, count in objects.most_common(15):
+        print(f"  {count:>9}  {name}")
+
+
+# === COMMAND LINE ===
+
+def parse_args(argv=None):
+    """
+    Reads the command line options.
+
+    Parameters:
+        argv (list): Arguments to parse (default is sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Run many random Blob Life soups and record how they end.")
+    parser.add_argument("--soups", type=int, default=1000, help="number of soups in the search")
+    parser.add_argument("--first-seed", type=int, default=0, help="seed of the first soup; the others follow in order")
+    parser.add_argument("--width", type=int, default=64, help="number of columns on each soup's board")
+    parser.add_argument("--height", type=int, default=64, help="number of rows on each soup's board")
+    parser.add_argument("--density", type=float, default=0.5, help="chance that each cell starts alive")
+    parser.add_argument("--rule", default="B3/S23", help="life-like rule as B/S notation (e.g. B36/S23) or a name like HighLife")
+    parser.add_argument("--engine", choices=[name for name in core.engines if name != "parallel"], default=core.engine,
+                        help="engine used to step each soup (the soups themselves are spread over the workers)")
+    parser.add_argument("--max-generations", type=int, default=10000, help="generations after which a soup is given up on")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default is one per core)")
+    parser.add_argument("--output", default="soup_results.jsonl", help="results file, .csv or .jsonl; rerunning resumes it")
+    args = parser.parse_args(argv)
+    try:
+        args.rule = core.rules.parse_rule(args.rule).rulestring
+    except ValueError as error:
+        parser.error(str(error))
+    return args
+
+
+def main(argv=None):
+    """
+    Runs every soup of the search that is not in the results file yet.
+
+    Parameters:
+        argv (list): Arguments to parse (default is sys.argv).
+
+    Returns:
+        int: Exit status, 1 if the results file holds a different search.
+    """
+    args = parse_args(argv)
+    settings = dict(width=args.width, height=args.height, density=args.density, rule=args.rule,
+                    max_generations=args.max_generations)
+    results = read_results(args.output)
+    for result in results:
+        if {field: result[field] for field in SETTING_FIELDS} != settings:
+            print(f"{args.output} holds soups from a search with other settings; choose another --output")
+            return 1
+    done = {result["seed"] for result in results}
+    seeds = [seed for seed in range(args.first_seed, args.first_seed + args.soups) if seed not in done]
+    if done:
+        print(f"Resuming: {len(done)} soups already in {args.output}, {len(seeds)} to go")
+
+    initargs = (args.width, args.height, args.density, args.rule, args.engine, args.max_generations)
+    writer = ResultWriter(args.output)
+    pool = None
+    start = time.perf_counter()
+    last_report = start
+    try:
+        if args.workers > 1:
+            pool = Pool(args.workers, initializer=set_up_worker, initargs=initargs)
+            # Small chunks keep results streaming in and the workers evenly loaded
+            chunksize = max(1, min(64, len(seeds) // (args.workers * 16)))
+            finished = pool.imap_unordered(run_soup, seeds, chunksize)
+        else:
+            set_up_worker(*initargs)
+            finished = map(run_soup, seeds)
+        for count, result in enumerate(finished, 1):
+            writer.write(result)
+            results.append(result)
+            now = time.perf_counter()
+            if now - last_report >= 2 or count == len(seeds):
+                print(f"{count}/{len(seeds)} soups, {count / (now - start):.1f} soups/sec")
+                last_report = now
+    except KeyboardInterrupt:
+        print("Stopped; run the same command again to carry on")
+    finally:
+        if pool is not None:
+            pool.terminate()
+        writer.close()
+    print_summary(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
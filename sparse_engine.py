@@ -0,0 +1,133 @@
+# sparse_engine.py
+# Description: Sparse backend for Blob Life. Stores only the live cells in a set and
+# looks only at live cells and their neighbors, so the cost of a generation grows with
+# the population instead of the board area. The plane can be unbounded.
+
+# === IMPORTS ===
+from collections import Counter
+from rules import CONWAY # The default rule, B3/S23
+
+# === CELL KEYS ===
+# Each (row, col) is packed into one int so neighbors are found with a single addition.
+# Columns must stay within +/- 2 billion; rows can be any size.
+STRIDE = 1 << 32
+HALF_STRIDE = STRIDE // 2
+NEIGHBOR_OFFSETS = (
+    -STRIDE - 1, -STRIDE, -STRIDE + 1,
+    -1, 1,
+    STRIDE - 1, STRIDE, STRIDE + 1,
+)
+
+
+def cell_key(row, col):
+    """
+    Pack a (row, col) position into a single int key.
+
+    Parameters:
+        row (int): Row index (may be negative).
+        col (int): Column index (may be negative).
+
+    Returns:
+        int: The key for that cell.
+    """
+    return row * STRIDE + col
+
+
+def key_cell(key):
+    """
+    Unpack a key made by cell_key() back into a (row, col) position.
+
+    Parameters:
+        key (int): The cell key.
+
+    Returns:
+        tuple: The (row, col) of the cell.
+    """
+    row = (key + HALF_STRIDE) // STRIDE
+    return row, key - row * STRIDE
+
+
+class SparseEngine:
+    """
+    Steps a Blob Life board stored as a set of live cell keys.
+    With bounds, cells outside the board always count as dead, the same as count_neighbors().
+    Without bounds, patterns can travel forever without the board ever being reallocated.
+    """
+
+    def __init__(self, bounds=None, rule=CONWAY):
+        """
+        Create an empty board.
+
+        Parameters:
+            bounds (tuple): Optional (width, height) of the board. None means an unbounded plane.
+            rule (rules.Rule): The rule cells follow (default is Conway's B3/S23).
+        """
+        self.bounds = bounds
+        self.rule = rule
+        self.generation = 0
+        self.live = set()
+
+    def load(self, cells):
+        """
+        Replace the board with the given live cells.
+
+        Parameters:
+            cells: An iterable of (row, col) positions that are alive.
+        """
+        self.live = {cell_key(r, c) for r, c in cells}
+
+    def clear(self):
+        """Kill every cell and reset the generation count."""
+        self.live = set()
+        self.generation = 0
+
+    def live_cells(self):
+        """
+        Returns:
+            list: The (row, col) position of every live cell.
+        """
+        return [key_cell(key) for key in self.live]
+
+    def step(self, generations=1):
+        """
+        Advance the board by the given number of generations using the engine's rule.
+
+        Parameters:
+            generations (int): How many generations to advance (default is 1).
+        """
+        # Counts that make a cell alive whatever its state, only if it is alive, and only if it is dead
+        table = self.rule.table
+        either = bytes(born & survives for born, survives in zip(table[:9], table[9:]))
+        survives_only = bytes(survives & ~born for born, survives in zip(table[:9], table[9:]))
+        born_only = bytes(born & ~survives for born, survives in zip(table[:9], table[9:]))
+        for _ in range(generations):
+            live = self.live
+            # Every live cell adds one to each of its 8 neighbors
+            counts = Counter(key + offset for key in live for offset in NEIGHBOR_OFFSETS)
+            self.live = {key for key, n in counts.items()
+                         if either[n] or (survives_only[n] and key in live) or (born_only[n] and key not in live)}
+            if table[9]:
+                # Cells with no neighbors never got a count, but this rule keeps them alive
+                self.live.update(key for key in live if key not in counts)
+            if self.bounds is not None:
+                self.live = {key for key in self.live if self._in_bounds(key)}
+            self.generation += 1
+
+    def _in_bounds(self, key):
+        """
+        Checks whether a cell key lies on the bounded board.
+
+        Parameters:
+            key (int): The cell key.
+
+        Returns:
+            bool: True if the cell is inside the board.
+        """
+        width, height = self.bounds
+        row, col = key_cell(key)
+        return 0 <= row < height and 0 <= col < width
+
+    @property
+    def population(self):
+        """int: Number of live cells."""
+        return len(self.live)
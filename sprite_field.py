@@ -0,0 +1,141 @@
+# sprite_field.py
+# Description: The blobs that drift across the menu screens. Every blob's position, speed
+# and image live in arrays that are moved in one step per frame, drawn with one blits()
+# call per image, and erased by restoring only the background they covered.
+
+# === IMPORTS ===
+import random
+from array import array
+from itertools import repeat
+import pygame
+try:
+    import numpy as np # Moves every blob in a few whole-array operations
+except ImportError:
+    np = None # NumPy is not installed, so blobs are moved in a plain loop instead
+
+
+class SpriteField:
+    """
+    Blobs moving sideways across the screen, each with its own speed, direction and image.
+    Blobs that reach the keep-out band in the middle of the screen (where the menu text
+    and buttons are) or leave the screen jump to a random spot to one side of it.
+    """
+
+    def __init__(self, count, width, height, variants, seed=None):
+        """
+        Create blobs scattered over the screen. Any that start in the keep-out band move out
+        of it on the first update().
+
+        Parameters:
+            count (int): Number of blobs.
+            width (int): Width of the screen in pixels.
+            height (int): Height of the screen in pixels.
+            variants (int): Number of blob images to pick from.
+            seed (int): Seed for the blobs' random positions, or None for a different field every run.
+        """
+        self.width = width
+        self.height = height
+        self.random = random.Random(seed)
+        # Blobs are grouped by image, so each image's blobs are one slice of the arrays
+        images = [self.random.randrange(variants) for _ in range(count)]
+        self.slices = [] # (start, end) of each image's blobs
+        start = 0
+        for variant in range(variants):
+            end = start + images.count(variant)
+            self.slices.append((start, end))
+            start = end
+        x = [self.random.randint(0, width) for _ in range(count)]
+        y = [self.random.randint(0, height) for _ in range(count)]
+        velocity = [self.random.choice([1, 2]) * self.random.choice([-1, 1]) for _ in range(count)]
+        if np is not None:
+            self.x = np.array(x, dtype=np.int32)
+            self.y = np.array(y, dtype=np.int32)
+            self.velocity = np.array(velocity, dtype=np.int32)
+            self.generator = np.random.default_rng(self.random.getrandbits(64))
+        else:
+            self.x = array("i", x)
+            self.y = array("i", y)
+            self.velocity = array("i", velocity)
+        self.drawn = [] # Screen rectangles covered by the blobs drawn last frame
+        self.source_images = [] # Images last passed to draw()
+        self.images = []        # Run-length encoded copies of them, which blit several times faster
+
+    def __len__(self):
+        """int: Number of blobs."""
+        return len(self.x)
+
+    def update(self, keep_out):
+        """
+        Moves every blob along by its velocity, sending blobs that reached the keep-out band
+        or left the screen to a random spot on either side of the band.
+
+        Parameters:
+            keep_out (tuple): (left, right) x coordinates no blob may stand between.
+        """
+        left, right = keep_out
+        if np is not None:
+            self.x += self.velocity
+            x = self.x
+            moved = ((x >= left) & (x <= right)) | (x < 0) | (x > self.width)
+            count = int(np.count_nonzero(moved))
+            if count:
+                to_left = self.generator.random(count) < 0.5
+                self.x[moved] = np.where(to_left, self.generator.integers(0, left, count),
+                                         self.generator.integers(right + 1, self.width, count))
+                self.y[moved] = self.generator.integers(0, self.height + 1, count)
+            return
+        for i, velocity in enumerate(self.velocity):
+            x = self.x[i] + velocity
+            if left <= x <= right or x < 0 or x > self.width:
+                x = self.random.randrange(0, left) if self.random.random() < 0.5 else self.random.randrange(right + 1, self.width)
+                self.y[i] = self.random.randint(0, self.height)
+            self.x[i] = x
+
+    def positions(self):
+        """
+        Returns:
+            list: [x, y] of every blob, in the same order as the arrays.
+        """
+        if np is not None:
+            return np.column_stack((self.x, self.y)).tolist()
+        return [[x, y] for x, y in zip(self.x, self.y)]
+
+    def draw(self, surface, background, images, full=False):
+        """
+        Erases the blobs drawn last frame and draws them where they are now.
+        When the blobs cover more of the screen than it would cost to redraw it all, the
+        whole background is drawn instead of patching it blob by blob.
+
+        Parameters:
+            surface (pygame.Surface): Where to draw the blobs.
+            background (pygame.Surface): What the surface looks like without any blobs.
+            images (list): One image per blob variant.
+            full (bool): True if the background must be drawn everywhere, e.g. for a new screen.
+
+        Returns:
+            list: Rectangles of the surface that changed.
+        """
+        if images != self.source_images:
+            self.source_images = list(images)
+            self.images = []
+            for image in images:
+                image = image.copy()
+                image.set_alpha(255, pygame.RLEACCEL) # Skips the transparent pixels instead of blending them
+                self.images.append(image)
+        positions = self.positions()
+        rects = []
+        covered = 0 # Pixels erased and drawn this frame
+        for (start, end), image in zip(self.slices, self.images):
+            width, height = image.get_size()
+            rects += [(x, y, width, height) for x, y in positions[start:end]]
+            covered += 2 * width * height * (end - start)
+        full = full or covered > surface.get_width() * surface.get_height()
+        if full:
+            surface.blit(background, (0, 0))
+        else:
+            surface.blits(zip(repeat(background), self.drawn, self.drawn), doreturn=False)
+        for (start, end), image in zip(self.slices, self.images):
+            surface.blits(zip(repeat(image), positions[start:end]), doreturn=False)
+        dirty = [surface.get_rect()] if full else self.drawn + rects
+        self.drawn = rects
+        return dirty
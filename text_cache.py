@@ -0,0 +1,62 @@
+# text_cache.py
+# Description: Keeps rendered text surfaces so strings that never change are only
+# rendered once instead of on every frame.
+
+# === IMPORTS ===
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    A bounded cache of rendered text surfaces.
+    Entries are keyed by (text, font, color, antialias); once the cache is full the
+    least recently used surface is dropped.
+    """
+
+    def __init__(self, max_entries=256):
+        """
+        Create an empty cache.
+
+        Parameters:
+            max_entries (int): Most surfaces kept before the least recently used is dropped.
+        """
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font_obj, text, antialias, color):
+        """
+        Return the rendered surface for some text, rendering it only on a cache miss.
+        Takes the same arguments as font_obj.render().
+
+        Parameters:
+            font_obj (pygame.font.Font): The font to render with.
+            text (str): The text to render.
+            antialias (bool): Whether to smooth the text edges.
+            color (tuple): The RGB color of the text.
+
+        Returns:
+            pygame.Surface: The rendered text. Treat it as read-only since it is shared.
+        """
+        key = (text, font_obj, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font_obj.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+    def __len__(self):
+        """int: Number of cached surfaces."""
+        return len(self._surfaces)